@@ -0,0 +1,226 @@
+import time
+from collections import Counter, deque
+from typing import Callable
+
+PLAN_BUDGET_MS = 1.0
+DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+Cell = tuple[int, int]
+
+
+class DistanceField:
+    """Breadth-first distances to one target, computed a slice at a time.
+
+    The field ignores the snake's body, so it stays valid for the whole
+    layout; ``advance`` resumes the search until a deadline so a new target
+    never costs more than the remaining tick budget.
+    """
+
+    def __init__(self, target: Cell, passable: Callable[[Cell], bool]):
+        self.target = target
+        self.passable = passable
+        self.dist: dict[Cell, int] = {target: 0}
+        self._frontier: deque[Cell] = deque([target])
+        self.complete = False
+
+    def advance(self, deadline: float):
+        frontier = self._frontier
+        dist = self.dist
+        passable = self.passable
+        expanded = 0
+        while frontier:
+            x, y = frontier.popleft()
+            step = dist[(x, y)] + 1
+            for dx, dy in DIRECTIONS:
+                cell = (x + dx, y + dy)
+                if cell not in dist and passable(cell):
+                    dist[cell] = step
+                    frontier.append(cell)
+            expanded += 1
+            if expanded % 32 == 0 and time.perf_counter() >= deadline:
+                return
+        self.complete = True
+
+    def estimate(self, cell: Cell) -> float:
+        """Exact distance when known, Manhattan while the search is still running."""
+        known = self.dist.get(cell)
+        if known is not None:
+            return known
+        if self.complete:
+            return float("inf")
+        return abs(cell[0] - self.target[0]) + abs(cell[1] - self.target[1])
+
+
+class BodyIndex:
+    """Cell occupancy of the snake, updated by head/tail deltas each tick."""
+
+    def __init__(self):
+        self._cells: deque[Cell] = deque()
+        self._counts: Counter = Counter()
+
+    def _rebuild(self, segments: list[Cell]):
+        self._cells = deque(segments)
+        self._counts = Counter(segments)
+
+    def sync(self, segments: list[Cell]):
+        cells = self._cells
+        if not cells or not segments:
+            self._rebuild(segments)
+            return
+        if segments[0] != cells[0]:
+            if len(segments) < 2 or segments[1] != cells[0]:
+                self._rebuild(segments)
+                return
+            cells.appendleft(segments[0])
+            self._counts[segments[0]] += 1
+        while len(cells) > len(segments):
+            tail = cells.pop()
+            self._counts[tail] -= 1
+            if not self._counts[tail]:
+                del self._counts[tail]
+        if len(cells) != len(segments) or cells[-1] != segments[-1]:
+            self._rebuild(segments)
+
+    def occupied(self, cell: Cell) -> int:
+        return self._counts.get(cell, 0)
+
+    @property
+    def tail(self) -> Cell | None:
+        return self._cells[-1] if self._cells else None
+
+
+class Autopilot:
+    """Pick one move per tick toward a goal cell within a time budget.
+
+    Goals come from the game (food, button, key). Distances come from cached
+    per-layout ``DistanceField``s; the body is tracked incrementally and only
+    checked for the few candidate moves, together with a bounded flood fill
+    that rejects moves into pockets smaller than the snake.
+    """
+
+    def __init__(self, budget_ms: float = PLAN_BUDGET_MS, max_fields: int = 8):
+        self.budget_s = budget_ms / 1000.0
+        self.max_fields = max_fields
+        self.body = BodyIndex()
+        self._fields: dict[Cell, DistanceField] = {}
+        self._layout_key = None
+        self._started = 0.0
+        self._deadline = 0.0
+        # Extra body length the game asks for before a gate attempt; grows
+        # after each attempt where the button was uncovered too early.
+        self.gate_slack = 4
+        self.last_goal: Cell | None = None
+        self.ticks = 0
+        self.over_budget = 0
+        self.max_ms = 0.0
+        self.total_ms = 0.0
+
+    def reset(self):
+        self.body = BodyIndex()
+        self._fields.clear()
+        self._layout_key = None
+        self.gate_slack = 4
+        self.last_goal = None
+
+    def field(self, target: Cell, passable: Callable[[Cell], bool], deadline: float) -> DistanceField:
+        field = self._fields.get(target)
+        if field is None:
+            if len(self._fields) >= self.max_fields:
+                self._fields.pop(next(iter(self._fields)))
+            field = DistanceField(target, passable)
+            self._fields[target] = field
+        if not field.complete:
+            field.advance(deadline)
+        return field
+
+    def distance(self, start: Cell, target: Cell, passable: Callable[[Cell], bool]) -> float:
+        """Cached layout distance (body ignored) using the remaining budget."""
+        return self.field(target, passable, self._deadline).estimate(start)
+
+    def begin(self, layout_key, passable: Callable[[Cell], bool], segments: list[Cell]):
+        """Start a tick: drop fields from an old layout and sync the body index."""
+        self._started = time.perf_counter()
+        self._deadline = self._started + self.budget_s * 0.6
+        if layout_key != self._layout_key:
+            self._fields.clear()
+            self._layout_key = layout_key
+            self.gate_slack = 4
+        self.body.sync(segments)
+
+    def choose(
+        self,
+        segments: list[Cell],
+        direction: Cell,
+        grow_pending: int,
+        goal: Cell | None,
+        passable: Callable[[Cell], bool],
+    ) -> Cell | None:
+        """Best legal direction for the next move; ``begin`` must be called first."""
+        head_x, head_y = segments[0]
+        tail_moves = grow_pending <= 0
+        tail = self.body.tail
+        self.last_goal = goal
+        field = self.field(goal, passable, self._deadline) if goal is not None else None
+
+        def free(cell: Cell) -> bool:
+            if not passable(cell):
+                return False
+            count = self.body.occupied(cell)
+            return count == 0 or (count == 1 and tail_moves and cell == tail)
+
+        ranked = []
+        for dx, dy in DIRECTIONS:
+            if (dx, dy) == (-direction[0], -direction[1]) and len(segments) > 1:
+                continue
+            cell = (head_x + dx, head_y + dy)
+            if not free(cell):
+                continue
+            score = field.estimate(cell) if field is not None else 0
+            ranked.append((score, (dx, dy) != direction, (dx, dy), cell))
+        ranked.sort()
+
+        choice = ranked[0][2] if ranked else None
+        need = min(len(segments) + 2, 64)
+        best_space = -1
+        hard_deadline = self._started + self.budget_s
+        for _, _, candidate, cell in ranked:
+            if best_space >= 0 and time.perf_counter() >= hard_deadline:
+                break
+            space = self._space(cell, free, need)
+            if space >= need:
+                choice = candidate
+                break
+            if space > best_space:
+                best_space = space
+                choice = candidate
+
+        elapsed = time.perf_counter() - self._started
+        self.ticks += 1
+        self.total_ms += elapsed * 1000.0
+        self.max_ms = max(self.max_ms, elapsed * 1000.0)
+        if elapsed > self.budget_s:
+            self.over_budget += 1
+        return choice
+
+    @staticmethod
+    def _space(start: Cell, free: Callable[[Cell], bool], limit: int) -> int:
+        """Free cells reachable from ``start``, counting at most ``limit``."""
+        seen = {start}
+        queue = deque([start])
+        while queue and len(seen) < limit:
+            x, y = queue.popleft()
+            for dx, dy in DIRECTIONS:
+                cell = (x + dx, y + dy)
+                if cell not in seen and free(cell):
+                    seen.add(cell)
+                    queue.append(cell)
+        return len(seen)
+
+    def report(self) -> str:
+        if not self.ticks:
+            return "autopilot: no ticks planned"
+        mean = self.total_ms / self.ticks
+        return (
+            f"autopilot: {self.ticks} ticks, mean={mean:.3f}ms max={self.max_ms:.3f}ms "
+            f"over {self.budget_s * 1000:.1f}ms budget={self.over_budget}"
+        )
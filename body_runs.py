@@ -0,0 +1,190 @@
+from bisect import bisect_left
+from collections.abc import Sequence
+from itertools import islice
+from operator import attrgetter
+
+Cell = tuple[int, int]
+
+_END = attrgetter("end")
+
+
+class Run:
+    """A straight piece of body: ``length`` cells from ``(x, y)`` back against ``(dx, dy)``.
+
+    ``end`` is the serial number of the head-most cell.
+    """
+
+    __slots__ = ("x", "y", "dx", "dy", "end", "length")
+
+    def __init__(self, x: int, y: int, dx: int, dy: int, end: int, length: int = 1):
+        self.x = x
+        self.y = y
+        self.dx = dx
+        self.dy = dy
+        self.end = end
+        self.length = length
+
+    def cell(self, step: int) -> Cell:
+        return self.x - step * self.dx, self.y - step * self.dy
+
+    def steps_within(self, x0: int, y0: int, x1: int, y1: int) -> range:
+        """Steps back from the head end whose cells lie in ``x0 <= x < x1``, ``y0 <= y < y1``."""
+        low, high = 0, self.length
+        for start, delta, lower, upper in ((self.x, self.dx, x0, x1), (self.y, self.dy, y0, y1)):
+            if delta == 0:
+                if not lower <= start < upper:
+                    return range(0)
+            elif delta > 0:
+                low = max(low, start - upper + 1)
+                high = min(high, start - lower + 1)
+            else:
+                low = max(low, lower - start)
+                high = min(high, upper - start)
+        return range(low, max(low, high))
+
+
+class RunBody(Sequence):
+    """Snake body stored as straight runs instead of one tuple per cell.
+
+    A move touches only the end runs: the head run grows (or a new one
+    starts at a turn) and the tail run shrinks. ``index`` and ``in`` test
+    each run as a line segment, so collision work scales with the number of
+    turns rather than the length. Cells carry serial numbers rising toward
+    the head, which lets ``body[i]`` bisect to its run.
+
+    Supports the list operations ``Snake`` and the game use: ``insert(0,
+    cell)``, ``pop()``, replacing ``body[0]``, indexing, slicing and
+    ``index``.
+    """
+
+    def __init__(self, cells=()):
+        # Tail run first, head run last.
+        self._runs: list[Run] = []
+        self._head_serial = 0
+        self._length = 0
+        for cell in reversed(list(cells)):
+            self.insert(0, cell)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"RunBody({self._length} cells in {len(self._runs)} runs)"
+
+    @property
+    def turns(self) -> int:
+        return len(self._runs)
+
+    def insert(self, index: int, cell: Cell):
+        if index != 0:
+            raise ValueError("RunBody only grows at the head")
+        x, y = cell
+        self._head_serial += 1
+        self._length += 1
+        runs = self._runs
+        if runs:
+            run = runs[-1]
+            dx, dy = x - run.x, y - run.y
+            # A lone cell takes any direction; a jump (wrap-around) starts a new run.
+            if abs(dx) + abs(dy) == 1 and (run.length == 1 or (dx == run.dx and dy == run.dy)):
+                run.x, run.y, run.dx, run.dy = x, y, dx, dy
+                run.end = self._head_serial
+                run.length += 1
+                return
+        runs.append(Run(x, y, 0, 0, self._head_serial))
+
+    def pop(self, index: int = -1) -> Cell:
+        if not self._length:
+            raise IndexError("pop from empty RunBody")
+        if index not in (-1, self._length - 1):
+            raise ValueError("RunBody only pops the tail")
+        run = self._runs[0]
+        run.length -= 1
+        self._length -= 1
+        if not run.length:
+            del self._runs[0]
+        return run.cell(run.length)
+
+    def __setitem__(self, index: int, cell: Cell):
+        if not self._length or index not in (0, -self._length):
+            raise ValueError("RunBody only replaces the head")
+        run = self._runs[-1]
+        run.length -= 1
+        if run.length:
+            run.x -= run.dx
+            run.y -= run.dy
+            run.end -= 1
+        else:
+            self._runs.pop()
+        self._head_serial -= 1
+        self._length -= 1
+        self.insert(0, cell)
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """``(run position, step)`` of the cell at ``index`` (0 is the head)."""
+        serial = self._head_serial - index
+        position = bisect_left(self._runs, serial, key=_END)
+        return position, self._runs[position].end - serial
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return list(islice(self._cells_from(start), max(0, stop - start)))
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("RunBody index out of range")
+        position, step = self._locate(index)
+        return self._runs[position].cell(step)
+
+    def _cells_from(self, index: int):
+        if index >= self._length:
+            return
+        position, step = self._locate(index)
+        runs = self._runs
+        for position in range(position, -1, -1):
+            run = runs[position]
+            x, y, dx, dy = run.x, run.y, run.dx, run.dy
+            for k in range(step, run.length):
+                yield x - k * dx, y - k * dy
+            step = 0
+
+    def __iter__(self):
+        return self._cells_from(0)
+
+    def index(self, cell: Cell, start: int = 0, stop: int | None = None) -> int:
+        length = self._length
+        start = max(0, start + length if start < 0 else start)
+        stop = length if stop is None else min(length, stop + length if stop < 0 else stop)
+        x, y = cell
+        for run in reversed(self._runs):
+            base = self._head_serial - run.end
+            if base >= stop:
+                break
+            if base + run.length <= start:
+                continue
+            for step in run.steps_within(x, y, x + 1, y + 1):
+                if start <= base + step < stop:
+                    return base + step
+        raise ValueError(f"{cell!r} is not in RunBody")
+
+    def __contains__(self, cell) -> bool:
+        try:
+            self.index(cell)
+        except (TypeError, ValueError):
+            return False
+        return True
+
+    def indices_within(self, x0: int, y0: int, x1: int, y1: int, run_ends: bool = False) -> list[int]:
+        """Ascending indices of the cells in the box; ``run_ends`` adds each run's tail-most cell."""
+        indices: list[int] = []
+        for run in reversed(self._runs):
+            base = self._head_serial - run.end
+            steps = run.steps_within(x0, y0, x1, y1)
+            indices.extend(range(base + steps.start, base + steps.stop))
+            last = base + run.length - 1
+            if run_ends and (not indices or indices[-1] != last):
+                indices.append(last)
+        return indices
@@ -0,0 +1,49 @@
+from config import TILE_SIZE, GRID_WIDTH, GRID_HEIGHT
+
+
+class Camera:
+    """Viewport onto a board larger than the window, in tile units.
+
+    ``x``/``y`` are the (fractional) tile coordinates of the top-left corner
+    of the view. The view is clamped to the board so the outer wall stays
+    on screen edges instead of scrolling into empty space.
+    """
+
+    def __init__(
+        self,
+        board_cols: int,
+        board_rows: int,
+        view_cols: int = GRID_WIDTH,
+        view_rows: int = GRID_HEIGHT,
+    ):
+        self.board_cols = board_cols
+        self.board_rows = board_rows
+        self.view_cols = view_cols
+        self.view_rows = view_rows
+        self.x = 0.0
+        self.y = 0.0
+
+    def center_on(self, target: tuple[float, float]):
+        """Center the view on a (fractional) tile position."""
+        tx, ty = target
+        max_x = max(0.0, float(self.board_cols - self.view_cols))
+        max_y = max(0.0, float(self.board_rows - self.view_rows))
+        self.x = max(0.0, min(max_x, tx + 0.5 - self.view_cols / 2))
+        self.y = max(0.0, min(max_y, ty + 0.5 - self.view_rows / 2))
+
+    def offset_px(self) -> tuple[int, int]:
+        """Pixel offset to add to ``tile * TILE_SIZE`` when drawing."""
+        return -int(round(self.x * TILE_SIZE)), -int(round(self.y * TILE_SIZE))
+
+    def visible_tiles(self, margin: int = 1) -> tuple[int, int, int, int]:
+        """Half-open tile bounds ``(x0, y0, x1, y1)`` covering the view."""
+        x0 = max(0, int(self.x) - margin)
+        y0 = max(0, int(self.y) - margin)
+        x1 = min(self.board_cols, int(self.x) + self.view_cols + 1 + margin)
+        y1 = min(self.board_rows, int(self.y) + self.view_rows + 1 + margin)
+        return x0, y0, x1, y1
+
+    @staticmethod
+    def contains(bounds: tuple[int, int, int, int], pos: tuple[float, float]) -> bool:
+        x0, y0, x1, y1 = bounds
+        return x0 <= pos[0] < x1 and y0 <= pos[1] < y1
@@ -1,5 +1,10 @@
+import json
+import os
+import threading
 import pygame
 from pathlib import Path
+from startup_timeline import TIMELINE
+from surface_ledger import SURFACE_LEDGER
 
 # Grid
 TILE_SIZE = 20
@@ -13,6 +18,11 @@ SCREEN_HEIGHT = PLAYFIELD_HEIGHT + HUD_HEIGHT
 
 FPS = 10
 
+# Big-board mode (main.py --board): board size in tiles and how far from the
+# head food and gates are placed, so they stay reachable on huge maps.
+BIG_BOARD_SIZE = (512, 512)
+BIG_BOARD_SPAWN_RADIUS = 20
+
 # Colors — synthwave palette
 COLOR_BG_TOP = (14, 8, 38)
 COLOR_BG_BOTTOM = (88, 15, 94)
@@ -24,7 +34,8 @@ COLOR_BUTTON = (80, 150, 255)
 COLOR_KEY = (255, 119, 208)
 COLOR_HUD = (240, 225, 255)
 
-pygame.font.init()
+with TIMELINE.section("config: pygame.font.init"):
+    pygame.font.init()
 
 # Assets
 ASSET_DIR = Path(__file__).parent / "assets"
@@ -48,49 +59,192 @@ MENU_FONT_FILE = "Vipnagorgialla_Bd.otf"
 UI_FONT_FILE = "Vipnagorgialla_Rg.otf"
 
 
-def load_pixel_font(size: int) -> pygame.font.Font:
-    """Load an 8-bit style font with graceful fallbacks."""
-    search_dirs = (ASSET_DIR, FALLBACK_ASSET_DIR)
-    for base_dir in search_dirs:
-        for filename in PIXEL_FONT_FILES:
+PIXEL_FONT_FAMILY = "pixel"
+FONT_CACHE_FILE = Path(__file__).with_name(".font_cache.json")
+# Where installed fonts land; a cached miss is re-probed once any of these changes.
+SYSTEM_FONT_DIRS = (
+    Path(os.environ.get("WINDIR", "C:/Windows")) / "Fonts",
+    Path(os.environ.get("LOCALAPPDATA", "~/AppData/Local")).expanduser() / "Microsoft/Windows/Fonts",
+    Path("/Library/Fonts"),
+    Path("/System/Library/Fonts"),
+    Path("~/Library/Fonts").expanduser(),
+    Path("/usr/share/fonts"),
+    Path("/usr/local/share/fonts"),
+    Path("~/.fonts").expanduser(),
+    Path("~/.local/share/fonts").expanduser(),
+    # fontconfig rewrites its caches whenever fonts are added anywhere it looks.
+    Path("/var/cache/fontconfig"),
+    Path("~/.cache/fontconfig").expanduser(),
+)
+# Font packages nest files (e.g. /usr/share/fonts/truetype/<package>/), and a
+# directory's mtime only changes with its direct entries.
+FONT_DIR_SCAN_DEPTH = 2
+
+# family -> resolved font file (None means pygame's default font)
+_RESOLVED_FONT_PATHS: dict[str, str | None] = {}
+_FONT_OBJECTS: dict[tuple[str, int], pygame.font.Font] = {}
+_FONT_LOCK = threading.RLock()
+_disk_font_paths: dict[str, str | None] | None = None
+
+
+def _dir_tree_mtime(path: Path | str, depth: int) -> float:
+    try:
+        mtime = os.stat(path).st_mtime
+        if depth <= 0:
+            return mtime
+        with os.scandir(path) as entries:
+            subdirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return 0.0
+    for subdir in subdirs:
+        mtime = max(mtime, _dir_tree_mtime(subdir, depth - 1))
+    return mtime
+
+
+def _font_dirs_mtime() -> float:
+    return max((_dir_tree_mtime(font_dir, FONT_DIR_SCAN_DEPTH) for font_dir in SYSTEM_FONT_DIRS), default=0.0)
+
+
+def _read_font_path_cache() -> dict[str, str | None]:
+    try:
+        payload = json.loads(FONT_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    paths = payload.get("paths") if isinstance(payload, dict) else None
+    if not isinstance(paths, dict):
+        return {}
+
+    # Misses only hold while the font directories are unchanged.
+    misses_valid = payload.get("font_dirs_mtime") == _font_dirs_mtime()
+    valid: dict[str, str | None] = {}
+    for family, path in paths.items():
+        if (path is None and misses_valid) or (isinstance(path, str) and Path(path).exists()):
+            valid[str(family)] = path
+    return valid
+
+
+def _write_font_path_cache(paths: dict[str, str | None]):
+    payload = {"paths": paths, "font_dirs_mtime": _font_dirs_mtime()}
+    try:
+        FONT_CACHE_FILE.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    except OSError:
+        return
+
+
+def _find_font_file(filenames: tuple[str, ...]) -> Path | None:
+    for base_dir in (ASSET_DIR, FALLBACK_ASSET_DIR):
+        for filename in filenames:
             path = base_dir / filename
-            if not path.exists():
-                continue
-            try:
-                return pygame.font.Font(path, size)
-            except (FileNotFoundError, pygame.error):
-                continue
+            if path.exists():
+                return path
+    return None
+
+
+def resolve_font_path(family: str) -> str | None:
+    """Resolve a font family to a file path once per process.
+
+    ``family`` is either a font filename from the assets folder or
+    ``PIXEL_FONT_FAMILY``. Local files are always checked first; system
+    font lookups (which enumerate every installed font on first use) are
+    persisted to ``FONT_CACHE_FILE`` so later launches skip them. A cached
+    miss is retried once anything under ``SYSTEM_FONT_DIRS`` changes.
+    """
+    global _disk_font_paths
+
+    with _FONT_LOCK:
+        if family in _RESOLVED_FONT_PATHS:
+            return _RESOLVED_FONT_PATHS[family]
+
+        if family == PIXEL_FONT_FAMILY:
+            local = _find_font_file(PIXEL_FONT_FILES)
+        else:
+            local = _find_font_file((family,))
+            if local is None:
+                path = resolve_font_path(PIXEL_FONT_FAMILY)
+                _RESOLVED_FONT_PATHS[family] = path
+                return path
 
-    for name in PIXEL_FONT_NAMES:
-        font = pygame.font.SysFont(name, size)
-        if font:
-            return font
+        if local is not None:
+            path = str(local)
+        else:
+            if _disk_font_paths is None:
+                _disk_font_paths = _read_font_path_cache()
+            if family in _disk_font_paths:
+                path = _disk_font_paths[family]
+            else:
+                path = None
+                with TIMELINE.section(f"system font lookup ({family})"):
+                    for name in (*PIXEL_FONT_NAMES, "consolas"):
+                        path = pygame.font.match_font(name)
+                        if path:
+                            break
+                _disk_font_paths[family] = path
+                _write_font_path_cache(_disk_font_paths)
+
+        _RESOLVED_FONT_PATHS[family] = path
+        return path
+
+
+def _open_font(family: str, size: int) -> pygame.font.Font:
+    key = (family, size)
+    font = _FONT_OBJECTS.get(key)
+    if font is not None:
+        return font
+
+    path = resolve_font_path(family)
+    try:
+        with TIMELINE.section(f"font {family} {size}"):
+            font = pygame.font.Font(path, size)
+    except (FileNotFoundError, OSError, pygame.error):
+        if family != PIXEL_FONT_FAMILY:
+            font = _open_font(PIXEL_FONT_FAMILY, size)
+        else:
+            font = pygame.font.Font(None, size)
+    _FONT_OBJECTS[key] = font
+    return font
+
+
+def load_pixel_font(size: int) -> pygame.font.Font:
+    """Load an 8-bit style font with graceful fallbacks.
 
-    return pygame.font.SysFont("consolas", size)
+    Font objects are shared between callers asking for the same size.
+    """
+    return _open_font(PIXEL_FONT_FAMILY, size)
 
 
 def load_custom_font(filename: str, size: int) -> pygame.font.Font:
     """Load a specific font file with pixel fallback."""
-    search_dirs = (ASSET_DIR, FALLBACK_ASSET_DIR)
-    for base_dir in search_dirs:
-        path = base_dir / filename
-        if not path.exists():
-            continue
-        try:
-            return pygame.font.Font(path, size)
-        except (FileNotFoundError, pygame.error):
-            continue
+    return _open_font(filename, size)
 
-    return load_pixel_font(size)
 
+_SCALED_IMAGE_CACHE: dict[tuple[str, tuple[int, int], bool], pygame.Surface | None] = {}
+_IMAGE_LOCK = threading.RLock()
+# Decoded originals are only needed again when an image is reloaded.
+SURFACE_LEDGER.register("decoded images", lambda: _SCALED_IMAGE_CACHE, _SCALED_IMAGE_CACHE.clear, shared=True)
 
-def load_scaled_image(filename: str, size: tuple[int, int], *, smooth: bool = True):
-    """Load a PNG from the assets folder and scale it to the given size.
 
-    Returns ``None`` when the file is missing or invalid so callers can
-    gracefully fall back to procedural placeholders.
+def decode_scaled_image(filename: str, size: tuple[int, int], *, smooth: bool = True):
+    """Decode and scale an image off the main thread.
+
+    Needs the convert format (the window main opens before the startup
+    loader), but does not draw, so it is safe to call from worker threads.
+    Results (including misses) are cached per filename, size and filter.
     """
 
+    key = (filename, size, smooth)
+    with _IMAGE_LOCK:
+        if key in _SCALED_IMAGE_CACHE:
+            return _SCALED_IMAGE_CACHE[key]
+
+    with TIMELINE.section(f"image {filename} {size[0]}x{size[1]}"):
+        image = _decode_scaled_image(filename, size, smooth)
+
+    # Decode outside the lock so workers overlap; the first result wins.
+    with _IMAGE_LOCK:
+        return _SCALED_IMAGE_CACHE.setdefault(key, image)
+
+
+def _decode_scaled_image(filename: str, size: tuple[int, int], smooth: bool):
     search_dirs = (ASSET_DIR, FALLBACK_ASSET_DIR)
     image = None
     for base_dir in search_dirs:
@@ -98,6 +252,7 @@ def load_scaled_image(filename: str, size: tuple[int, int], *, smooth: bool = Tr
         if not path.exists():
             continue
         try:
+            # Convert before scaling: smoothscale rejects 8-bit and paletted PNGs.
             image = pygame.image.load(path).convert_alpha()
         except (FileNotFoundError, pygame.error):
             image = None
@@ -106,7 +261,19 @@ def load_scaled_image(filename: str, size: tuple[int, int], *, smooth: bool = Tr
 
     if image is None:
         return None
-
     if smooth:
         return pygame.transform.smoothscale(image, size)
     return pygame.transform.scale(image, size)
+
+
+def load_scaled_image(filename: str, size: tuple[int, int], *, smooth: bool = True):
+    """Load a PNG from the assets folder and scale it to the given size.
+
+    Returns ``None`` when the file is missing or invalid so callers can
+    gracefully fall back to procedural placeholders.
+    """
+
+    image = decode_scaled_image(filename, size, smooth=smooth)
+    if image is None:
+        return None
+    return image.convert_alpha()
@@ -0,0 +1,197 @@
+import random
+
+import pygame
+from config import TILE_SIZE, COLOR_FOOD
+from surface_ledger import SURFACE_LEDGER, surface_bytes
+from wall_chunks import stamp_tiles
+
+ENDLESS_CHUNK_COLS = 12
+LOOKAHEAD_CHUNKS = 2
+START_CLEAR_COLS = 24
+MAX_ENEMIES_PER_CHUNK = 3
+COLOR_ENEMY = (240, 80, 80)
+
+Cell = tuple[int, int]
+
+
+class WorldChunk:
+    """One ``ENDLESS_CHUNK_COLS``-wide slice of the endless world, in world cells."""
+
+    __slots__ = ("index", "x0", "obstacles", "food", "enemies", "surface")
+
+    def __init__(self, index: int, x0: int):
+        self.index = index
+        self.x0 = x0
+        self.obstacles: set[Cell] = set()
+        self.food: set[Cell] = set()
+        self.enemies: list[dict] = []
+        self.surface: pygame.Surface | None = None
+
+
+class EndlessWorld:
+    """Side-scroller world streamed in chunks around the camera.
+
+    Chunks are generated from ``(seed, index)`` as they come within
+    ``LOOKAHEAD_CHUNKS`` of the view and dropped once they are behind it, so
+    the loaded chunks (obstacle and food sets, enemies, rendered walls) stay
+    the same size however far the run goes. Collision looks a cell up in
+    the chunk that owns its column, and only enemies of loaded chunks move.
+    """
+
+    def __init__(self, rows: int, view_cols: int, seed: int | None = None):
+        self.rows = rows
+        self.view_cols = view_cols
+        self.seed = random.randrange(1 << 30) if seed is None else seed
+        self.chunks: dict[int, WorldChunk] = {}
+        self.generated = 0
+        SURFACE_LEDGER.register(
+            "endless chunks",
+            lambda world: [chunk.surface for chunk in world.chunks.values()],
+            EndlessWorld.drop_surfaces,
+            anchor=self,
+        )
+
+    def chunk_at(self, x: int) -> WorldChunk | None:
+        return self.chunks.get(x // ENDLESS_CHUNK_COLS)
+
+    def stream(self, camera_x: float):
+        """Generate chunks ahead of the camera and evict the ones behind it."""
+        first = int(camera_x) // ENDLESS_CHUNK_COLS
+        last = (int(camera_x) + self.view_cols) // ENDLESS_CHUNK_COLS + LOOKAHEAD_CHUNKS
+        for index in [index for index in self.chunks if index < first]:
+            del self.chunks[index]
+        for index in range(first, last + 1):
+            if index not in self.chunks:
+                self.chunks[index] = self._generate(index)
+
+    def _generate(self, index: int) -> WorldChunk:
+        rng = random.Random(self.seed * 1_000_003 + index)
+        x0 = index * ENDLESS_CHUNK_COLS
+        chunk = WorldChunk(index, x0)
+        self.generated += 1
+        rows = self.rows
+        if x0 >= START_CLEAR_COLS:
+            # Pillars with a gap; rows wrap, so the gap may straddle the edge.
+            pillar_cols = rng.sample(range(1, ENDLESS_CHUNK_COLS - 1, 4), k=rng.randint(1, 2))
+            gap = max(5, 9 - index // 10)
+            for col in pillar_cols:
+                gap_start = rng.randrange(rows)
+                gap_rows = {(gap_start + offset) % rows for offset in range(gap)}
+                chunk.obstacles.update((x0 + col, y) for y in range(rows) if y not in gap_rows)
+            # Small blocks away from the pillars so no gap is plugged.
+            for _ in range(rng.randint(0, 3)):
+                col = rng.randrange(ENDLESS_CHUNK_COLS - 1)
+                if any(abs(col - pillar) <= 2 or abs(col + 1 - pillar) <= 2 for pillar in pillar_cols):
+                    continue
+                y = rng.randrange(rows - 1)
+                chunk.obstacles.update({(x0 + col, y), (x0 + col + 1, y), (x0 + col, y + 1), (x0 + col + 1, y + 1)})
+
+        free = [
+            (x, y)
+            for x in range(x0, x0 + ENDLESS_CHUNK_COLS)
+            for y in range(rows)
+            if (x, y) not in chunk.obstacles
+        ]
+        chunk.food.update(rng.sample(free, k=min(len(free), rng.randint(2, 3))))
+
+        enemy_count = min(MAX_ENEMIES_PER_CHUNK, max(0, (index - 2) // 3))
+        for _ in range(enemy_count):
+            chunk.enemies.append(
+                {
+                    "x": x0 + rng.randrange(ENDLESS_CHUNK_COLS) + 0.5,
+                    "y": rng.randrange(rows) + 0.5,
+                    "vx": -rng.uniform(2.0, 4.5),
+                    "active": False,
+                }
+            )
+        return chunk
+
+    def blocked(self, cell: Cell) -> bool:
+        chunk = self.chunk_at(cell[0])
+        return chunk is not None and cell in chunk.obstacles
+
+    def take_food(self, cell: Cell) -> bool:
+        """Eat the food on ``cell``, if any."""
+        chunk = self.chunk_at(cell[0])
+        if chunk is None or cell not in chunk.food:
+            return False
+        chunk.food.discard(cell)
+        return True
+
+    def enemies(self):
+        for chunk in self.chunks.values():
+            yield from chunk.enemies
+
+    def update_enemies(self, dt_ms: float, camera_x: float):
+        """Move enemies that have come into view; drop the ones that left it."""
+        dt_sec = max(0.0, dt_ms / 1000.0)
+        wake_x = camera_x + self.view_cols
+        for chunk in self.chunks.values():
+            if not chunk.enemies:
+                continue
+            remaining = []
+            for enemy in chunk.enemies:
+                if not enemy["active"]:
+                    enemy["active"] = enemy["x"] < wake_x
+                if enemy["active"]:
+                    enemy["x"] += enemy["vx"] * dt_sec
+                if enemy["x"] > camera_x - 2:
+                    remaining.append(enemy)
+            chunk.enemies = remaining
+
+    def shoot(self, x: float, y: float) -> bool:
+        """Resolve a shot at world position ``(x, y)``; True when it hit something."""
+        cell = (int(x), int(y))
+        if self.blocked(cell):
+            return True
+        for chunk in self.chunks.values():
+            for enemy in chunk.enemies:
+                if abs(enemy["x"] - x) <= 0.6 and abs(enemy["y"] - y) <= 0.6:
+                    chunk.enemies.remove(enemy)
+                    return True
+        return False
+
+    def enemy_cells(self):
+        """Cells the enemies currently touch."""
+        for enemy in self.enemies():
+            yield int(enemy["x"]), int(enemy["y"])
+
+    def drop_surfaces(self):
+        for chunk in self.chunks.values():
+            chunk.surface = None
+
+    def _chunk_surface(self, chunk: WorldChunk) -> pygame.Surface | None:
+        if not chunk.obstacles:
+            return None
+        surface = chunk.surface
+        if surface is None:
+            surface = chunk.surface = pygame.Surface((ENDLESS_CHUNK_COLS * TILE_SIZE, self.rows * TILE_SIZE), pygame.SRCALPHA)
+            stamp_tiles(surface, chunk.obstacles, (-chunk.x0 * TILE_SIZE, 0))
+            SURFACE_LEDGER.grew(surface_bytes(surface))
+        return surface
+
+    def draw(self, surface: pygame.Surface, camera_px: int, offset_y: int, food_image: pygame.Surface | None):
+        """Draw obstacles, food and enemies of the chunks in view."""
+        left = camera_px // TILE_SIZE
+        right = left + self.view_cols + 1
+        blits = []
+        for chunk in self.chunks.values():
+            if chunk.x0 + ENDLESS_CHUNK_COLS <= left or chunk.x0 > right:
+                continue
+            image = self._chunk_surface(chunk)
+            if image is not None:
+                blits.append((image, (chunk.x0 * TILE_SIZE - camera_px, offset_y)))
+            for x, y in chunk.food:
+                dest = (x * TILE_SIZE - camera_px, y * TILE_SIZE + offset_y)
+                if food_image is not None:
+                    blits.append((food_image, dest))
+                else:
+                    pygame.draw.rect(surface, COLOR_FOOD, (*dest, TILE_SIZE, TILE_SIZE))
+        if blits:
+            surface.blits(blits, doreturn=False)
+
+        radius = max(3, int(TILE_SIZE * 0.4))
+        for enemy in self.enemies():
+            center = (int(enemy["x"] * TILE_SIZE - camera_px), int(enemy["y"] * TILE_SIZE + offset_y))
+            pygame.draw.circle(surface, COLOR_ENEMY, center, radius)
+            pygame.draw.circle(surface, (255, 200, 200), center, max(1, radius // 3))
@@ -1,14 +1,23 @@
+import random
+
 import pygame
 from config import TILE_SIZE, COLOR_FOOD, load_scaled_image
+from surface_ledger import SURFACE_LEDGER
+
+Cell = tuple[int, int]
+
 
 class Food:
     def __init__(self, grid_pos=(10, 10)):
-        self.position = grid_pos
+        # None when the board has no free cell left to spawn on
+        self.position: tuple[int, int] | None = grid_pos
         self.image = load_scaled_image("food.png", (TILE_SIZE, TILE_SIZE))
 
-    def draw(self, surface: pygame.Surface, offset_y: int = 0):
+    def draw(self, surface: pygame.Surface, offset_y: int = 0, offset_x_px: int = 0):
+        if self.position is None:
+            return
         x, y = self.position
-        dest = (x * TILE_SIZE, y * TILE_SIZE + offset_y)
+        dest = (x * TILE_SIZE + offset_x_px, y * TILE_SIZE + offset_y)
 
         if self.image:
             surface.blit(self.image, dest)
@@ -16,3 +25,148 @@ class Food:
 
         rect = pygame.Rect(*dest, TILE_SIZE, TILE_SIZE)
         pygame.draw.rect(surface, COLOR_FOOD, rect)
+
+
+class FoodKind:
+    __slots__ = ("name", "points", "growth", "weight", "tint", "lifetime_ms")
+
+    def __init__(
+        self,
+        name: str,
+        points: int,
+        growth: int,
+        weight: int,
+        tint: tuple[int, int, int] | None = None,
+        lifetime_ms: float | None = None,
+    ):
+        self.name = name
+        self.points = points
+        self.growth = growth
+        self.weight = weight
+        self.tint = tint
+        self.lifetime_ms = lifetime_ms
+
+
+FOOD_KINDS = (
+    FoodKind("normal", points=1, growth=1, weight=80),
+    FoodKind("bonus", points=5, growth=3, weight=8, tint=(255, 205, 70)),
+    FoodKind("timed", points=3, growth=1, weight=12, tint=(110, 220, 255), lifetime_ms=7000.0),
+)
+# Timed food is drawn faded for this long before it disappears.
+TIMED_FADE_MS = 2000.0
+
+
+class CellUnion:
+    """``in`` over several cell containers without merging them into one set.
+
+    Spawning food tests a handful of candidate cells, so asking the snake
+    body, the food field and the gate cells directly is cheaper than
+    copying them all on every spawn.
+    """
+
+    __slots__ = ("_parts",)
+
+    def __init__(self, *parts):
+        self._parts = parts
+
+    def __contains__(self, cell) -> bool:
+        return any(cell in part for part in self._parts)
+
+    def as_set(self) -> set:
+        """Every cell in one set, for scans that test most of the board."""
+        cells = set()
+        for part in self._parts:
+            cells.update(part)
+        cells.discard(None)
+        return cells
+
+
+class FoodItem:
+    __slots__ = ("position", "kind", "fading")
+
+    def __init__(self, position: Cell, kind: FoodKind):
+        self.position = position
+        self.kind = kind
+        self.fading = False
+
+
+class FoodField:
+    """Extra food items for ``--food``, indexed by cell.
+
+    ``items`` maps each occupied cell to its item, so eating is one dict
+    lookup per tick however many items are out, and every item is drawn
+    with a single ``Surface.blits`` call from one image per kind.
+    """
+
+    def __init__(self):
+        self.items: dict[Cell, FoodItem] = {}
+        self.images = self._build_images(load_scaled_image("food.png", (TILE_SIZE, TILE_SIZE)))
+        SURFACE_LEDGER.register("food images", lambda field: field.images, anchor=self)
+
+    @staticmethod
+    def _build_images(base: pygame.Surface | None) -> dict[str, pygame.Surface]:
+        if base is None:
+            base = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+            base.fill(COLOR_FOOD)
+        images = {}
+        for kind in FOOD_KINDS:
+            image = base.copy()
+            if kind.tint is not None:
+                image.fill(kind.tint, special_flags=pygame.BLEND_RGB_MULT)
+                pygame.draw.rect(image, kind.tint, image.get_rect(), width=2, border_radius=4)
+            images[kind.name] = image
+            if kind.lifetime_ms is not None:
+                fading = image.copy()
+                fading.set_alpha(110)
+                images[kind.name + " fading"] = fading
+        return images
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def clear(self):
+        self.items.clear()
+
+    @staticmethod
+    def random_kind() -> FoodKind:
+        return random.choices(FOOD_KINDS, weights=[kind.weight for kind in FOOD_KINDS])[0]
+
+    def add(self, cell: Cell, kind: FoodKind) -> FoodItem:
+        item = self.items[cell] = FoodItem(cell, kind)
+        return item
+
+    def take(self, cell: Cell) -> FoodItem | None:
+        """Remove and return the item on ``cell``, if any."""
+        return self.items.pop(cell, None)
+
+    def remove(self, item: FoodItem) -> bool:
+        if self.items.get(item.position) is not item:
+            return False
+        del self.items[item.position]
+        return True
+
+    def blits(
+        self,
+        offset_y: int = 0,
+        offset_x_px: int = 0,
+        visible: tuple[int, int, int, int] | None = None,
+    ) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        images = self.images
+        blits = []
+        for (x, y), item in self.items.items():
+            if visible is not None and not (visible[0] <= x < visible[2] and visible[1] <= y < visible[3]):
+                continue
+            name = item.kind.name + " fading" if item.fading else item.kind.name
+            blits.append((images[name], (x * TILE_SIZE + offset_x_px, y * TILE_SIZE + offset_y)))
+        return blits
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        offset_y: int = 0,
+        offset_x_px: int = 0,
+        visible: tuple[int, int, int, int] | None = None,
+    ):
+        blits = self.blits(offset_y, offset_x_px, visible)
+        if blits:
+            surface.blits(blits, doreturn=False)
@@ -1,21 +1,39 @@
 import json
 import math
 import random
-from collections import deque
+import sys
+import time
 from pathlib import Path
 import pygame
 from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, FPS,
     GRID_WIDTH, GRID_HEIGHT, TILE_SIZE,
     HUD_HEIGHT, PLAYFIELD_HEIGHT,
-    COLOR_BUTTON, COLOR_KEY, COLOR_HUD, COLOR_WALL, COLOR_SNAKE,
-    MENU_FONT_FILE, UI_FONT_FILE, load_custom_font,
+    COLOR_BUTTON, COLOR_KEY, COLOR_HUD, COLOR_WALL, COLOR_SNAKE, COLOR_FOOD,
+    MENU_FONT_FILE, UI_FONT_FILE, BIG_BOARD_SPAWN_RADIUS, load_custom_font,
 )
-from grid import draw_grid, build_background
+from grid import draw_grid, build_background, grid_overlay
 from snake import Snake
-from food import Food
+from food import TIMED_FADE_MS, CellUnion, Food, FoodField, FoodItem
+from intro_veil import IntroVeil
+from startup import StartupLoader
+from startup_timeline import TIMELINE
+from run_history import RUN_HISTORY_PATH, RunHistory, open_run_history, read_leaderboard_entries
+from remote_leaderboard import RemoteLeaderboard
+from autopilot import Autopilot
+from camera import Camera
+from endless import EndlessWorld
+from wall_chunks import WallChunkLayer, stamp_tiles
+from regions import RegionLabels
+from scheduler import Scheduler, Timer
+from starfield import ParallaxStarfield
+from surface_ledger import SURFACE_LEDGER
+from texture_backend import TextureBackend
+from input_pipeline import DirectionBuffer, InputLatencyMeter, configure_event_filter, is_reverse
 from config import load_scaled_image
 
+LEADERBOARD_PATH = Path(__file__).with_name("leaderboard.json")
+
 
 def can_open_gate(collected_food: int, button_active: bool, required_food: int) -> bool:
     return collected_food >= required_food and button_active
@@ -32,39 +50,84 @@ class Game:
         ("J", [(1, 0), (1, 1), (1, 2), (0, 2)]),
     ]
     FRAME_RATE_CAP = 120
-
-    def __init__(self):
+    # Frame gaps longer than this (window drags, breakpoints) are not caught up.
+    MAX_FRAME_DT_MS = 200
+    # Level setup runs in slices of at most this much per loading frame.
+    LEVEL_PREP_BUDGET_MS = 3.0
+    # Spawn candidates scored per slice.
+    SPAWN_SCORE_BATCH = 32
+
+    def __init__(
+        self,
+        startup: StartupLoader | None = None,
+        leaderboard_url: str | None = None,
+        measure_input: bool = False,
+        board_size: tuple[int, int] | None = None,
+        attract: bool = False,
+        texture_backend: TextureBackend | None = None,
+        memory_report: bool = False,
+        endless: bool = False,
+        food_count: int = 1,
+        run_body: bool = True,
+    ):
+        if startup is not None:
+            startup.wait_all()
         pygame.init()
         pygame.display.set_caption("Snake Quest - Gates & Keys")
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.texture_backend = texture_backend
+        if texture_backend is not None:
+            self.screen = texture_backend.frame
+        else:
+            self.screen = pygame.display.get_surface()
+            if self.screen is None or self.screen.get_size() != (SCREEN_WIDTH, SCREEN_HEIGHT):
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        configure_event_filter()
         self.clock = pygame.time.Clock()
+        # Timed effects (boss fire, fades, victory phases, explosions, loading,
+        # story and intro steps) run on this clock; pausing the game pauses it.
+        self.scheduler = Scheduler()
+        self.scheduler_last_ms: int | None = None
         self.running = True
         self.level = 1
+        self.board_cols, self.board_rows = board_size or (GRID_WIDTH, GRID_HEIGHT)
+        self.big_board = board_size is not None
+        self.camera: Camera | None = Camera(self.board_cols, self.board_rows) if self.big_board else None
         self.points = 0
         self.elapsed_time_ms = 0
         self.level_start_points = 0
         self.level_start_time_ms = 0
-        self.background = build_background(PLAYFIELD_HEIGHT)
-        self.menu_background = build_background(SCREEN_HEIGHT)
+        self.background = self._startup_result(startup, "background")
+        if self.background is None:
+            self.background = build_background(PLAYFIELD_HEIGHT)
+        # The camera view scrolls its own grid over a grid-free gradient.
+        self.board_background = build_background(PLAYFIELD_HEIGHT, grid=False) if self.big_board else None
+        self.menu_background = self._startup_result(startup, "menu_background")
+        if self.menu_background is None:
+            self.menu_background = build_background(SCREEN_HEIGHT)
 
         self.music_enabled = False
         self.music_loaded = False
-        self._init_audio()
+        with TIMELINE.section("Game._init_audio"):
+            self._init_audio()
 
         self.snake: Snake | None = None
         self.food: Food | None = None
+        # --food N: N - 1 extra items (normal, bonus, timed) besides self.food.
+        self.food_count = max(1, food_count)
+        self.food_field: FoodField | None = FoodField() if self.food_count > 1 else None
         self.button_pos: tuple[int, int] | None = None
         self.key_pos: tuple[int, int] | None = None
         self.wall_positions: set[tuple[int, int]] = set()
-        self.wall_layer: pygame.Surface | None = None
-        self.wall_layer_dirty = True
-        self.key_image = load_scaled_image("key.png", (TILE_SIZE, TILE_SIZE))
-        self.start_bg = load_scaled_image("menubg.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.start_bg_alt = load_scaled_image("menubg2.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.banner_image = load_scaled_image("banner.png", (SCREEN_WIDTH, HUD_HEIGHT))
-        self.sacrifice_shot_size = max(4, int(TILE_SIZE * 0.7))
-        self.sacrifice_shot_corner = max(2, int(self.sacrifice_shot_size * 0.3))
-        self.sacrifice_shot_images = self._build_sacrifice_shot_images()
+        self.wall_chunks = WallChunkLayer()
+        self.layout_version = 0
+        with TIMELINE.section("Game: menu and HUD images"):
+            self.key_image = load_scaled_image("key.png", (TILE_SIZE, TILE_SIZE))
+            self.start_bg = load_scaled_image("menubg.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.start_bg_alt = load_scaled_image("menubg2.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.banner_image = load_scaled_image("banner.png", (SCREEN_WIDTH, HUD_HEIGHT))
+            self.sacrifice_shot_size = max(4, int(TILE_SIZE * 0.7))
+            self.sacrifice_shot_corner = max(2, int(self.sacrifice_shot_size * 0.3))
+            self.sacrifice_shot_images = self._build_sacrifice_shot_images()
 
         self.game_started = False
         self.game_over = False
@@ -74,6 +137,7 @@ class Game:
         self.sacrifice_playable_cells: set[tuple[int, int]] | None = None
         self.sacrifice_left_cells: set[tuple[int, int]] | None = None
         self.sacrifice_right_cells: set[tuple[int, int]] | None = None
+        self.sacrifice_regions: RegionLabels | None = None
         self.sacrifice_wall_open = False
         self.sacrifice_shot_active = False
         self.sacrifice_shot_pos = (0.0, 0.0)
@@ -85,43 +149,76 @@ class Game:
         self.sacrifice_shot_hit_radius = 0.2
         self.sacrifice_explosions: list[dict] = []
         self.loading_active = False
-        self.loading_start_ms: int | None = None
         self.loading_duration_ms = 2000
         self.loading_tiles: list[tuple[int, int]] = []
         self.loading_reveal_count = 0
+        # Revealed loading tiles are stamped once onto this persistent layer.
+        self.loading_layer = pygame.Surface((SCREEN_WIDTH, PLAYFIELD_HEIGHT), pygame.SRCALPHA)
+        self.loading_layer_count = 0
+        self.menu_border_layer: pygame.Surface | None = None
         self.layout_ready = False
+        # Generator preparing the next level while the loading build plays.
+        self.level_prep = None
         self.level_clear = False
         self.game_paused = False
-        self.speed_options = [("Slow", 0.5), ("Normal", 1.0), ("Fast", 1.5)]
+        self.speed_options = [("Slow", 0.5), ("Normal", 1.0), ("Fast", 1.5), ("Turbo", 3.0), ("Turbo+", 6.0)]
         self.speed_index = 1
         self.speed_multiplier = self.speed_options[self.speed_index][1]
         self.last_frame_ms: int | None = None
         self.move_accumulator_ms = 0.0
+        # Simulation ticks run, ticks run behind schedule and ticks lost to stalls.
+        self.sim_ticks = 0
+        self.late_ticks = 0
+        self.dropped_ticks = 0
         self.menu_page = "main"
         self.menu_options = ["Start Game", "Settings", "Exit Game"]
         self.menu_index = 0
         self.input_locked = False
-        self.queued_direction: tuple[int, int] | None = None
+        self.direction_buffer = DirectionBuffer()
+        self.input_meter: InputLatencyMeter | None = InputLatencyMeter() if measure_input else None
+        self.memory_report = memory_report
+        # Attract mode: after attract_idle_ms on the main menu the autopilot
+        # plays demo levels. --attract loops demos back to back as a soak test.
+        self.autopilot = Autopilot()
+        self.attract_active = False
+        self.attract_loop = attract
+        self.attract_soak = attract
+        self.attract_idle_ms = 20000
+        self.attract_duration_ms = 90000
+        self.attract_started_ms = 0
+        self.menu_idle_since_ms = pygame.time.get_ticks()
+        self._attract_label: pygame.Surface | None = None
         self.sound_on = True
         self.settings_index = 0
         self.score_recorded = False
         self.name_input = ""
         self.name_max_length = 10
-        self._hud_cache_key: tuple[int, int, str] | None = None
+        self._hud_cache_key: tuple[int, str, str] | None = None
         self._hud_surfaces: dict[str, pygame.Surface] = {}
-        self.leaderboard_path = Path(__file__).with_name("leaderboard.json")
+        self.leaderboard_path = LEADERBOARD_PATH
+        self.leaderboard_size = 5
         self.leaderboard_entries: list[dict] = []
-        self._load_leaderboard()
-
-        self.menu_title_font = load_custom_font(MENU_FONT_FILE, 54)
-        self.menu_option_font = load_custom_font(MENU_FONT_FILE, 30)
-        self.menu_prompt_font = load_custom_font(MENU_FONT_FILE, 16)
-        self.game_title_font = load_custom_font(MENU_FONT_FILE, 36)
-        self.game_font = load_custom_font(MENU_FONT_FILE, 20)
-        self.ui_title_font = load_custom_font(UI_FONT_FILE, 34)
-        self.ui_font = load_custom_font(UI_FONT_FILE, 24)
-
-        self.first_tetris_level = 6
+        self.death_cause = ""
+        with TIMELINE.section("Game._load_leaderboard"):
+            self.run_history: RunHistory | None = self._startup_result(startup, "run_history")
+            if self.run_history is None:
+                self.run_history = open_run_history(
+                    RUN_HISTORY_PATH, self.leaderboard_path, self.leaderboard_size
+                )
+            self._load_leaderboard()
+        self.remote_leaderboard = RemoteLeaderboard.from_env(leaderboard_url)
+
+        with TIMELINE.section("Game: fonts"):
+            self.menu_title_font = load_custom_font(MENU_FONT_FILE, 54)
+            self.menu_option_font = load_custom_font(MENU_FONT_FILE, 30)
+            self.menu_prompt_font = load_custom_font(MENU_FONT_FILE, 16)
+            self.game_title_font = load_custom_font(MENU_FONT_FILE, 36)
+            self.game_font = load_custom_font(MENU_FONT_FILE, 20)
+            self.ui_title_font = load_custom_font(UI_FONT_FILE, 34)
+            self.ui_font = load_custom_font(UI_FONT_FILE, 24)
+
+        # Big boards are an endless run of classic outline levels.
+        self.first_tetris_level = sys.maxsize if self.big_board else 6
         self.last_normal_level = self.first_tetris_level - 1
         self.last_tetris_level = self.first_tetris_level + len(self.TETRIS_SHAPES) - 1
         self.first_sacrifice_level = self.last_tetris_level + 1
@@ -132,15 +229,16 @@ class Game:
         self.escape_wall_open = False
         self.side_scroller_active = False
         self.side_scroller_left_lock = 0
-        self.starfield: list[dict] = []
+        self.starfield: ParallaxStarfield | None = None
         self.star_count = 90
         self.star_speed_range = (40.0, 140.0)
+        # The boss fight fades in this many times the stars, at the same cost.
+        self.boss_star_density = 10
         self.side_scroller_food_eaten = 0
         self.side_scroller_food_needed = 5
         self.side_scroller_trigger_x = GRID_WIDTH - 8
         self.side_scroller_camera_x = 0.0
         self.space_fade = 0.0
-        self.space_fade_time_ms = 0.0
         self.space_fade_duration_ms = 5000.0
         self.space_fade_active = False
         self.player_shots: list[dict] = []
@@ -157,15 +255,20 @@ class Game:
         self.boss_height = 4
         self.boss_target_x = GRID_WIDTH - self.boss_width - 2
         self.boss_fire_interval_ms = 1200
-        self.boss_fire_timer_ms = 0.0
         self.boss_bullets: list[dict] = []
         self.boss_bullet_speed = 9.5
         self.boss_bullet_radius = max(2, int(TILE_SIZE * 0.25))
         self.boss_state = "hidden"
-        self.boss_sprite = self._build_boss_sprite()
+        # --endless: a streamed side-scroller run instead of the level sequence.
+        self.endless_mode = endless
+        # The player's body is kept as straight runs (body_runs.py) unless --list-body.
+        self.run_body = run_body
+        self.endless_world: EndlessWorld | None = None
+        with TIMELINE.section("Game._build_boss_sprite"):
+            self.boss_sprite = self._build_boss_sprite()
         self.victory_active = False
         self.victory_phase = "none"
-        self.victory_phase_time_ms = 0.0
+        self.victory_message_alpha = 0.0
         self.victory_explosion_duration_ms = 1000.0
         self.victory_fly_duration_ms = 4500.0
         self.victory_message_fade_ms = 1800.0
@@ -173,8 +276,7 @@ class Game:
         self.story_active = False
         self.story_text = ""
         self.story_next_action = ""
-        self.story_last_frame_ms: int | None = None
-        self.story_move_accumulator_ms = 0.0
+        self.story_timer: Timer | None = None
         self.story_move_interval_ms = 140
         self.story_path = self._build_story_path()
         self.story_path_index = 0
@@ -204,34 +306,62 @@ class Game:
         self.intro_done = False
         self.intro_phase = "veil"
         self.intro_snake_length = 10
-        self.intro_veil_snakes: list[Snake] = []
-        self.intro_veil_steps = 0
-        self.intro_veil_total_steps = 0
+        self.intro_veil: IntroVeil | None = None
         self.intro_hero_target_x = 0
         self.intro_hero_row = 0
         self.intro_hero_done = False
         self.intro_snake: Snake | None = None
-        self.intro_last_frame_ms: int | None = None
-        self.intro_move_accumulator_ms = 0.0
+        self.intro_timer: Timer | None = None
         self.intro_move_interval_ms = 62
         self._reset_intro_sequence()
+        self._register_surface_caches()
+
+    def _register_surface_caches(self):
+        """Account the Game's own long-lived surfaces in ``SURFACE_LEDGER``."""
+        register = SURFACE_LEDGER.register
+        register("menu images", lambda game: (game.start_bg, game.start_bg_alt, game.banner_image), anchor=self)
+        register(
+            "menu layers",
+            lambda game: (game.menu_border_layer, game._attract_label),
+            Game._drop_menu_layers,
+            anchor=self,
+        )
+        register("hud", lambda game: game._hud_surfaces, Game._drop_hud_surfaces, anchor=self)
+        register("loading layer", lambda game: game.loading_layer, anchor=self)
+        register("boss sprite", lambda game: game.boss_sprite, anchor=self)
+        register("game sprites", lambda game: (game.key_image, game.sacrifice_shot_images), anchor=self)
+
+    def _drop_menu_layers(self):
+        self.menu_border_layer = None
+        self._attract_label = None
+
+    def _drop_hud_surfaces(self):
+        self._hud_cache_key = None
+        self._hud_surfaces = {}
+
+    @staticmethod
+    def _startup_result(startup: StartupLoader | None, name: str):
+        """Pick up a result preloaded by a StartupLoader, if one was given."""
+        if startup is None:
+            return None
+        return startup.result(name)
 
     def start_level(self):
         """Set up a fresh level layout with increasing gate spacing."""
         self.level_start_points = self.points
         self.level_start_time_ms = self.elapsed_time_ms
-        self.snake = Snake(grid_pos=(5, 5))
-        self.food = Food()
-        if not self.layout_ready:
-            self.build_walls()
+        # Finish what the loading screen has not prepared yet (everything
+        # when there was no loading screen).
+        prep = self.level_prep if self.layout_ready else None
+        self.level_prep = None
+        for _ in prep or self._prepare_level():
+            pass
         self.layout_ready = False
-        self._place_snake_for_level()
-        self.place_gate_elements()
-        self.spawn_food()
+        self._fill_food_field()
         self.level_food_eaten = 0
         self.sacrifice_ammo = 0
         self.loading_active = False
-        self.loading_start_ms = None
+        self.scheduler.cancel_group("loading")
         self.loading_tiles = []
         self.loading_reveal_count = 0
         self.last_frame_ms = None
@@ -242,34 +372,86 @@ class Game:
         self.game_paused = False
         self.story_active = False
         self.input_locked = False
-        self.queued_direction = None
+        self.direction_buffer.clear()
         self.side_scroller_active = False
         self.escape_wall_open = False
-        self.starfield = []
+        self.starfield = None
         self.side_scroller_camera_x = 0.0
         self.side_scroller_food_eaten = 0
         self.space_fade = 0.0
-        self.space_fade_time_ms = 0.0
+        self.scheduler.cancel_group("space fade")
         self.space_fade_active = False
         self.player_shots.clear()
         self.boss_bullets.clear()
         self.boss_active = False
         self.boss_hp = 0
         self.boss_state = "hidden"
-        self.boss_fire_timer_ms = 0.0
+        self.scheduler.cancel_group("boss fire")
         self._reset_victory_state()
+        SURFACE_LEDGER.checkpoint(f"level {self.level}")
+
+    def _prepare_level(self):
+        """Level setup as a generator that yields between slices of work.
 
-    def _place_snake_for_level(self):
+        ``begin_loading`` starts it and ``update`` runs it for up to
+        ``LEVEL_PREP_BUDGET_MS`` per loading frame; ``start_level`` finishes
+        whatever is left, so the first gameplay frame has nothing to build.
+        """
+        self.snake = Snake(grid_pos=(5, 5), run_body=self.run_body)
+        self.food = Food()
+        if not self.layout_ready:
+            self.build_walls()
+        # The budget must not drop the chunks prerendered below.
+        SURFACE_LEDGER.pin(self.wall_chunks)
+        yield
+        yield from self._place_snake_steps()
+        self.place_gate_elements()
+        self.spawn_food()
+        yield
+
+        bounds = None
+        if self.camera is not None:
+            self.camera.center_on(self.snake.head)
+            bounds = self.camera.visible_tiles()
+        for chunk in self.wall_chunks.prerender(self.wall_positions, self.breakable_wall_positions, bounds):
+            if self.texture_backend is not None and chunk is not None:
+                self.texture_backend.texture(chunk)
+            yield
+        if self.texture_backend is not None:
+            for image in self.snake.base_images():
+                self.texture_backend.texture(image)
+            if self.food.image is not None:
+                self.texture_backend.texture(self.food.image)
+
+    def _advance_level_prep(self):
+        """Run level preparation slices until this frame's budget is spent."""
+        if self.level_prep is None:
+            return
+        deadline = time.perf_counter() + self.LEVEL_PREP_BUDGET_MS / 1000.0
+        for _ in self.level_prep:
+            if time.perf_counter() >= deadline:
+                return
+
+    def _place_snake_steps(self):
+        """Place the snake for the level; yields between batches of spawn scoring."""
         if not self.snake:
             return
 
         if self._in_sacrifice_levels():
-            self._place_snake_in_sacrifice_start()
+            if not self.sacrifice_left_cells:
+                return
+            allowed_cells = self.sacrifice_left_cells
+            candidates = [pos for pos in allowed_cells if pos not in self.wall_positions]
+            if not candidates:
+                candidates = list(allowed_cells)
+        elif self.big_board:
+            self._spawn_snake_with_tail((self.board_cols // 2, self.board_rows // 2))
             return
-
-        if self.playable_cells:
+        elif self.playable_cells:
+            allowed_cells = self.playable_cells
             candidates = [pos for pos in self.playable_cells if pos not in self.wall_positions]
         else:
+            allowed_cells = self.playable_cells
             candidates = [
                 (x, y)
                 for x in range(GRID_WIDTH)
@@ -280,24 +462,27 @@ class Game:
         if not candidates:
             return
 
-        spawn = self._choose_spawn_position(candidates, min_wall_gap=8)
-        self._spawn_snake_with_tail(spawn, allowed_cells=self.playable_cells)
+        spawn = yield from self._choose_spawn_position(candidates, min_wall_gap=8)
+        self._spawn_snake_with_tail(spawn, allowed_cells=allowed_cells)
 
     def _choose_spawn_position(
         self,
         candidates: list[tuple[int, int]],
         min_wall_gap: int,
-    ) -> tuple[int, int]:
+    ):
+        """Generator returning a random cell ``min_wall_gap`` from the walls (else the farthest)."""
         safe_cells: list[tuple[int, int]] = []
         best_cell = candidates[0]
         best_distance = -1
-        for cell in candidates:
+        for index, cell in enumerate(candidates, 1):
             distance = self._distance_to_nearest_wall(cell)
             if distance >= min_wall_gap:
                 safe_cells.append(cell)
             if distance > best_distance:
                 best_distance = distance
                 best_cell = cell
+            if index % self.SPAWN_SCORE_BATCH == 0:
+                yield
 
         if safe_cells:
             return random.choice(safe_cells)
@@ -307,7 +492,7 @@ class Game:
     def _distance_to_nearest_wall(self, cell: tuple[int, int]) -> int:
         if not self.wall_positions:
             x, y = cell
-            return min(x, y, GRID_WIDTH - 1 - x, GRID_HEIGHT - 1 - y)
+            return min(x, y, self.board_cols - 1 - x, self.board_rows - 1 - y)
 
         return min(
             abs(cell[0] - wall[0]) + abs(cell[1] - wall[1])
@@ -324,7 +509,7 @@ class Game:
 
         def is_valid(cell: tuple[int, int]) -> bool:
             x, y = cell
-            if x < 0 or x >= GRID_WIDTH or y < 0 or y >= GRID_HEIGHT:
+            if x < 0 or x >= self.board_cols or y < 0 or y >= self.board_rows:
                 return False
             if cell in self.wall_positions:
                 return False
@@ -365,17 +550,17 @@ class Game:
         self.last_frame_ms = None
         self.move_accumulator_ms = 0.0
         self.input_locked = False
-        self.queued_direction = None
+        self.direction_buffer.clear()
         self.level_clear = False
         self.game_paused = False
         self.sacrifice_shot_active = False
         self.sacrifice_explosions.clear()
         self.side_scroller_active = False
-        self.starfield = []
+        self.starfield = None
         self.side_scroller_camera_x = 0.0
         self.side_scroller_food_eaten = 0
         self.space_fade = 0.0
-        self.space_fade_time_ms = 0.0
+        self.scheduler.cancel_group("space fade")
         self.space_fade_active = False
         self.player_shots.clear()
         self.boss_bullets.clear()
@@ -384,6 +569,9 @@ class Game:
         self.boss_state = "hidden"
         self._reset_victory_state()
         self.start_music()
+        if self.endless_mode:
+            self.start_endless()
+            return
         self.start_story(self.story_intro_text, "begin_loading")
 
     def replay_level(self):
@@ -401,11 +589,11 @@ class Game:
         self.last_frame_ms = None
         self.move_accumulator_ms = 0.0
         self.input_locked = False
-        self.queued_direction = None
+        self.direction_buffer.clear()
         self.sacrifice_shot_active = False
         self.sacrifice_explosions.clear()
         self.side_scroller_active = False
-        self.starfield = []
+        self.starfield = None
         self.side_scroller_camera_x = 0.0
         self.player_shots.clear()
         self.boss_bullets.clear()
@@ -415,24 +603,27 @@ class Game:
         self.points = self.level_start_points
         self.elapsed_time_ms = self.level_start_time_ms
         self.start_music()
+        if self.endless_mode:
+            self.start_endless()
+            return
         self.begin_loading()
 
     def start_story(self, text: str, next_action: str):
         self.story_active = True
         self.story_text = text
         self.story_next_action = next_action
-        self.story_last_frame_ms = None
-        self.story_move_accumulator_ms = 0.0
         self.last_frame_ms = None
         self._reset_story_snake()
+        self._stop_timer(self.story_timer)
+        self.story_timer = self.scheduler.every(self.story_move_interval_ms, self._story_step, skip_missed=True)
 
     def complete_story(self):
         action = self.story_next_action
         self.story_active = False
         self.story_text = ""
         self.story_next_action = ""
-        self.story_last_frame_ms = None
-        self.story_move_accumulator_ms = 0.0
+        self._stop_timer(self.story_timer)
+        self.story_timer = None
         if action == "begin_loading":
             self.begin_loading()
         elif action == "end_to_menu":
@@ -442,12 +633,14 @@ class Game:
         """Create a neon wall outline that also serves as collision."""
 
         self.wall_positions = set()
-        self.wall_layer_dirty = True
+        self.wall_chunks.reset()
+        self.layout_version += 1
         self.breakable_wall_positions = set()
         self.playable_cells = None
         self.sacrifice_playable_cells = None
         self.sacrifice_left_cells = None
         self.sacrifice_right_cells = None
+        self.sacrifice_regions = None
         self.sacrifice_wall_open = False
         self.escape_wall_open = False
 
@@ -468,12 +661,12 @@ class Game:
             return
 
         self.playable_cells = None
-        for x in range(GRID_WIDTH):
+        for x in range(self.board_cols):
             self.wall_positions.add((x, 0))
-            self.wall_positions.add((x, GRID_HEIGHT - 1))
-        for y in range(GRID_HEIGHT):
+            self.wall_positions.add((x, self.board_rows - 1))
+        for y in range(self.board_rows):
             self.wall_positions.add((0, y))
-            self.wall_positions.add((GRID_WIDTH - 1, y))
+            self.wall_positions.add((self.board_cols - 1, y))
 
     def _init_audio(self):
         """Load background music if theme.wav exists, otherwise stay silent."""
@@ -555,6 +748,10 @@ class Game:
             self.key_pos = key
             return
 
+        if self.big_board:
+            self._place_big_board_gate(blocked)
+            return
+
         min_gap = min(max(GRID_WIDTH, GRID_HEIGHT) - 2, 4 + self.level)
         candidates = [
             (x, y)
@@ -584,86 +781,142 @@ class Game:
         self.key_pos = key
 
     def spawn_food(self):
+        """Move the food to a free cell, or to ``None`` when no free cell remains."""
         assert self.food is not None and self.snake is not None
+        self.food.position = self._free_food_cell()
+
+    def _free_food_cell(self) -> tuple[int, int] | None:
+        """A cell food may spawn on: not the snake, other food, walls, button, key or boss area."""
+        blocked = CellUnion(
+            (self.button_pos, self.key_pos, self.food.position),
+            self.food_field.items if self.food_field is not None else (),
+            self.snake.segments,
+        )
+
         if self._in_sacrifice_levels() and self.sacrifice_playable_cells:
-            candidates_set = self._sacrifice_spawn_candidates()
-            candidates = list(candidates_set or self.sacrifice_playable_cells)
+            region = self._sacrifice_spawn_candidates()
+            for _ in range(32 if region else 0):
+                candidate = random.choice(region)
+                if candidate not in blocked and not self._position_in_boss_area(candidate):
+                    return candidate
+            blocked = blocked.as_set()
+            candidates = [cell for cell in region if cell not in blocked]
             random.shuffle(candidates)
             for candidate in candidates:
-                if candidate in self.snake.segments:
-                    continue
-                if candidate == self.button_pos or candidate == self.key_pos:
-                    continue
                 if self._position_in_boss_area(candidate):
                     continue
-                self.food.position = candidate
-                return
-            return
+                return candidate
+            return None
 
         if self.playable_cells:
+            # Copying and shuffling the playable cells already costs a pass
+            # over the board, so one set of the blocked cells adds nothing.
+            blocked = blocked.as_set()
             candidates = list(self.playable_cells)
             random.shuffle(candidates)
             for candidate in candidates:
-                if candidate in self.snake.segments:
-                    continue
-                if candidate == self.button_pos or candidate == self.key_pos:
-                    continue
-                if candidate in self.wall_positions:
+                if candidate in blocked or candidate in self.wall_positions:
                     continue
                 if self._position_in_boss_area(candidate):
                     continue
-                self.food.position = candidate
-                return
+                return candidate
+            return None
+
+        if self.big_board:
+            near = self._random_free_cell_near(self.snake.head, blocked)
+            if near is not None:
+                return near
+
+        def is_free(candidate: tuple[int, int]) -> bool:
+            return (
+                candidate not in blocked
+                and candidate not in self.wall_positions
+                and not self._position_in_boss_area(candidate)
+            )
+
+        # Rejection sampling is fast while the board is mostly empty; a nearly
+        # full board falls back to listing the free cells once.
+        for _ in range(64):
+            candidate = (random.randint(0, self.board_cols - 1), random.randint(0, self.board_rows - 1))
+            if is_free(candidate):
+                return candidate
+        blocked = blocked.as_set()
+        free_cells = [
+            (x, y)
+            for x in range(self.board_cols)
+            for y in range(self.board_rows)
+            if is_free((x, y))
+        ]
+        return random.choice(free_cells) if free_cells else None
+
+    def _fill_food_field(self):
+        """Spread the extra ``--food`` items over the board."""
+        if self.food_field is None:
             return
+        self.scheduler.cancel_group("food")
+        self.food_field.clear()
+        for _ in range(self.food_count - 1):
+            if self._spawn_field_food() is None:
+                break
 
-        while True:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            candidate = (x, y)
-            if candidate in self.snake.segments:
-                continue
-            if candidate == self.button_pos or candidate == self.key_pos:
-                continue
-            if candidate in self.wall_positions:
-                continue
-            if self._position_in_boss_area(candidate):
+    def _spawn_field_food(self) -> FoodItem | None:
+        cell = self._free_food_cell()
+        if cell is None:
+            return None
+        item = self.food_field.add(cell, self.food_field.random_kind())
+        lifetime_ms = item.kind.lifetime_ms
+        if lifetime_ms is not None:
+            self.scheduler.after(lifetime_ms - TIMED_FADE_MS, lambda: setattr(item, "fading", True), group="food")
+            self.scheduler.after(lifetime_ms, lambda: self._expire_field_food(item), group="food")
+        return item
+
+    def _expire_field_food(self, item: FoodItem):
+        if self.food_field is not None and self.food_field.remove(item):
+            self._spawn_field_food()
+
+    def _random_free_cell_near(
+        self,
+        center: tuple[int, int],
+        blocked: set[tuple[int, int]],
+        radius: int = BIG_BOARD_SPAWN_RADIUS,
+        attempts: int = 64,
+    ) -> tuple[int, int] | None:
+        """Sample a free interior cell near ``center``; cost does not depend on board area."""
+        cx, cy = center
+        x_lo, x_hi = max(1, cx - radius), min(self.board_cols - 2, cx + radius)
+        y_lo, y_hi = max(1, cy - radius), min(self.board_rows - 2, cy + radius)
+        if x_lo > x_hi or y_lo > y_hi:
+            return None
+        for _ in range(attempts):
+            cell = (random.randint(x_lo, x_hi), random.randint(y_lo, y_hi))
+            if cell in blocked or cell in self.wall_positions:
                 continue
-            self.food.position = candidate
-            break
+            return cell
+        return None
 
-    def _sacrifice_spawn_candidates(self) -> set[tuple[int, int]] | None:
-        if not self.sacrifice_playable_cells:
-            return None
-        if self.sacrifice_wall_open:
-            return self.sacrifice_playable_cells
-        if self.snake and self.snake.head in self.sacrifice_playable_cells:
-            reachable = self._flood_fill_sacrifice(self.snake.head)
-            if reachable:
-                return reachable
-        return self.sacrifice_left_cells or self.sacrifice_playable_cells
-
-    def _flood_fill_sacrifice(self, start: tuple[int, int]) -> set[tuple[int, int]]:
-        visited: set[tuple[int, int]] = set()
-        if not self.sacrifice_playable_cells:
-            return visited
-        if start not in self.sacrifice_playable_cells:
-            return visited
-        queue: deque[tuple[int, int]] = deque([start])
-        visited.add(start)
-        while queue:
-            x, y = queue.popleft()
-            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                nx, ny = x + dx, y + dy
-                pos = (nx, ny)
-                if pos in visited:
-                    continue
-                if pos not in self.sacrifice_playable_cells:
-                    continue
-                if pos in self.wall_positions:
-                    continue
-                visited.add(pos)
-                queue.append(pos)
-        return visited
+    def _place_big_board_gate(self, blocked: set[tuple[int, int]]):
+        head = self.snake.head
+        button = self._random_free_cell_near(head, blocked)
+        key = None
+        if button is not None:
+            min_gap = 4 + self.level
+            blocked = blocked | {button}
+            for _ in range(16):
+                candidate = self._random_free_cell_near(head, blocked)
+                if candidate is None:
+                    break
+                key = candidate
+                if abs(candidate[0] - button[0]) + abs(candidate[1] - button[1]) >= min_gap:
+                    break
+        self.button_pos = button
+        self.key_pos = key
+
+    def _sacrifice_spawn_candidates(self) -> list[tuple[int, int]]:
+        """Cells in the snake's region (both boxes once the separator is breached)."""
+        regions = self.sacrifice_regions
+        if regions is not None and self.snake and self.snake.head in regions:
+            return regions.region(self.snake.head)
+        return list(self.sacrifice_left_cells or self.sacrifice_playable_cells)
 
     def handle_events(self):
         for event in pygame.event.get():
@@ -671,6 +924,11 @@ class Game:
                 self.running = False
 
             if event.type == pygame.KEYDOWN:
+                self.menu_idle_since_ms = pygame.time.get_ticks()
+                if self.attract_active:
+                    self.attract_loop = False
+                    self.stop_attract()
+                    continue
                 if self.game_over:
                     if not self.score_recorded:
                         if event.key == pygame.K_RETURN:
@@ -744,6 +1002,12 @@ class Game:
                         elif event.key in (pygame.K_3, pygame.K_KP3):
                             self.speed_index = 2
                             self.speed_multiplier = self.speed_options[self.speed_index][1]
+                        elif event.key in (pygame.K_4, pygame.K_KP4):
+                            self.speed_index = 3
+                            self.speed_multiplier = self.speed_options[self.speed_index][1]
+                        elif event.key in (pygame.K_5, pygame.K_KP5):
+                            self.speed_index = 4
+                            self.speed_multiplier = self.speed_options[self.speed_index][1]
                         elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
                             if self.settings_index == 1:
                                 self.sound_on = not self.sound_on
@@ -834,14 +1098,19 @@ class Game:
                     self.running = False
 
     def update(self):
+        self._advance_scheduler()
+        if self.attract_active and self._update_attract():
+            return
         if not self.game_started:
-            if self.intro_active:
-                self.update_intro()
+            # The intro steps on the scheduler.
+            if not self.intro_active and self.menu_page == "main":
+                idle_limit_ms = 0 if self.attract_loop else self.attract_idle_ms
+                if pygame.time.get_ticks() - self.menu_idle_since_ms >= idle_limit_ms:
+                    self.start_attract()
             return
         if self.game_over or self.level_clear:
             return
         if self.story_active:
-            self.update_story()
             return
         if self.game_paused:
             self.last_frame_ms = pygame.time.get_ticks()
@@ -850,93 +1119,200 @@ class Game:
         now_ms = pygame.time.get_ticks()
         if self.last_frame_ms is None:
             self.last_frame_ms = now_ms
-        dt_ms = now_ms - self.last_frame_ms
+        frame_ms = now_ms - self.last_frame_ms
         self.last_frame_ms = now_ms
-        dt_ms = min(dt_ms, 200)
+        time_scale = self.scheduler.time_scale
+        dt_ms = min(frame_ms, self.MAX_FRAME_DT_MS) * time_scale
+        stalled_ms = frame_ms * time_scale - dt_ms
 
         if self.victory_active:
             self._update_victory(dt_ms)
             return
 
         if self.loading_active:
-            self.update_loading()
+            self._advance_level_prep()
             return
 
         if self.side_scroller_active:
-            self.update_side_scroller(dt_ms)
+            self.update_side_scroller(dt_ms, stalled_ms)
             return
 
-        move_interval_ms = 1000 / max(1e-6, FPS * self.speed_multiplier)
-        self.move_accumulator_ms += dt_ms
+        move_interval_ms = self.move_interval_ms
+        due = self._due_ticks(dt_ms, stalled_ms)
         self._update_sacrifice_shot(dt_ms)
-        updates = 0
-        max_updates = 5
-        while self.move_accumulator_ms >= move_interval_ms and not self.game_over:
-            self.move_accumulator_ms -= move_interval_ms
+        for _ in range(due):
+            if self.game_over:
+                break
+            if self.attract_active:
+                self._autopilot_step()
             self.snake.update()
+            if self.input_meter:
+                self.input_meter.on_tick()
             self.elapsed_time_ms += move_interval_ms
             self.input_locked = False
-            if self.queued_direction:
-                if self._direction_valid(self.queued_direction, self.snake.direction):
-                    self.snake.set_direction(self.queued_direction)
-                self.queued_direction = None
+            self._consume_buffered_direction()
             self.check_collisions()
             if self.game_over:
                 break
             self.check_food_eaten()
             self.check_key_reached()
             self._check_escape_transition()
-            updates += 1
-            if updates >= max_updates:
-                self.move_accumulator_ms = 0.0
-                break
 
-    def update_story(self):
-        now_ms = pygame.time.get_ticks()
-        if self.story_last_frame_ms is None:
-            self.story_last_frame_ms = now_ms
-        dt_ms = now_ms - self.story_last_frame_ms
-        self.story_last_frame_ms = now_ms
-        dt_ms = min(dt_ms, 200)
-        dt_ms = min(dt_ms, self.story_move_interval_ms)
-
-        self.story_move_accumulator_ms += dt_ms
-        updates = 0
-        max_updates = 4
-        while self.story_move_accumulator_ms >= self.story_move_interval_ms:
-            self.story_move_accumulator_ms -= self.story_move_interval_ms
-            self._advance_story_snake()
-            updates += 1
-            if updates >= max_updates:
-                self.story_move_accumulator_ms = 0.0
-                break
+    @property
+    def move_interval_ms(self) -> float:
+        return 1000 / max(1e-6, FPS * self.speed_multiplier)
+
+    def _due_ticks(self, dt_ms: float, stalled_ms: float = 0.0) -> int:
+        """Add ``dt_ms`` to the move accumulator and take out every whole tick that is due.
+
+        All due ticks run, however many a hitch leaves behind. Only time cut
+        off by ``MAX_FRAME_DT_MS`` (``stalled_ms``) is lost and counted in
+        ``dropped_ticks``; ticks after the first in one frame ran behind
+        schedule and count as ``late_ticks``.
+        """
+        interval_ms = self.move_interval_ms
+        if stalled_ms > 0:
+            self.dropped_ticks += round(stalled_ms / interval_ms)
+        self.move_accumulator_ms += dt_ms
+        due = int(self.move_accumulator_ms // interval_ms)
+        self.move_accumulator_ms -= due * interval_ms
+        self.sim_ticks += due
+        if due > 1:
+            self.late_ticks += due - 1
+        return due
+
+    def tick_report(self) -> str:
+        return (
+            f"simulation: {self.sim_ticks} ticks at {1000 / self.move_interval_ms:.0f} moves/s, "
+            f"late={self.late_ticks} dropped={self.dropped_ticks}"
+        )
 
-    def update_intro(self):
-        now_ms = pygame.time.get_ticks()
-        if self.intro_last_frame_ms is None:
-            self.intro_last_frame_ms = now_ms
-        dt_ms = now_ms - self.intro_last_frame_ms
-        self.intro_last_frame_ms = now_ms
-        dt_ms = min(dt_ms, 200)
-        dt_ms = min(dt_ms, self.intro_move_interval_ms)
-
-        self.intro_move_accumulator_ms += dt_ms
-        updates = 0
-        max_updates = 4
-        while self.intro_move_accumulator_ms >= self.intro_move_interval_ms:
-            self.intro_move_accumulator_ms -= self.intro_move_interval_ms
-            if self.intro_phase == "veil":
-                self._advance_intro_veil()
+    def start_attract(self):
+        """Start a demo run: the autopilot plays real levels until a key is pressed."""
+        self.start_game()
+        self.attract_active = True
+        self.attract_started_ms = pygame.time.get_ticks()
+        self.autopilot.reset()
+        self.level = 1 if self.big_board else random.randint(1, self.last_sacrifice_level)
+        self.complete_story()
+
+    def stop_attract(self):
+        self.exit_to_menu()
+        self.attract_active = False
+        self.menu_idle_since_ms = pygame.time.get_ticks()
+
+    def _update_attract(self) -> bool:
+        """Advance or end the demo; True when nothing else should update this frame."""
+        if self.game_over:
+            if self.attract_loop:
+                self.start_attract()
             else:
-                self._advance_intro_hero()
-            updates += 1
-            if updates >= max_updates:
-                self.intro_move_accumulator_ms = 0.0
-                break
+                self.stop_attract()
+            return True
+        if self.level_clear:
+            self.level_clear = False
+            self.level = self.level + 1 if self.level < self.last_sacrifice_level else 1
+            self.begin_loading()
+            return False
+        if not self.attract_loop and pygame.time.get_ticks() - self.attract_started_ms >= self.attract_duration_ms:
+            self.stop_attract()
+            return True
+        return False
+
+    def _autopilot_step(self):
+        """Steer (and shoot sacrifice walls) for the autopilot before the next move."""
+        snake = self.snake
+        if self._autopilot_should_shoot():
+            snake.set_direction((1, 0))
+            self.shoot_sacrifice()
+        passable = self._autopilot_passable()
+        self.autopilot.begin(self.layout_version, passable, snake.segments)
+        direction = self.autopilot.choose(
+            snake.segments,
+            snake.direction,
+            snake.grow_pending,
+            self._autopilot_goal(passable),
+            passable,
+        )
+        if direction is not None:
+            snake.set_direction(direction)
 
-    def update_side_scroller(self, dt_ms: float):
+    def _autopilot_passable(self):
+        walls = self.wall_positions
+        if self._in_sacrifice_levels() and self.sacrifice_playable_cells:
+            cells = self.sacrifice_playable_cells
+            return lambda cell: cell in cells and cell not in walls
+        cols, rows = self.board_cols, self.board_rows
+        return lambda cell: 0 <= cell[0] < cols and 0 <= cell[1] < rows and cell not in walls
+
+    def _autopilot_goal(self, passable) -> tuple[int, int] | None:
+        snake = self.snake
+        food = self.food.position if self.food else None
+        if self._in_sacrifice_levels() and not self.sacrifice_wall_open:
+            return food
+        if self.button_pos is None or self.key_pos is None:
+            return food
+        if self.level_food_eaten < self.required_food_for_level():
+            return food
+        # The body has to still cover the button when the head reaches the key;
+        # detours around the body need extra length, learned per layout.
+        button_covered = snake.occupies(self.button_pos, 1)
+        if self.autopilot.last_goal == self.key_pos and not button_covered:
+            self.autopilot.gate_slack += 2
+        needed = self.autopilot.distance(self.button_pos, self.key_pos, passable) + self.autopilot.gate_slack
+        if len(snake.segments) - 1 < needed:
+            return food
+        return self.key_pos if button_covered else self.button_pos
+
+    def _autopilot_should_shoot(self) -> bool:
+        if not self._in_sacrifice_levels() or self.sacrifice_wall_open:
+            return False
+        if self.sacrifice_ammo <= 0 or self.sacrifice_shot_active:
+            return False
+        if self.snake.direction == (-1, 0):
+            return False
+        head_x, head_y = self.snake.head
+        x = head_x + 1
+        while x < self.board_cols and (x, head_y) not in self.wall_positions:
+            x += 1
+        return (x, head_y) in self.breakable_wall_positions and x - head_x >= 3
+
+    def _advance_scheduler(self):
+        """Run the timers and tweens due this frame."""
+        now_ms = pygame.time.get_ticks()
+        if self.scheduler_last_ms is None:
+            self.scheduler_last_ms = now_ms
+        frame_ms = now_ms - self.scheduler_last_ms
+        self.scheduler_last_ms = now_ms
+        self.scheduler.paused = self.game_paused
+        self.scheduler.advance(min(frame_ms, self.MAX_FRAME_DT_MS))
+
+    @staticmethod
+    def _stop_timer(timer: Timer | None):
+        if timer is not None:
+            timer.cancel()
+
+    def _story_step(self):
+        if not self.story_active:
+            self._stop_timer(self.story_timer)
+            return
+        self._advance_story_snake()
+
+    def _intro_step(self):
+        if not self.intro_active or self.game_started:
+            self._stop_timer(self.intro_timer)
+            return
+        if self.intro_phase == "veil":
+            self._advance_intro_veil()
+        else:
+            self._advance_intro_hero()
+
+    def update_side_scroller(self, dt_ms: float, stalled_ms: float = 0.0):
         if not self.snake:
             return
+        if self.endless_world is not None:
+            self._update_endless(dt_ms, stalled_ms)
+            return
 
         self._update_starfield(dt_ms)
         self._update_space_fade(dt_ms)
@@ -946,35 +1322,31 @@ class Game:
             return
         self._update_boss_bullets(dt_ms)
 
-        move_interval_ms = 1000 / max(1e-6, FPS * self.speed_multiplier)
-        self.move_accumulator_ms += dt_ms
-        updates = 0
-        max_updates = 5
-        while self.move_accumulator_ms >= move_interval_ms and not self.game_over:
-            self.move_accumulator_ms -= move_interval_ms
+        move_interval_ms = self.move_interval_ms
+        due = self._due_ticks(dt_ms, stalled_ms)
+        for _ in range(due):
+            if self.game_over:
+                break
             self.elapsed_time_ms += move_interval_ms
             self.input_locked = False
-            if self.queued_direction:
-                if self._direction_valid(self.queued_direction, self.snake.direction):
-                    self.snake.set_direction(self.queued_direction)
-                self.queued_direction = None
 
             head_x, _ = self.snake.head
             if self.snake.pending_direction == (-1, 0) and head_x <= self.side_scroller_left_lock:
-                updates += 1
-                if updates >= max_updates:
-                    self.move_accumulator_ms = 0.0
-                continue
-
-            self.snake.update()
-            self._apply_side_scroller_bounds()
-            self.check_food_eaten()
-            updates += 1
-            if updates >= max_updates:
-                self.move_accumulator_ms = 0.0
-                break
+                self._consume_buffered_direction()
+            else:
+                self.snake.update()
+                if self.input_meter:
+                    self.input_meter.on_tick()
+                # Turn after moving, as in update(), so buffered turns chain.
+                self._consume_buffered_direction()
+                self._apply_side_scroller_bounds()
+                self.check_food_eaten()
+            # Every tick, so a burst of fast moves cannot pass through bullets.
+            self._check_side_scroller_collisions()
 
-        self._check_side_scroller_collisions()
+        if not due:
+            # Bullets still move on frames without a tick.
+            self._check_side_scroller_collisions()
 
     def _apply_side_scroller_bounds(self):
         if not self.snake:
@@ -993,6 +1365,104 @@ class Game:
             self.snake.segments[0] = (head_x, head_y)
             self.snake.reset_interpolation()
 
+    def start_endless(self):
+        """Start an endless side-scroller run (``--endless``)."""
+        self.level = 1
+        self.level_start_points = self.points
+        self.level_start_time_ms = self.elapsed_time_ms
+        self.snake = Snake(grid_pos=(5, 5), run_body=self.run_body)
+        self.food = Food()
+        self.food.position = None
+        if self.food_field is not None:
+            self.scheduler.cancel_group("food")
+            self.food_field.clear()
+        self.wall_positions.clear()
+        self.wall_chunks.reset()
+        self.layout_version += 1
+        self.breakable_wall_positions.clear()
+        self.button_pos = None
+        self.key_pos = None
+        self.playable_cells = None
+        self.level_food_eaten = 0
+        self.sacrifice_ammo = 0
+        self.side_scroller_left_lock = 0
+        self.side_scroller_camera_x = 0.0
+        self.endless_world = EndlessWorld(GRID_HEIGHT, GRID_WIDTH)
+        self.endless_world.stream(0.0)
+        SURFACE_LEDGER.unpin(self.wall_chunks)
+        SURFACE_LEDGER.pin(self.endless_world)
+        self._reset_starfield()
+        self._init_boss()
+        self.side_scroller_active = True
+        self.loading_active = False
+        self.story_active = False
+
+        y = GRID_HEIGHT // 2
+        self.snake.segments = [(4 - i, y) for i in range(3)]
+        self.snake.direction = (1, 0)
+        self.snake.pending_direction = (1, 0)
+        self.snake.reset_interpolation()
+        self.last_frame_ms = pygame.time.get_ticks()
+        self.move_accumulator_ms = 0.0
+        self.input_locked = False
+        self.direction_buffer.clear()
+
+    def endless_distance(self) -> int:
+        return int(self.side_scroller_camera_x)
+
+    def _update_endless(self, dt_ms: float, stalled_ms: float = 0.0):
+        """``update_side_scroller`` for endless runs: the world streams past the camera."""
+        world = self.endless_world
+        self._update_starfield(dt_ms)
+        self._update_player_shots(dt_ms)
+        world.update_enemies(dt_ms, self.side_scroller_camera_x)
+
+        move_interval_ms = self.move_interval_ms
+        for _ in range(self._due_ticks(dt_ms, stalled_ms)):
+            if self.game_over:
+                break
+            self.elapsed_time_ms += move_interval_ms
+            self.input_locked = False
+
+            head_x, _ = self.snake.head
+            left_lock = math.ceil(self.side_scroller_camera_x)
+            if self.snake.pending_direction == (-1, 0) and head_x <= left_lock:
+                self._consume_buffered_direction()
+                continue
+
+            self.snake.update()
+            if self.input_meter:
+                self.input_meter.on_tick()
+            self._consume_buffered_direction()
+            head_x, head_y = self.snake.head
+            if not 0 <= head_y < GRID_HEIGHT:
+                self.snake.segments[0] = (head_x, head_y % GRID_HEIGHT)
+                self.snake.reset_interpolation()
+            head = self.snake.head
+            if world.blocked(head):
+                self._trigger_game_over("wall")
+                break
+            if self._snake_hit_self():
+                self._trigger_game_over("self")
+                break
+            if world.take_food(head):
+                self.snake.grow(1)
+                self.points += 1
+                self.level_food_eaten += 1
+                self.sacrifice_ammo += 1
+
+        # The camera only moves forward; chunks it leaves behind are evicted.
+        target_x = max(0.0, self.snake.head[0] - GRID_WIDTH * 0.35)
+        if target_x > self.side_scroller_camera_x:
+            blend = min(1.0, max(0.0, dt_ms / 280.0))
+            self.side_scroller_camera_x += (target_x - self.side_scroller_camera_x) * blend
+        world.stream(self.side_scroller_camera_x)
+        if self.game_over:
+            return
+        enemy_cells = set(world.enemy_cells())
+        if enemy_cells and any(segment in enemy_cells for segment in self.snake.segments):
+            self._trigger_game_over("enemy")
+
     def _check_escape_transition(self):
         if not self._in_escape_level() or self.side_scroller_active:
             return
@@ -1007,8 +1477,10 @@ class Game:
             return
         self.side_scroller_active = True
         self.side_scroller_camera_x = 0.0
+        self.endless_world = None
         self.wall_positions.clear()
-        self.wall_layer_dirty = True
+        self.wall_chunks.reset()
+        self.layout_version += 1
         self.breakable_wall_positions.clear()
         self.button_pos = None
         self.key_pos = None
@@ -1019,7 +1491,7 @@ class Game:
         self.boss_bullets.clear()
         self.side_scroller_food_eaten = 0
         self.space_fade = 0.0
-        self.space_fade_time_ms = 0.0
+        self.scheduler.cancel_group("space fade")
         self.space_fade_active = False
         self._reset_starfield()
         self._init_boss()
@@ -1035,38 +1507,27 @@ class Game:
         self.snake.pending_direction = (1, 0)
         self.snake.reset_interpolation()
         self.spawn_food()
+        self._fill_food_field()
         self.last_frame_ms = pygame.time.get_ticks()
         self.move_accumulator_ms = 0.0
         self.input_locked = False
-        self.queued_direction = None
+        self.direction_buffer.clear()
 
     def _reset_starfield(self):
-        self.starfield = []
-        for _ in range(self.star_count):
-            self.starfield.append(
-                {
-                    "x": random.uniform(0, SCREEN_WIDTH),
-                    "y": random.uniform(HUD_HEIGHT, SCREEN_HEIGHT),
-                    "speed": random.uniform(*self.star_speed_range),
-                    "size": random.randint(1, 3),
-                    "glow": random.randint(160, 255),
-                }
-            )
+        self.starfield = ParallaxStarfield(
+            SCREEN_WIDTH,
+            PLAYFIELD_HEIGHT,
+            self.star_count,
+            self.star_speed_range,
+            dense_factor=self.boss_star_density,
+        )
 
     def _update_starfield(self, dt_ms: float):
         if not self.starfield:
             return
-        dt_sec = max(0.0, dt_ms / 1000.0)
-        for star in self.starfield:
-            star["x"] -= star["speed"] * dt_sec
-            if star["x"] < -4:
-                star["x"] = SCREEN_WIDTH + random.uniform(0, SCREEN_WIDTH * 0.2)
-                star["y"] = random.uniform(HUD_HEIGHT, SCREEN_HEIGHT)
-                star["speed"] = random.uniform(*self.star_speed_range)
-                star["size"] = random.randint(1, 3)
-                star["glow"] = random.randint(160, 255)
-            elif random.random() < 0.02:
-                star["glow"] = random.randint(160, 255)
+        # Dense layers fade in with the space fade ahead of the boss.
+        self.starfield.boost = self.space_fade
+        self.starfield.update(dt_ms)
 
     def _update_space_fade(self, dt_ms: float):
         if not self.snake:
@@ -1078,20 +1539,25 @@ class Game:
                 and head_x >= self.side_scroller_trigger_x
             ):
                 self.space_fade_active = True
+                self.scheduler.tween(
+                    self.space_fade_duration_ms,
+                    self._set_space_fade,
+                    self._finish_space_fade,
+                    group="space fade",
+                )
 
-        if not self.space_fade_active:
-            return
+    def _set_space_fade(self, value: float):
+        self.space_fade = value
 
-        self.space_fade_time_ms += dt_ms
-        self.space_fade = min(1.0, self.space_fade_time_ms / max(1.0, self.space_fade_duration_ms))
-        if self.space_fade >= 1.0 and self.boss_state == "hidden":
+    def _finish_space_fade(self):
+        if self.boss_state == "hidden":
             self._start_boss_approach()
 
     def _init_boss(self):
         boss_y = max(1, (GRID_HEIGHT - self.boss_height) // 2)
         self.boss_pos = (GRID_WIDTH + 2, float(boss_y))
         self.boss_dir = 1
-        self.boss_fire_timer_ms = 0.0
+        self.scheduler.cancel_group("boss fire")
         self.boss_target_x = GRID_WIDTH - self.boss_width - 2
         self.boss_hp = 10
         self.boss_active = False
@@ -1101,7 +1567,7 @@ class Game:
         boss_y = max(1, (GRID_HEIGHT - self.boss_height) // 2)
         self.boss_pos = (GRID_WIDTH + 2, float(boss_y))
         self.boss_dir = 1
-        self.boss_fire_timer_ms = 0.0
+        self.scheduler.cancel_group("boss fire")
         self.boss_hp = 10
         self.boss_active = True
         self.boss_state = "approach"
@@ -1116,6 +1582,7 @@ class Game:
             if boss_x <= self.boss_target_x:
                 boss_x = self.boss_target_x
                 self.boss_state = "active"
+                self.scheduler.every(self.boss_fire_interval_ms, self._fire_boss_bullet, group="boss fire")
             self.boss_pos = (boss_x, boss_y)
             return
 
@@ -1133,13 +1600,8 @@ class Game:
             self.boss_dir = -1
         self.boss_pos = (boss_x, boss_y)
 
-        self.boss_fire_timer_ms += dt_ms
-        if self.boss_fire_timer_ms >= self.boss_fire_interval_ms:
-            self.boss_fire_timer_ms = 0.0
-            self._fire_boss_bullet()
-
     def _fire_boss_bullet(self):
-        if not self.boss_active:
+        if not self.boss_active or self.boss_state != "active":
             return
         boss_x, boss_y = self.boss_pos
         center_x = boss_x + self.boss_width * 0.5
@@ -1161,10 +1623,12 @@ class Game:
         for shot in self.player_shots:
             shot["x"] += shot["vx"] * self.player_shot_speed * dt_sec
             shot["y"] += shot["vy"] * self.player_shot_speed * dt_sec
-            if shot["x"] > GRID_WIDTH + 1 or shot["x"] < -2:
+            if shot["x"] > self.side_scroller_camera_x + GRID_WIDTH + 1 or shot["x"] < self.side_scroller_camera_x - 2:
                 continue
             if shot["y"] > GRID_HEIGHT + 1 or shot["y"] < -2:
                 continue
+            if self.endless_world is not None and self.endless_world.shoot(shot["x"], shot["y"]):
+                continue
             if self.boss_active and self._shot_hits_boss(shot["x"], shot["y"]):
                 self.boss_hp -= 1
                 if self.boss_hp <= 0:
@@ -1210,13 +1674,13 @@ class Game:
         if not self.snake:
             return
         if self._snake_hit_self():
-            self._trigger_game_over()
+            self._trigger_game_over("self")
             return
         head_x, head_y = self.snake.head
         if self.boss_active:
             bx, by, bw, bh = self._boss_contact_hitbox_cells()
             if bx <= head_x < bx + bw and by <= head_y < by + bh:
-                self._trigger_game_over()
+                self._trigger_game_over("boss")
                 return
 
         if not self.boss_bullets:
@@ -1224,12 +1688,13 @@ class Game:
         for bullet in self.boss_bullets:
             for seg in self.snake.segments:
                 if abs((seg[0] + 0.5) - bullet["x"]) <= 0.4 and abs((seg[1] + 0.5) - bullet["y"]) <= 0.4:
-                    self._trigger_game_over()
+                    self._trigger_game_over("bullet")
                     return
 
     def _finish_boss(self):
         self.boss_active = False
         self.boss_state = "defeated"
+        self.scheduler.cancel_group("boss fire")
         self.player_shots.clear()
         self.boss_bullets.clear()
         self._start_victory_sequence()
@@ -1237,8 +1702,9 @@ class Game:
     def _reset_victory_state(self):
         self.victory_active = False
         self.victory_phase = "none"
-        self.victory_phase_time_ms = 0.0
+        self.victory_message_alpha = 0.0
         self.victory_particles = []
+        self.scheduler.cancel_group("victory")
 
     def _start_victory_sequence(self):
         if not self.snake:
@@ -1246,15 +1712,18 @@ class Game:
             return
 
         self.victory_active = True
+        self.death_cause = "victory"
         self.victory_phase = "explode"
-        self.victory_phase_time_ms = 0.0
+        self.victory_message_alpha = 0.0
+        self.scheduler.cancel_group("victory")
+        self.scheduler.after(self.victory_explosion_duration_ms, self._start_victory_flyout, group="victory")
         self.victory_particles = self._build_victory_particles()
         self.side_scroller_active = True
         self.side_scroller_camera_x = max(0.0, self.snake.head[0] - GRID_WIDTH * 0.35)
         self.name_input = ""
         self.score_recorded = False
         self.input_locked = True
-        self.queued_direction = None
+        self.direction_buffer.clear()
         self.last_frame_ms = pygame.time.get_ticks()
         self.move_accumulator_ms = 0.0
 
@@ -1295,32 +1764,32 @@ class Game:
         self._update_starfield(dt_ms)
         self._update_victory_particles(dt_ms)
 
-        if self.victory_phase == "explode":
-            self.victory_phase_time_ms += dt_ms
-            if self.victory_phase_time_ms >= self.victory_explosion_duration_ms:
-                self.victory_phase = "flyout"
-                self.victory_phase_time_ms = 0.0
-                if self.snake:
-                    self.snake.direction = (1, 0)
-                    self.snake.pending_direction = (1, 0)
-                    self.snake.reset_interpolation()
-            return
-
         if self.victory_phase == "flyout":
-            self.victory_phase_time_ms += dt_ms
             self._advance_victory_snake(dt_ms)
             self._update_victory_camera(dt_ms)
-            if self.victory_phase_time_ms >= self.victory_fly_duration_ms:
-                self.victory_phase = "message"
-                self.victory_phase_time_ms = 0.0
-            return
 
-        if self.victory_phase == "message":
-            self.victory_phase_time_ms += dt_ms
-            if self.victory_phase_time_ms >= self.victory_message_fade_ms:
-                self.victory_phase = "name_entry"
-                self.victory_phase_time_ms = self.victory_message_fade_ms
-            return
+    def _start_victory_flyout(self):
+        self.victory_phase = "flyout"
+        if self.snake:
+            self.snake.direction = (1, 0)
+            self.snake.pending_direction = (1, 0)
+            self.snake.reset_interpolation()
+        self.scheduler.after(self.victory_fly_duration_ms, self._start_victory_message, group="victory")
+
+    def _start_victory_message(self):
+        self.victory_phase = "message"
+        self.scheduler.tween(
+            self.victory_message_fade_ms,
+            self._set_victory_message_alpha,
+            self._start_victory_name_entry,
+            group="victory",
+        )
+
+    def _set_victory_message_alpha(self, value: float):
+        self.victory_message_alpha = value
+
+    def _start_victory_name_entry(self):
+        self.victory_phase = "name_entry"
 
     def _update_victory_particles(self, dt_ms: float):
         if not self.victory_particles:
@@ -1340,20 +1809,12 @@ class Game:
     def _advance_victory_snake(self, dt_ms: float):
         if not self.snake:
             return
-        move_interval_ms = 1000 / max(1e-6, FPS * self.speed_multiplier)
-        self.move_accumulator_ms += dt_ms
-        updates = 0
-        max_updates = 6
-        while self.move_accumulator_ms >= move_interval_ms:
-            self.move_accumulator_ms -= move_interval_ms
+        move_interval_ms = self.move_interval_ms
+        for _ in range(self._due_ticks(dt_ms)):
             self.elapsed_time_ms += move_interval_ms
             self.snake.direction = (1, 0)
             self.snake.pending_direction = (1, 0)
             self.snake.update()
-            updates += 1
-            if updates >= max_updates:
-                self.move_accumulator_ms = 0.0
-                break
 
     def _update_victory_camera(self, dt_ms: float):
         if not self.snake:
@@ -1366,7 +1827,7 @@ class Game:
         if not self.victory_active:
             return 0.0
         if self.victory_phase == "message":
-            return min(1.0, self.victory_phase_time_ms / max(1.0, self.victory_message_fade_ms))
+            return self.victory_message_alpha
         if self.victory_phase == "name_entry":
             return 1.0
         return 0.0
@@ -1387,23 +1848,23 @@ class Game:
 
         if self._in_sacrifice_levels():
             if not self.sacrifice_playable_cells or (head_x, head_y) not in self.sacrifice_playable_cells:
-                self._trigger_game_over()
+                self._trigger_game_over("wall")
                 return
             if self._snake_hit_self():
-                self._trigger_game_over()
+                self._trigger_game_over("self")
             return
 
         # Wall collision ends game
-        if head_x < 0 or head_x >= GRID_WIDTH or head_y < 0 or head_y >= GRID_HEIGHT:
-            self._trigger_game_over()
+        if head_x < 0 or head_x >= self.board_cols or head_y < 0 or head_y >= self.board_rows:
+            self._trigger_game_over("wall")
             return
 
         if (head_x, head_y) in self.wall_positions:
-            self._trigger_game_over()
+            self._trigger_game_over("wall")
             return
 
         if self._snake_hit_self():
-            self._trigger_game_over()
+            self._trigger_game_over("self")
 
     def check_food_eaten(self):
         if self.snake.head == self.food.position:
@@ -1414,6 +1875,19 @@ class Game:
             if self.side_scroller_active:
                 self.side_scroller_food_eaten += 1
             self.spawn_food()
+            return
+        if self.food_field is None:
+            return
+        item = self.food_field.take(self.snake.head)
+        if item is None:
+            return
+        self.snake.grow(item.kind.growth)
+        self.points += item.kind.points
+        self.level_food_eaten += 1
+        self.sacrifice_ammo += 1
+        if self.side_scroller_active:
+            self.side_scroller_food_eaten += 1
+        self._spawn_field_food()
 
     def check_key_reached(self):
         if self.key_pos is None or self.button_pos is None:
@@ -1479,7 +1953,7 @@ class Game:
         self.intro_active = False
         self.intro_done = True
         self.input_locked = False
-        self.queued_direction = None
+        self.direction_buffer.clear()
         self.sacrifice_shot_active = False
         self.sacrifice_explosions.clear()
         self.side_scroller_active = False
@@ -1490,9 +1964,9 @@ class Game:
         self.boss_state = "hidden"
         self._reset_victory_state()
         self.space_fade = 0.0
-        self.space_fade_time_ms = 0.0
+        self.scheduler.cancel_group("space fade")
         self.space_fade_active = False
-        self.starfield = []
+        self.starfield = None
 
         self.start_music()
         self.level = self.escape_level
@@ -1526,11 +2000,102 @@ class Game:
             self.draw_pause_screen()
         elif self.side_scroller_active:
             self.draw_side_scroller()
+        elif self.texture_backend is not None and not self._sacrifice_effects_active():
+            self.draw_playfield_textured()
         else:
             self.draw_playfield()
+            self.present()
+
+    def present(self):
+        """Show ``self.screen``: flip the display or upload it to the texture backend."""
+        if self.texture_backend is None:
             pygame.display.flip()
+        else:
+            self.texture_backend.present_frame()
+
+    def draw_playfield_textured(self):
+        """``draw_playfield`` through the texture backend, then present.
+
+        Background, grid, wall chunks and sprites are cached textures; only
+        the HUD band is drawn with Surface calls and re-uploaded each frame.
+        """
+        backend = self.texture_backend
+        move_interval_ms = self.move_interval_ms
+        alpha = self._movement_alpha(self.move_accumulator_ms, move_interval_ms)
+        scroll_x = scroll_y = 0
+        bounds = None
+        if self.camera is not None:
+            if self.snake:
+                self.camera.center_on(self._camera_target(alpha))
+            scroll_x, scroll_y = self.camera.offset_px()
+            bounds = self.camera.visible_tiles()
+        offset_y = HUD_HEIGHT + scroll_y
+
+        def in_view(pos) -> bool:
+            return pos is not None and (bounds is None or Camera.contains(bounds, pos))
+
+        backend.clear()
+        background = self.background if self.board_background is None else self.board_background
+        backend.copy(background, (0, HUD_HEIGHT))
+        overlay, area = grid_overlay(scroll=(scroll_x, scroll_y))
+        backend.copy(overlay, (0, HUD_HEIGHT), area)
+        backend.copy_many(
+            self.wall_chunks.visible_blits(
+                self.wall_positions,
+                self.breakable_wall_positions,
+                (scroll_x, offset_y),
+                bounds,
+            )
+        )
+
+        if self.food and in_view(self.food.position):
+            x, y = self.food.position
+            dest = (x * TILE_SIZE + scroll_x, y * TILE_SIZE + offset_y)
+            if self.food.image:
+                backend.copy(self.food.image, dest)
+            else:
+                backend.fill_rect(COLOR_FOOD, (*dest, TILE_SIZE, TILE_SIZE))
+        if self.food_field:
+            backend.copy_many(self.food_field.blits(offset_y, scroll_x, bounds))
+        if in_view(self.button_pos):
+            x, y = self.button_pos
+            backend.fill_rect(COLOR_BUTTON, (x * TILE_SIZE + scroll_x, y * TILE_SIZE + offset_y, TILE_SIZE, TILE_SIZE))
+        if self.snake and in_view(self.key_pos):
+            x, y = self.key_pos
+            dest = (x * TILE_SIZE + scroll_x, y * TILE_SIZE + offset_y)
+            if self.key_image:
+                backend.copy(self.key_image, dest)
+            else:
+                backend.fill_rect(COLOR_KEY, (*dest, TILE_SIZE, TILE_SIZE))
+            if not can_open_gate(
+                self.level_food_eaten,
+                self._gate_button_active(),
+                self.required_food_for_level(),
+            ):
+                backend.fill_rect((0, 0, 0, 120), (*dest, TILE_SIZE, TILE_SIZE))
+        if self.snake:
+            self.snake.draw_textured(backend, offset_y, alpha=alpha, offset_x_px=scroll_x, visible=bounds)
+
+        self.draw_hud_band()
+        self.draw_hud()
+        backend.copy_frame(pygame.Rect(0, 0, SCREEN_WIDTH, HUD_HEIGHT))
+        if self.attract_active:
+            label, rect = self._attract_label_placement()
+            backend.copy(label, rect.topleft)
+        backend.present()
+
+    def _sacrifice_effects_active(self) -> bool:
+        return bool(self.sacrifice_shot_active or self.sacrifice_explosions)
 
     def draw_playfield(self):
+        if self.camera is not None:
+            move_interval_ms = self.move_interval_ms
+            self._draw_board_view(self._movement_alpha(self.move_accumulator_ms, move_interval_ms))
+            self.draw_hud_band()
+            self.draw_hud()
+            self._draw_attract_label()
+            return
+
         self.screen.fill((0, 0, 0))
         self.screen.blit(self.background, (0, HUD_HEIGHT))
         draw_grid(self.screen, offset_y=HUD_HEIGHT)
@@ -1539,15 +2104,67 @@ class Game:
 
         if self.food:
             self.food.draw(self.screen, HUD_HEIGHT)
+        if self.food_field:
+            self.food_field.draw(self.screen, HUD_HEIGHT)
         self.draw_button()
         self.draw_key()
-        move_interval_ms = 1000 / max(1e-6, FPS * self.speed_multiplier)
+        move_interval_ms = self.move_interval_ms
         alpha = self._movement_alpha(self.move_accumulator_ms, move_interval_ms)
         if self.snake:
             self.snake.draw(self.screen, HUD_HEIGHT, alpha=alpha)
 
         self.draw_hud_band()
         self.draw_hud()
+        self._draw_attract_label()
+
+    def _draw_attract_label(self):
+        if not self.attract_active:
+            return
+        label, rect = self._attract_label_placement()
+        self.screen.blit(label, rect)
+
+    def _attract_label_placement(self) -> tuple[pygame.Surface, pygame.Rect]:
+        if self._attract_label is None:
+            self._attract_label = self.menu_prompt_font.render("DEMO - press any key", True, COLOR_HUD)
+        return self._attract_label, self._attract_label.get_rect(midbottom=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 8))
+
+    def _draw_board_view(self, alpha: float):
+        """Draw the camera's view of a big board, touching only visible tiles."""
+        camera = self.camera
+        if self.snake:
+            camera.center_on(self._camera_target(alpha))
+        scroll_x, scroll_y = camera.offset_px()
+        offset_y = HUD_HEIGHT + scroll_y
+        bounds = camera.visible_tiles()
+
+        self.screen.fill((0, 0, 0))
+        self.screen.blit(self.board_background, (0, HUD_HEIGHT))
+        draw_grid(self.screen, offset_y=HUD_HEIGHT, scroll=(scroll_x, scroll_y))
+        self.wall_chunks.draw(
+            self.screen,
+            self.wall_positions,
+            self.breakable_wall_positions,
+            (scroll_x, offset_y),
+            bounds,
+        )
+
+        if self.food and self.food.position is not None and Camera.contains(bounds, self.food.position):
+            self.food.draw(self.screen, offset_y, offset_x_px=scroll_x)
+        if self.food_field:
+            self.food_field.draw(self.screen, offset_y, scroll_x, bounds)
+        if self.button_pos and Camera.contains(bounds, self.button_pos):
+            self.draw_button(scroll_x, offset_y)
+        if self.key_pos and Camera.contains(bounds, self.key_pos):
+            self.draw_key(scroll_x, offset_y)
+        if self.snake:
+            self.snake.draw(self.screen, offset_y, alpha=alpha, offset_x_px=scroll_x, visible=bounds)
+
+    def _camera_target(self, alpha: float) -> tuple[float, float]:
+        head_x, head_y = self.snake.head
+        if not self.snake.interp_ready:
+            return head_x, head_y
+        prev_x, prev_y = self.snake.prev_head
+        return prev_x + (head_x - prev_x) * alpha, prev_y + (head_y - prev_y) * alpha
 
     def draw_side_scroller(self, flip: bool = True):
         camera_offset_px = int(round(self.side_scroller_camera_x * TILE_SIZE))
@@ -1559,13 +2176,22 @@ class Game:
             self.screen.blit(overlay, (0, HUD_HEIGHT))
         self._draw_starfield()
 
+        visible = None
+        if self.endless_world is not None:
+            self.endless_world.draw(
+                self.screen, camera_offset_px, HUD_HEIGHT, self.food.image if self.food else None
+            )
+            left = camera_offset_px // TILE_SIZE
+            visible = (left, 0, left + GRID_WIDTH + 1, GRID_HEIGHT)
         if self.food and not self.victory_active:
             self.food.draw(self.screen, HUD_HEIGHT)
+            if self.food_field:
+                self.food_field.draw(self.screen, HUD_HEIGHT)
         self._draw_boss(camera_offset_px)
-        move_interval_ms = 1000 / max(1e-6, FPS * self.speed_multiplier)
+        move_interval_ms = self.move_interval_ms
         alpha = self._movement_alpha(self.move_accumulator_ms, move_interval_ms)
         if self.snake:
-            self.snake.draw(self.screen, HUD_HEIGHT, alpha=alpha, offset_x_px=-camera_offset_px)
+            self.snake.draw(self.screen, HUD_HEIGHT, alpha=alpha, offset_x_px=-camera_offset_px, visible=visible)
         self._draw_player_shots(camera_offset_px)
         self._draw_boss_bullets(camera_offset_px)
         self._draw_victory_particles(camera_offset_px)
@@ -1575,7 +2201,7 @@ class Game:
             self.draw_hud()
         self._draw_victory_overlay()
         if flip:
-            pygame.display.flip()
+            self.present()
 
     def _build_boss_sprite(self) -> pygame.Surface | None:
         size = (self.boss_width * TILE_SIZE, self.boss_height * TILE_SIZE)
@@ -1609,20 +2235,12 @@ class Game:
         self.screen.blit(title_text, title_rect)
         self.screen.blit(prompt_text, prompt_rect)
         self.screen.blit(esc_text, esc_rect)
-        pygame.display.flip()
+        self.present()
 
     def _draw_starfield(self):
         if not self.starfield:
             return
-        for star in self.starfield:
-            glow = int(star["glow"])
-            color = (glow, glow, min(255, glow + 40))
-            pygame.draw.circle(
-                self.screen,
-                color,
-                (int(star["x"]), int(star["y"])),
-                int(star["size"]),
-            )
+        self.starfield.draw(self.screen, HUD_HEIGHT)
 
     def _draw_player_shots(self, camera_offset_px: int = 0):
         if not self.player_shots:
@@ -1731,7 +2349,7 @@ class Game:
 
         if self.story_snake:
             alpha = self._movement_alpha(
-                self.story_move_accumulator_ms,
+                self.scheduler.elapsed(self.story_timer),
                 self.story_move_interval_ms,
             )
             self.story_snake.draw(self.screen, HUD_HEIGHT, alpha=alpha)
@@ -1764,7 +2382,7 @@ class Game:
         esc_rect = esc_text.get_rect(center=(SCREEN_WIDTH // 2, box_rect.bottom + 48))
         self.screen.blit(prompt_text, prompt_rect)
         self.screen.blit(esc_text, esc_rect)
-        pygame.display.flip()
+        self.present()
 
     def draw_intro_screen(self):
         if self.start_bg:
@@ -1780,12 +2398,12 @@ class Game:
             self.start_bg_alt.set_alpha(255)
 
         intro_alpha = self._movement_alpha(
-            self.intro_move_accumulator_ms,
+            self.scheduler.elapsed(self.intro_timer),
             self.intro_move_interval_ms,
         )
         if self.intro_phase == "veil":
-            for snake in self.intro_veil_snakes:
-                snake.draw(self.screen, 0, alpha=intro_alpha)
+            if self.intro_veil:
+                self.intro_veil.draw(self.screen, alpha=intro_alpha)
         else:
             if self.intro_hero_done:
                 intro_alpha = 0.0
@@ -1795,20 +2413,20 @@ class Game:
         prompt_text = self.menu_prompt_font.render("Press any key to skip", True, COLOR_HUD)
         prompt_rect = prompt_text.get_rect(midbottom=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 18))
         self.screen.blit(prompt_text, prompt_rect)
-        pygame.display.flip()
+        self.present()
 
-    def draw_button(self):
+    def draw_button(self, offset_x_px: int = 0, offset_y: int = HUD_HEIGHT):
         if not self.button_pos:
             return
         x, y = self.button_pos
-        rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE + HUD_HEIGHT, TILE_SIZE, TILE_SIZE)
+        rect = pygame.Rect(x * TILE_SIZE + offset_x_px, y * TILE_SIZE + offset_y, TILE_SIZE, TILE_SIZE)
         pygame.draw.rect(self.screen, COLOR_BUTTON, rect)
 
-    def draw_key(self):
+    def draw_key(self, offset_x_px: int = 0, offset_y: int = HUD_HEIGHT):
         if not self.key_pos or not self.snake:
             return
         x, y = self.key_pos
-        dest = (x * TILE_SIZE, y * TILE_SIZE + HUD_HEIGHT)
+        dest = (x * TILE_SIZE + offset_x_px, y * TILE_SIZE + offset_y)
         if self.key_image:
             self.screen.blit(self.key_image, dest)
         else:
@@ -1825,12 +2443,12 @@ class Game:
             self.screen.blit(lock_overlay, dest)
 
     def draw_walls(self):
-        if not self.wall_positions:
-            return
-        if self.wall_layer is None or self.wall_layer_dirty:
-            self._rebuild_wall_layer()
-        if self.wall_layer is not None:
-            self.screen.blit(self.wall_layer, (0, HUD_HEIGHT))
+        self.wall_chunks.draw(
+            self.screen,
+            self.wall_positions,
+            self.breakable_wall_positions,
+            (0, HUD_HEIGHT),
+        )
 
     def _build_sacrifice_shot_images(self) -> dict[tuple[int, int], pygame.Surface]:
         size = self.sacrifice_shot_size
@@ -1880,9 +2498,7 @@ class Game:
 
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         for explosion in self.sacrifice_explosions:
-            elapsed = explosion["elapsed"]
-            duration = max(1.0, explosion["duration"])
-            progress = min(1.0, max(0.0, elapsed / duration))
+            progress = explosion["tween"].value
             grid_x, grid_y = explosion["pos"]
             center = (
                 grid_x * TILE_SIZE + TILE_SIZE // 2,
@@ -1906,10 +2522,13 @@ class Game:
 
     def draw_hud(self):
         elapsed = self.format_elapsed_time()
-        cache_key = (self.points, self.level, elapsed)
+        if self.endless_world is not None:
+            level_label = f"Distance: {self.endless_distance()}"
+        else:
+            level_label = f"Level: {self.level}"
+        cache_key = (self.points, level_label, elapsed)
         if self._hud_cache_key != cache_key:
             score_label = f"Score: {self.points}"
-            level_label = f"Level: {self.level}"
             time_label = f"Time: {elapsed}"
             shadow_color = (0, 0, 0)
             self._hud_surfaces = {
@@ -1947,8 +2566,9 @@ class Game:
         """Safe sound hook (no-op if audio assets are missing)."""
         return
 
-    def _trigger_game_over(self):
+    def _trigger_game_over(self, cause: str = "unknown"):
         self.play_sound("death")
+        self.death_cause = cause
         self.game_over = True
         self.game_started = False
         self.game_paused = False
@@ -1957,23 +2577,12 @@ class Game:
     def _snake_hit_self(self) -> bool:
         if not self.snake or len(self.snake.segments) < 4:
             return False
-        return self.snake.head in self.snake.segments[1:]
+        return self.snake.occupies(self.snake.head, 1)
 
     def _gate_button_active(self) -> bool:
         if not self.snake or self.button_pos is None:
             return False
-        return self.button_pos in self.snake.segments[1:]
-
-    def _rebuild_wall_layer(self):
-        layer = pygame.Surface((SCREEN_WIDTH, PLAYFIELD_HEIGHT), pygame.SRCALPHA)
-        for (x, y) in self.wall_positions:
-            rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            if (x, y) in self.breakable_wall_positions:
-                pygame.draw.rect(layer, COLOR_WALL, rect)
-            else:
-                pygame.draw.rect(layer, COLOR_WALL, rect, width=2, border_radius=4)
-        self.wall_layer = layer
-        self.wall_layer_dirty = False
+        return self.snake.occupies(self.button_pos, 1)
 
     @staticmethod
     def _direction_to_angle(direction: tuple[int, int]) -> int:
@@ -2023,27 +2632,36 @@ class Game:
         return lines if lines else [""]
 
     def _direction_valid(self, new_dir: tuple[int, int], current_dir: tuple[int, int]) -> bool:
-        cur_dx, cur_dy = current_dir
-        new_dx, new_dy = new_dir
-        if (cur_dx == -new_dx and cur_dx != 0) or (cur_dy == -new_dy and cur_dy != 0):
-            return False
-        return True
+        return not is_reverse(new_dir, current_dir)
 
-    def queue_direction(self, new_dir: tuple[int, int]):
+    def queue_direction(self, new_dir: tuple[int, int], timestamp: float | None = None):
         if not self.snake:
             return
-        if new_dir == self.snake.pending_direction:
-            return
+        if timestamp is None:
+            timestamp = InputLatencyMeter.now()
 
-        if not self.input_locked:
+        if not self.input_locked and not self.direction_buffer:
+            if new_dir == self.snake.pending_direction:
+                return
             if self._direction_valid(new_dir, self.snake.pending_direction):
-                self.snake.set_direction(new_dir)
-                self.input_locked = True
-                self.queued_direction = None
+                self._apply_direction(new_dir, timestamp)
             return
 
-        if self._direction_valid(new_dir, self.snake.pending_direction):
-            self.queued_direction = new_dir
+        self.direction_buffer.push(new_dir, timestamp, after=self.snake.pending_direction)
+
+    def _consume_buffered_direction(self):
+        """Apply at most one buffered turn per simulation tick."""
+        if not self.snake:
+            return
+        entry = self.direction_buffer.pop_valid(self.snake.direction)
+        if entry is not None:
+            self._apply_direction(*entry)
+
+    def _apply_direction(self, new_dir: tuple[int, int], timestamp: float):
+        self.snake.set_direction(new_dir)
+        self.input_locked = True
+        if self.input_meter:
+            self.input_meter.on_turn_applied(timestamp)
 
     def _can_shoot(self) -> bool:
         return self._in_sacrifice_levels() or self._in_escape_level() or self.side_scroller_active
@@ -2126,6 +2744,7 @@ class Game:
             pos = (separator_x, y)
             self.wall_positions.add(pos)
             self.breakable_wall_positions.add(pos)
+        self.sacrifice_regions = RegionLabels(self.sacrifice_playable_cells - self.wall_positions)
 
     def _place_sacrifice_gate(self):
         if not self.sacrifice_right_cells or not self.snake:
@@ -2152,15 +2771,6 @@ class Game:
         self.button_pos = button
         self.key_pos = key
 
-    def _place_snake_in_sacrifice_start(self):
-        if not self.sacrifice_left_cells or not self.snake:
-            return
-        candidates = [pos for pos in self.sacrifice_left_cells if pos not in self.wall_positions]
-        if not candidates:
-            candidates = list(self.sacrifice_left_cells)
-        start_pos = self._choose_spawn_position(candidates, min_wall_gap=8)
-        self._spawn_snake_with_tail(start_pos, allowed_cells=self.sacrifice_left_cells)
-
     def shoot_sacrifice(self):
         if not self._can_shoot():
             return
@@ -2207,7 +2817,7 @@ class Game:
         if self.snake.grow_pending > 0:
             self.snake.grow_pending -= 1
         elif len(self.snake.segments) > 2:
-            self.snake.segments.pop()
+            self.snake.drop_tail()
 
     def _fire_player_shot(self) -> bool:
         if not self.snake:
@@ -2274,29 +2884,33 @@ class Game:
 
             if hit:
                 self.sacrifice_shot_active = False
-                self.sacrifice_explosions.append(
-                    {"pos": self.sacrifice_shot_target_cell, "elapsed": 0.0, "duration": 260.0}
-                )
+                self._start_sacrifice_explosion(self.sacrifice_shot_target_cell)
                 self._resolve_sacrifice_shot_hit()
 
             self.sacrifice_shot_pos = (x, y)
 
-        if self.sacrifice_explosions:
-            updated: list[dict] = []
-            for explosion in self.sacrifice_explosions:
-                explosion["elapsed"] += dt_ms
-                if explosion["elapsed"] < explosion["duration"]:
-                    updated.append(explosion)
-            self.sacrifice_explosions = updated
+    def _start_sacrifice_explosion(self, pos: tuple[int, int]):
+        explosion = {"pos": pos}
+        explosion["tween"] = self.scheduler.tween(
+            260.0, on_done=lambda: self._end_sacrifice_explosion(explosion)
+        )
+        self.sacrifice_explosions.append(explosion)
+
+    def _end_sacrifice_explosion(self, explosion: dict):
+        if explosion in self.sacrifice_explosions:
+            self.sacrifice_explosions.remove(explosion)
 
     def _resolve_sacrifice_shot_hit(self):
         hit_pos = self.sacrifice_shot_target_cell
         if hit_pos in self.breakable_wall_positions:
             self.breakable_wall_positions.discard(hit_pos)
             self.wall_positions.discard(hit_pos)
-            self.wall_layer_dirty = True
+            self.wall_chunks.invalidate(hit_pos)
+            self.layout_version += 1
             if self.sacrifice_playable_cells is not None:
                 self.sacrifice_playable_cells.add(hit_pos)
+            if self.sacrifice_regions is not None:
+                self.sacrifice_regions.add(hit_pos)
             if self._in_sacrifice_levels():
                 self.sacrifice_wall_open = True
             if self._in_escape_level():
@@ -2354,7 +2968,6 @@ class Game:
         if not self.story_snake or not self.story_path:
             return
 
-        self.story_snake.prev_segments = list(self.story_snake.segments)
         self.story_snake.prev_direction = self.story_snake.direction
 
         self.story_path_index = (self.story_path_index + 1) % len(self.story_path)
@@ -2365,24 +2978,20 @@ class Game:
             self.story_snake.direction = (dx, dy)
             self.story_snake.pending_direction = (dx, dy)
 
-        self.story_snake.segments.insert(0, new_head)
-        if len(self.story_snake.segments) > self.story_snake_length:
-            self.story_snake.segments.pop()
+        self.story_snake.move_head(new_head, grow=len(self.story_snake.segments) < self.story_snake_length)
 
         if self.story_snake.head_frames:
             self.story_snake.anim_index = (self.story_snake.anim_index + 1) % len(
                 self.story_snake.head_frames
             )
-        self.story_snake.interp_ready = True
 
     def _reset_intro_sequence(self):
         self.intro_phase = "veil"
         self.intro_done = False
         self.intro_active = True
-        self.intro_last_frame_ms = None
-        self.intro_move_accumulator_ms = 0.0
-        self.intro_veil_snakes = self._build_intro_veil()
-        self.intro_veil_steps = 0
+        self._stop_timer(self.intro_timer)
+        self.intro_timer = self.scheduler.every(self.intro_move_interval_ms, self._intro_step, skip_missed=True)
+        self.intro_veil = self._build_intro_veil()
         self.intro_hero_done = False
         self.intro_snake = None
 
@@ -2391,62 +3000,18 @@ class Game:
         rows = max(1, SCREEN_HEIGHT // TILE_SIZE)
         return cols, rows
 
-    def _build_intro_veil(self) -> list[Snake]:
+    def _build_intro_veil(self) -> IntroVeil:
         cols, rows = self._intro_grid()
-        snakes: list[Snake] = []
-        max_offset = 0
-        max_length = 0
-        for row in range(rows):
-            length = 6 + (row % 5)
-            offset = (row * 3) % 10
-            start_x = -length - offset
-            positions = [(start_x - i, row) for i in range(length)]
-            snake = Snake(grid_pos=positions[0])
-            snake.segments = positions
-            snake.direction = (1, 0)
-            snake.pending_direction = (1, 0)
-            snake.reset_interpolation()
-            snakes.append(snake)
-            max_offset = max(max_offset, offset)
-            max_length = max(max_length, length)
-
-        extra_snakes = max(160, rows * 8)
-        if rows > 2:
-            for _ in range(extra_snakes):
-                row = random.randint(0, rows - 1)
-                length = random.randint(6, 10)
-                offset = random.randint(0, 10)
-                start_x = -length - offset
-                positions = [(start_x - i, row) for i in range(length)]
-                snake = Snake(grid_pos=positions[0])
-                snake.segments = positions
-                snake.direction = (1, 0)
-                snake.pending_direction = (1, 0)
-                snake.reset_interpolation()
-                snakes.append(snake)
-                max_offset = max(max_offset, offset)
-                max_length = max(max_length, length)
-
-        max_required_steps = 0
-        for snake in snakes:
-            length = len(snake.segments)
-            start_x = snake.segments[0][0]
-            steps = cols - start_x + (length - 1)
-            max_required_steps = max(max_required_steps, steps)
-
-        self.intro_veil_total_steps = max_required_steps + 2
-        return snakes
+        with TIMELINE.section("Game._build_intro_veil"):
+            return IntroVeil(cols, rows)
 
     def _advance_intro_veil(self):
-        if not self.intro_veil_snakes:
+        if not self.intro_veil:
             self._start_intro_hero()
             return
 
-        self.intro_veil_steps += 1
-        for snake in self.intro_veil_snakes:
-            snake.update()
-
-        if self.intro_veil_steps >= self.intro_veil_total_steps:
+        self.intro_veil.advance()
+        if self.intro_veil.done:
             self._start_intro_hero()
 
     def _start_intro_hero(self):
@@ -2509,8 +3074,8 @@ class Game:
         self.intro_hero_done = True
 
     def _intro_fade_progress(self) -> float:
-        if self.intro_phase == "veil" and self.intro_veil_total_steps > 0:
-            progress = self.intro_veil_steps / max(1, self.intro_veil_total_steps)
+        if self.intro_phase == "veil" and self.intro_veil and self.intro_veil.total_steps > 0:
+            progress = self.intro_veil.steps / max(1, self.intro_veil.total_steps)
             if progress <= 1.0 / 4.0:
                 return 0.0
             return min(1.0, (progress - 1.0 / 4.0) / (3.0 / 4.0))
@@ -2555,10 +3120,14 @@ class Game:
         """Show a 2s loading build for the next level before gameplay starts."""
         self.build_walls()
         self.layout_ready = True
+        self.level_prep = self._prepare_level()
         self.loading_tiles = self._build_loading_tiles()
         self.loading_reveal_count = 0
+        self.loading_layer.fill((0, 0, 0, 0))
+        self.loading_layer_count = 0
         self.loading_active = True
-        self.loading_start_ms = pygame.time.get_ticks()
+        self.scheduler.cancel_group("loading")
+        self.scheduler.tween(self.loading_duration_ms, self._reveal_loading, self._finish_loading, group="loading")
 
     def _build_loading_tiles(self) -> list[tuple[int, int]]:
         if not self.wall_positions:
@@ -2582,52 +3151,53 @@ class Game:
 
         return sorted(self.wall_positions, key=lambda p: (p[1], p[0]))
 
-    def update_loading(self):
-        if self.loading_start_ms is None:
-            self.loading_start_ms = pygame.time.get_ticks()
-        elapsed = pygame.time.get_ticks() - self.loading_start_ms
-        duration = max(1, self.loading_duration_ms)
-        progress = min(1.0, elapsed / duration)
+    def _reveal_loading(self, progress: float):
         target_count = int(progress * len(self.loading_tiles))
         self.loading_reveal_count = max(self.loading_reveal_count, target_count)
 
-        if elapsed >= duration:
-            self.loading_active = False
-            self.start_level()
+    def _finish_loading(self):
+        if not self.loading_active:
+            return
+        self.loading_active = False
+        self.start_level()
 
     def draw_loading_screen(self):
         self.screen.fill((0, 0, 0))
         self.screen.blit(self.background, (0, HUD_HEIGHT))
         draw_grid(self.screen, offset_y=HUD_HEIGHT)
 
-        if self.loading_tiles:
-            for (x, y) in self.loading_tiles[: self.loading_reveal_count]:
-                rect = pygame.Rect(
-                    x * TILE_SIZE,
-                    y * TILE_SIZE + HUD_HEIGHT,
-                    TILE_SIZE,
-                    TILE_SIZE,
-                )
-                pygame.draw.rect(self.screen, COLOR_WALL, rect, width=2, border_radius=4)
+        if self.loading_reveal_count < self.loading_layer_count:
+            self.loading_layer.fill((0, 0, 0, 0))
+            self.loading_layer_count = 0
+        if self.loading_reveal_count > self.loading_layer_count:
+            stamp_tiles(self.loading_layer, self.loading_tiles[self.loading_layer_count : self.loading_reveal_count])
+            self.loading_layer_count = self.loading_reveal_count
+        if self.loading_layer_count:
+            self.screen.blit(self.loading_layer, (0, HUD_HEIGHT))
 
         self.draw_hud_band()
         self.draw_hud()
-        pygame.display.flip()
+        self.present()
 
     def draw_level_clear(self):
-        self.screen.fill((0, 0, 0))
-        self.screen.blit(self.background, (0, HUD_HEIGHT))
-        draw_grid(self.screen, offset_y=HUD_HEIGHT)
-        self.draw_walls()
-
-        if self.food:
-            self.food.draw(self.screen, HUD_HEIGHT)
-        if self.button_pos:
-            self.draw_button()
-        if self.key_pos:
-            self.draw_key()
-        if self.snake:
-            self.snake.draw(self.screen, HUD_HEIGHT, alpha=0.0)
+        if self.camera is not None:
+            self._draw_board_view(alpha=0.0)
+        else:
+            self.screen.fill((0, 0, 0))
+            self.screen.blit(self.background, (0, HUD_HEIGHT))
+            draw_grid(self.screen, offset_y=HUD_HEIGHT)
+            self.draw_walls()
+
+            if self.food:
+                self.food.draw(self.screen, HUD_HEIGHT)
+            if self.food_field:
+                self.food_field.draw(self.screen, HUD_HEIGHT)
+            if self.button_pos:
+                self.draw_button()
+            if self.key_pos:
+                self.draw_key()
+            if self.snake:
+                self.snake.draw(self.screen, HUD_HEIGHT, alpha=0.0)
 
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 170))
@@ -2639,7 +3209,7 @@ class Game:
         prompt_rect = prompt_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
         self.screen.blit(title_text, title_rect)
         self.screen.blit(prompt_text, prompt_rect)
-        pygame.display.flip()
+        self.present()
 
     def draw_menu_background(self):
         self.screen.fill((0, 0, 0))
@@ -2648,16 +3218,14 @@ class Game:
         self.draw_menu_border()
 
     def draw_menu_border(self):
-        tiles_x = SCREEN_WIDTH // TILE_SIZE
-        tiles_y = SCREEN_HEIGHT // TILE_SIZE
-        for x in range(tiles_x):
-            for y in (0, tiles_y - 1):
-                rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                pygame.draw.rect(self.screen, COLOR_WALL, rect, width=2, border_radius=4)
-        for y in range(1, tiles_y - 1):
-            for x in (0, tiles_x - 1):
-                rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                pygame.draw.rect(self.screen, COLOR_WALL, rect, width=2, border_radius=4)
+        if self.menu_border_layer is None:
+            tiles_x = SCREEN_WIDTH // TILE_SIZE
+            tiles_y = SCREEN_HEIGHT // TILE_SIZE
+            tiles = [(x, y) for x in range(tiles_x) for y in (0, tiles_y - 1)]
+            tiles += [(x, y) for y in range(1, tiles_y - 1) for x in (0, tiles_x - 1)]
+            self.menu_border_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            stamp_tiles(self.menu_border_layer, tiles)
+        self.screen.blit(self.menu_border_layer, (0, 0))
 
     def draw_start_screen(self):
         if self.intro_active:
@@ -2685,7 +3253,7 @@ class Game:
         prompt_text = self.menu_prompt_font.render("Press ENTER or SPACE", True, COLOR_HUD)
         prompt_rect = prompt_text.get_rect(midbottom=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 18))
         self.screen.blit(prompt_text, prompt_rect)
-        pygame.display.flip()
+        self.present()
 
     def draw_settings_screen(self):
         self.draw_menu_background()
@@ -2709,7 +3277,7 @@ class Game:
         prompt_text = self.menu_prompt_font.render("Press ENTER to open, ESC to return", True, COLOR_HUD)
         prompt_rect = prompt_text.get_rect(midbottom=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 28))
         self.screen.blit(prompt_text, prompt_rect)
-        pygame.display.flip()
+        self.present()
 
     def draw_leaderboard_screen(self):
         self.draw_menu_background()
@@ -2720,8 +3288,13 @@ class Game:
 
         base_y = SCREEN_HEIGHT // 2 - 60
         line_gap = 34
-        if self.leaderboard_entries:
-            for idx, entry in enumerate(self.leaderboard_entries, start=1):
+        entries = self.leaderboard_entries
+        if self.remote_leaderboard is not None:
+            remote_entries = self.remote_leaderboard.cached_top(self.leaderboard_size)
+            if remote_entries:
+                entries = self._normalize_leaderboard(remote_entries)
+        if entries:
+            for idx, entry in enumerate(entries, start=1):
                 name = entry.get("name", "Anon")
                 score = entry.get("score", 0)
                 label = f"{idx}. {name} - {score}"
@@ -2736,22 +3309,29 @@ class Game:
         prompt_text = self.menu_prompt_font.render("Press ESC to return", True, COLOR_HUD)
         prompt_rect = prompt_text.get_rect(midbottom=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 28))
         self.screen.blit(prompt_text, prompt_rect)
-        pygame.display.flip()
+        self.present()
 
     def draw_game_over(self):
-        self.screen.fill((0, 0, 0))
-        self.screen.blit(self.background, (0, HUD_HEIGHT))
-        draw_grid(self.screen, offset_y=HUD_HEIGHT)
-        self.draw_walls()
-
-        if self.food:
-            self.food.draw(self.screen, HUD_HEIGHT)
-        if self.button_pos:
-            self.draw_button()
-        if self.key_pos:
-            self.draw_key()
-        if self.snake:
-            self.snake.draw(self.screen, HUD_HEIGHT, alpha=0.0)
+        if self.endless_world is not None:
+            self.draw_side_scroller(flip=False)
+        elif self.camera is not None:
+            self._draw_board_view(alpha=0.0)
+        else:
+            self.screen.fill((0, 0, 0))
+            self.screen.blit(self.background, (0, HUD_HEIGHT))
+            draw_grid(self.screen, offset_y=HUD_HEIGHT)
+            self.draw_walls()
+
+            if self.food:
+                self.food.draw(self.screen, HUD_HEIGHT)
+            if self.food_field:
+                self.food_field.draw(self.screen, HUD_HEIGHT)
+            if self.button_pos:
+                self.draw_button()
+            if self.key_pos:
+                self.draw_key()
+            if self.snake:
+                self.snake.draw(self.screen, HUD_HEIGHT, alpha=0.0)
 
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 170))
@@ -2782,9 +3362,11 @@ class Game:
             )
             hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 92))
             self.screen.blit(hint_text, hint_rect)
-        pygame.display.flip()
+        self.present()
 
     def exit_to_menu(self):
+        self._record_unsaved_run()
+        SURFACE_LEDGER.unpin(self.wall_chunks)
         self.game_paused = False
         self.game_started = False
         self.game_over = False
@@ -2792,11 +3374,12 @@ class Game:
         self.loading_active = False
         self.story_active = False
         self.side_scroller_active = False
-        self.starfield = []
+        self.endless_world = None
+        self.starfield = None
         self.side_scroller_camera_x = 0.0
         self.side_scroller_food_eaten = 0
         self.space_fade = 0.0
-        self.space_fade_time_ms = 0.0
+        self.scheduler.cancel_group("space fade")
         self.space_fade_active = False
         self.player_shots.clear()
         self.boss_bullets.clear()
@@ -2816,25 +3399,10 @@ class Game:
         return f"{minutes:02}:{seconds:02}"
 
     def _load_leaderboard(self):
-        try:
-            if not self.leaderboard_path.exists():
-                self.leaderboard_entries = []
-                return
-            payload = json.loads(self.leaderboard_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            self.leaderboard_entries = []
-            return
-
-        entries = None
-        if isinstance(payload, dict):
-            entries = payload.get("entries")
-            if entries is None:
-                entries = payload.get("scores")
-
-        if not isinstance(entries, list):
-            self.leaderboard_entries = []
-            return
-
+        if self.run_history is not None:
+            entries = self.run_history.top_runs(self.leaderboard_size)
+        else:
+            entries = read_leaderboard_entries(self.leaderboard_path)
         self.leaderboard_entries = self._normalize_leaderboard(entries)
 
     def _save_leaderboard(self):
@@ -2862,7 +3430,7 @@ class Game:
                 name_value = "Anon"
             cleaned.append({"name": name_value, "score": score_value})
         cleaned.sort(key=lambda item: item["score"], reverse=True)
-        return cleaned[:5]
+        return cleaned[: self.leaderboard_size]
 
     def record_score(self):
         if self.score_recorded:
@@ -2876,7 +3444,37 @@ class Game:
             name = f"Snake{random.randint(1000, 9999)}"
         self.leaderboard_entries.append({"name": name, "score": int(self.points)})
         self.leaderboard_entries = self._normalize_leaderboard(self.leaderboard_entries)
-        self._save_leaderboard()
+        if self.run_history is not None:
+            self._record_run(name, on_leaderboard=True)
+        else:
+            self._save_leaderboard()
+        if self.remote_leaderboard is not None:
+            self.remote_leaderboard.submit(
+                name,
+                self.points,
+                self.level,
+                self.elapsed_time_ms,
+                self.death_cause or "unknown",
+            )
+
+    def _record_run(self, name: str | None, on_leaderboard: bool):
+        if self.run_history is None or self.attract_active:
+            return
+        self.run_history.record_run(
+            name,
+            self.points,
+            self.level,
+            self.elapsed_time_ms,
+            self.death_cause or "unknown",
+            on_leaderboard=on_leaderboard,
+        )
+
+    def _record_unsaved_run(self):
+        """Keep runs the player left without entering a name in the history."""
+        if self.score_recorded or not (self.game_over or self.victory_active):
+            return
+        self.score_recorded = True
+        self._record_run(None, on_leaderboard=False)
 
     def run(self):
         while self.running:
@@ -2884,5 +3482,19 @@ class Game:
             self.handle_events()
             self.update()
             self.draw()
-
+            if self.input_meter:
+                self.input_meter.on_present()
+
+        self._record_unsaved_run()
+        if self.run_history is not None:
+            self.run_history.close()
+        if self.remote_leaderboard is not None:
+            self.remote_leaderboard.close()
+        if self.input_meter:
+            print(self.input_meter.report())
+            print(self.tick_report())
+        if self.attract_soak:
+            print(self.autopilot.report())
+        if self.memory_report:
+            print(SURFACE_LEDGER.report())
         pygame.quit()
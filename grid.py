@@ -1,4 +1,8 @@
 import pygame
+try:
+    import numpy
+except ImportError:
+    numpy = None
 from config import (
     SCREEN_WIDTH,
     PLAYFIELD_HEIGHT,
@@ -7,44 +11,102 @@ from config import (
     COLOR_BG_TOP,
     COLOR_BG_BOTTOM,
 )
+from startup_timeline import TIMELINE
+from surface_ledger import SURFACE_LEDGER
 
-_GRID_OVERLAY_CACHE: dict[tuple[int, int], pygame.Surface] = {}
+_GRID_OVERLAY_CACHE: dict[tuple[int, int, int], pygame.Surface] = {}
+_BACKGROUND_CACHE: dict[tuple[int, int, bool], pygame.Surface] = {}
+SURFACE_LEDGER.register("grid overlays", lambda: _GRID_OVERLAY_CACHE, _GRID_OVERLAY_CACHE.clear)
+SURFACE_LEDGER.register("backgrounds", lambda: _BACKGROUND_CACHE)
 
 
-def _get_grid_overlay(height: int, alpha: int) -> pygame.Surface:
-    key = (height, alpha)
+def _get_grid_overlay(height: int, alpha: int, width: int = SCREEN_WIDTH) -> pygame.Surface:
+    key = (width, height, alpha)
     cached = _GRID_OVERLAY_CACHE.get(key)
     if cached is not None:
         return cached
 
-    overlay = pygame.Surface((SCREEN_WIDTH, height), pygame.SRCALPHA)
+    overlay = pygame.Surface((width, height), pygame.SRCALPHA)
     line_color = (*COLOR_GRID, alpha)
-    for x in range(0, SCREEN_WIDTH, TILE_SIZE):
+    for x in range(0, width, TILE_SIZE):
         pygame.draw.line(overlay, line_color, (x, 0), (x, height))
     for y in range(0, height, TILE_SIZE):
-        pygame.draw.line(overlay, line_color, (0, y), (SCREEN_WIDTH, y))
+        pygame.draw.line(overlay, line_color, (0, y), (width, y))
     _GRID_OVERLAY_CACHE[key] = overlay
     return overlay
 
 
-def build_background(height: int = PLAYFIELD_HEIGHT) -> pygame.Surface:
-    """Pre-render a synthwave gradient background with a subtle grid overlay."""
+def build_background(height: int = PLAYFIELD_HEIGHT, width: int = SCREEN_WIDTH, grid: bool = True) -> pygame.Surface:
+    """Pre-render a synthwave gradient background with a subtle grid overlay.
 
-    surface = pygame.Surface((SCREEN_WIDTH, height))
+    Built once per size; callers must not draw onto the returned surface.
+    Scrolling views pass ``grid=False`` and draw the scrolled grid themselves.
+    """
+    key = (width, height, grid)
+    cached = _BACKGROUND_CACHE.get(key)
+    if cached is not None:
+        return cached
+    with TIMELINE.section(f"grid.build_background({height})"):
+        surface = _build_background(width, height) if grid else _build_gradient(width, height)
+    _BACKGROUND_CACHE[key] = surface
+    return surface
 
-    # Vertical gradient sky
+
+def _build_gradient(width: int, height: int) -> pygame.Surface:
+    """Vertical gradient sky, written in one array copy when NumPy is available."""
+    surface = pygame.Surface((width, height))
+    if numpy is not None:
+        t = numpy.arange(height, dtype=numpy.float64) / height
+        top = numpy.array(COLOR_BG_TOP, dtype=numpy.float64)
+        bottom = numpy.array(COLOR_BG_BOTTOM, dtype=numpy.float64)
+        column = (top + (bottom - top) * t[:, None]).astype(numpy.int32)
+        pygame.surfarray.blit_array(surface, numpy.broadcast_to(column, (width, height, 3)))
+        return surface
+
+    # Without NumPy: fill a one-pixel column and stretch it across the width.
+    column = pygame.Surface((1, height))
     for y in range(height):
         t = y / height
-        r = int(COLOR_BG_TOP[0] + (COLOR_BG_BOTTOM[0] - COLOR_BG_TOP[0]) * t)
-        g = int(COLOR_BG_TOP[1] + (COLOR_BG_BOTTOM[1] - COLOR_BG_TOP[1]) * t)
-        b = int(COLOR_BG_TOP[2] + (COLOR_BG_BOTTOM[2] - COLOR_BG_TOP[2]) * t)
-        pygame.draw.line(surface, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        column.set_at(
+            (0, y),
+            tuple(int(top + (bottom - top) * t) for top, bottom in zip(COLOR_BG_TOP, COLOR_BG_BOTTOM)),
+        )
+    pygame.transform.scale(column, (width, height), surface)
+    return surface
+
+
+def _build_background(width: int, height: int) -> pygame.Surface:
+    surface = _build_gradient(width, height)
 
     # Neon grid overlay
-    surface.blit(_get_grid_overlay(height, 90), (0, 0))
+    surface.blit(_get_grid_overlay(height, 90, width), (0, 0))
     return surface
 
 
-def draw_grid(surface: pygame.Surface, offset_y: int = 0, height: int = PLAYFIELD_HEIGHT):
+def grid_overlay(
+    height: int = PLAYFIELD_HEIGHT,
+    scroll: tuple[int, int] = (0, 0),
+) -> tuple[pygame.Surface, pygame.Rect | None]:
+    """Overlay surface and source area that ``draw_grid`` blits.
+
+    ``scroll`` is a camera pixel offset; the lines repeat every tile, so a
+    one-tile-larger overlay is blitted through a shifted source rect.
+    """
+    shift_x = scroll[0] % TILE_SIZE
+    shift_y = scroll[1] % TILE_SIZE
+    if not shift_x and not shift_y:
+        return _get_grid_overlay(height, 120), None
+
+    overlay = _get_grid_overlay(height + TILE_SIZE, 120, SCREEN_WIDTH + TILE_SIZE)
+    return overlay, pygame.Rect(TILE_SIZE - shift_x, TILE_SIZE - shift_y, SCREEN_WIDTH, height)
+
+
+def draw_grid(
+    surface: pygame.Surface,
+    offset_y: int = 0,
+    height: int = PLAYFIELD_HEIGHT,
+    scroll: tuple[int, int] = (0, 0),
+):
     """Draw a light neon grid overlay on top of the background."""
-    surface.blit(_get_grid_overlay(height, 120), (0, offset_y))
+    overlay, area = grid_overlay(height, scroll)
+    surface.blit(overlay, (0, offset_y), area)
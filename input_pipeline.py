@@ -0,0 +1,113 @@
+import time
+from collections import deque
+
+import pygame
+
+# Event types the game loop actually handles; everything else is dropped by
+# SDL before it reaches the Python event queue. Window size changes stay
+# enabled so a SCALED display can resize its viewport.
+ALLOWED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED)
+
+
+def configure_event_filter(extra: tuple[int, ...] = ()):
+    """Block every event type except the ones the game handles."""
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([*ALLOWED_EVENTS, *extra])
+
+
+def is_reverse(new_dir: tuple[int, int], current_dir: tuple[int, int]) -> bool:
+    cur_dx, cur_dy = current_dir
+    new_dx, new_dy = new_dir
+    return (cur_dx == -new_dx and cur_dx != 0) or (cur_dy == -new_dy and cur_dy != 0)
+
+
+class DirectionBuffer:
+    """Small FIFO of timestamped turns, consumed one per simulation tick.
+
+    Turns are checked against the last buffered direction on entry (so
+    "up then left" inside one tick is kept) and re-validated against the
+    snake's real direction when consumed.
+    """
+
+    def __init__(self, capacity: int = 3):
+        self.capacity = capacity
+        self._entries: deque[tuple[tuple[int, int], float]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+
+    def push(self, direction: tuple[int, int], timestamp: float, after: tuple[int, int]) -> bool:
+        """Queue ``direction`` behind the buffered turns (or ``after`` if empty)."""
+        last = self._entries[-1][0] if self._entries else after
+        if direction == last or is_reverse(direction, last):
+            return False
+        if len(self._entries) >= self.capacity:
+            return False
+        self._entries.append((direction, timestamp))
+        return True
+
+    def pop_valid(self, current: tuple[int, int]) -> tuple[tuple[int, int], float] | None:
+        """Return the oldest turn that is still legal from ``current``."""
+        while self._entries:
+            direction, timestamp = self._entries.popleft()
+            if direction != current and not is_reverse(direction, current):
+                return direction, timestamp
+        return None
+
+
+class InputLatencyMeter:
+    """Measure input-to-simulation and input-to-present latency for turns."""
+
+    def __init__(self):
+        self._awaiting_tick: list[float] = []
+        self._awaiting_present: list[tuple[float, float]] = []
+        self.to_simulation_ms: list[float] = []
+        self.to_present_ms: list[float] = []
+
+    @staticmethod
+    def now() -> float:
+        return time.perf_counter()
+
+    def on_turn_applied(self, input_time: float):
+        self._awaiting_tick.append(input_time)
+
+    def on_tick(self):
+        if not self._awaiting_tick:
+            return
+        now = self.now()
+        for input_time in self._awaiting_tick:
+            self.to_simulation_ms.append((now - input_time) * 1000.0)
+            self._awaiting_present.append((input_time, now))
+        self._awaiting_tick.clear()
+
+    def on_present(self):
+        if not self._awaiting_present:
+            return
+        now = self.now()
+        for input_time, _ in self._awaiting_present:
+            self.to_present_ms.append((now - input_time) * 1000.0)
+        self._awaiting_present.clear()
+
+    @staticmethod
+    def _summary(label: str, samples: list[float]) -> str:
+        if not samples:
+            return f"{label}: no samples"
+        ordered = sorted(samples)
+        p50 = ordered[len(ordered) // 2]
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        mean = sum(ordered) / len(ordered)
+        return (
+            f"{label}: n={len(ordered)} mean={mean:.1f}ms p50={p50:.1f}ms "
+            f"p95={p95:.1f}ms max={ordered[-1]:.1f}ms"
+        )
+
+    def report(self) -> str:
+        return "\n".join(
+            (
+                self._summary("input -> simulation", self.to_simulation_ms),
+                self._summary("input -> present", self.to_present_ms),
+            )
+        )
@@ -0,0 +1,113 @@
+import random
+from array import array
+
+import pygame
+from config import TILE_SIZE
+from snake import Snake
+from surface_ledger import SURFACE_LEDGER
+
+
+class IntroVeil:
+    """Horizontal snake strips that sweep across the menu during the intro.
+
+    Each strip is only a row, a starting head column and a length stored in
+    flat arrays. The snake sprites for every (length, head frame) pair are
+    composited once into a strip surface, so a frame is a single ``blits``
+    call regardless of how many strips are on screen.
+    """
+
+    def __init__(self, cols: int, rows: int, sprite_source: Snake | None = None):
+        self.cols = cols
+        self.rows = rows
+        self.rows_arr = array("i")
+        self.start_x_arr = array("i")
+        self.length_arr = array("i")
+        self.steps = 0
+        self.total_steps = 0
+        self._sprites = sprite_source or Snake(grid_pos=(0, 0))
+        self._frame_count = max(1, len(self._sprites.head_frames))
+        self._strip_cache: dict[tuple[int, int], pygame.Surface] = {}
+        SURFACE_LEDGER.register(
+            "intro veil",
+            lambda veil: veil._strip_cache,
+            lambda veil: veil._strip_cache.clear(),
+            anchor=self,
+        )
+        self._build_strips()
+
+    def _add_strip(self, row: int, length: int, offset: int):
+        self.rows_arr.append(row)
+        self.start_x_arr.append(-length - offset)
+        self.length_arr.append(length)
+
+    def _build_strips(self):
+        rows = self.rows
+        for row in range(rows):
+            self._add_strip(row, 6 + (row % 5), (row * 3) % 10)
+
+        extra_strips = max(160, rows * 8)
+        if rows > 2:
+            for _ in range(extra_strips):
+                row = random.randint(0, rows - 1)
+                length = random.randint(6, 10)
+                offset = random.randint(0, 10)
+                self._add_strip(row, length, offset)
+
+        max_required_steps = 0
+        for start_x, length in zip(self.start_x_arr, self.length_arr):
+            steps = self.cols - start_x + (length - 1)
+            max_required_steps = max(max_required_steps, steps)
+        self.total_steps = max_required_steps + 2
+
+    def __len__(self) -> int:
+        return len(self.length_arr)
+
+    @property
+    def done(self) -> bool:
+        return self.steps >= self.total_steps
+
+    def advance(self):
+        """Move every strip one tile to the right."""
+        self.steps += 1
+
+    def _strip_surface(self, length: int, frame: int) -> pygame.Surface:
+        key = (length, frame)
+        cached = self._strip_cache.get(key)
+        if cached is not None:
+            return cached
+
+        template = self._sprites
+        template.segments = [(length - 1 - i, 0) for i in range(length)]
+        template.direction = (1, 0)
+        template.pending_direction = (1, 0)
+        template.fading_segments = []
+        template.reset_interpolation()
+        template.anim_index = frame
+        strip = pygame.Surface((length * TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+        template.draw(strip, 0, alpha=0.0)
+        self._strip_cache[key] = strip
+        return strip
+
+    def draw(self, surface: pygame.Surface, alpha: float = 0.0, offset_y: int = 0):
+        if not self.length_arr:
+            return
+        if self.steps == 0:
+            alpha = 0.0
+            shift = 0.0
+        else:
+            alpha = max(0.0, min(1.0, alpha))
+            shift = alpha - 1.0
+
+        frame = self.steps % self._frame_count
+        steps = self.steps
+        cols = self.cols
+        batch = []
+        for row, start_x, length in zip(self.rows_arr, self.start_x_arr, self.length_arr):
+            head_x = start_x + steps
+            if head_x + 1 < 0 or head_x - length >= cols:
+                continue
+            left = head_x - length + 1 + shift
+            dest = (int(left * TILE_SIZE), row * TILE_SIZE + offset_y)
+            batch.append((self._strip_surface(length, frame), dest))
+        if batch:
+            surface.blits(batch, doreturn=False)
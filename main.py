@@ -1,12 +1,26 @@
+import argparse
+import tracemalloc
 from pathlib import Path
-import pygame
+from startup_timeline import TIMELINE
+
+with TIMELINE.section("import pygame"):
+    import pygame
 try:
     import audioop
 except ImportError:
     audioop = None
 
-from config import ASSET_DIR, FALLBACK_ASSET_DIR, SCREEN_HEIGHT, SCREEN_WIDTH
-from game import Game
+with TIMELINE.section("import config"):
+    from config import (
+        ASSET_DIR, FALLBACK_ASSET_DIR, SCREEN_HEIGHT, SCREEN_WIDTH,
+        GRID_WIDTH, GRID_HEIGHT, BIG_BOARD_SIZE,
+    )
+with TIMELINE.section("import game"):
+    from game import Game, LEADERBOARD_PATH
+from run_history import RUN_HISTORY_PATH, open_run_history
+from startup import StartupLoader
+from surface_ledger import SURFACE_LEDGER
+from texture_backend import TextureBackend
 
 SPLASH_LOGO_FILE = "IDMGlogo.png"
 SPLASH_SOUND_FILE = "jump.mp3"
@@ -32,12 +46,13 @@ def _load_splash_logo() -> pygame.Surface | None:
     if path is None:
         return None
     try:
-        return pygame.image.load(path).convert_alpha()
+        with TIMELINE.section("splash logo"):
+            return pygame.image.load(path).convert_alpha()
     except (FileNotFoundError, pygame.error):
         return None
 
 
-def _load_splash_sound() -> pygame.mixer.Sound | None:
+def _init_splash_mixer() -> bool:
     try:
         if not pygame.mixer.get_init():
             pygame.mixer.init()
@@ -46,6 +61,13 @@ def _load_splash_sound() -> pygame.mixer.Sound | None:
         except pygame.error:
             pass
     except pygame.error:
+        return False
+    return True
+
+
+def _load_splash_sound() -> pygame.mixer.Sound | None:
+    """Decode and resample the splash jingle (runs on a startup worker)."""
+    if not pygame.mixer.get_init():
         return None
 
     path = _find_asset_path(SPLASH_SOUND_FILE)
@@ -53,7 +75,8 @@ def _load_splash_sound() -> pygame.mixer.Sound | None:
         return None
 
     try:
-        base = pygame.mixer.Sound(path)
+        with TIMELINE.section("splash sound decode"):
+            base = pygame.mixer.Sound(path)
 
         init = pygame.mixer.get_init()
         if not init:
@@ -66,7 +89,8 @@ def _load_splash_sound() -> pygame.mixer.Sound | None:
             converted = raw
         else:
             target_rate = int(freq / max(0.01, SPLASH_SOUND_SPEED))
-            converted, _ = audioop.ratecv(raw, width, channels, freq, target_rate, None)
+            with TIMELINE.section("splash sound audioop.ratecv"):
+                converted, _ = audioop.ratecv(raw, width, channels, freq, target_rate, None)
 
         bytes_per_frame = width * channels
         frames_wanted = int(freq * (SPLASH_SOUND_PLAY_MS / 1000.0))
@@ -83,7 +107,8 @@ def _run_splash_screen(
     screen: pygame.Surface,
     clock: pygame.time.Clock,
     logo: pygame.Surface | None,
-    sound: pygame.mixer.Sound | None,
+    loader: StartupLoader,
+    present=pygame.display.flip,
 ) -> None:
     if logo is None:
         return
@@ -119,11 +144,13 @@ def _run_splash_screen(
                 if elapsed >= SPLASH_SKIP_DELAY_MS:
                     skip_requested = True
 
-        if (not sound_started) and (sound is not None) and elapsed >= sound_delay_ms:
-            try:
-                channel = sound.play(loops=0)
-            except pygame.error:
-                channel = None
+        if (not sound_started) and elapsed >= sound_delay_ms and loader.ready("splash_sound"):
+            sound = loader.result("splash_sound")
+            if sound is not None:
+                try:
+                    channel = sound.play(loops=0)
+                except pygame.error:
+                    channel = None
             sound_started = True
 
         screen.fill((0, 0, 0))
@@ -140,7 +167,7 @@ def _run_splash_screen(
             )
         logo.set_alpha(alpha)
         screen.blit(logo, (x, y))
-        pygame.display.flip()
+        present()
         clock.tick(SPLASH_FPS)
 
         if skip_requested or elapsed >= total_ms:
@@ -154,15 +181,211 @@ def _run_splash_screen(
 
     pygame.event.clear()
 
-def main():
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+def _open_window(args: argparse.Namespace) -> pygame.Surface:
+    """Open the display at the logical resolution.
+
+    With ``SCALED`` the game still renders into a SCREEN_WIDTH x SCREEN_HEIGHT
+    surface and SDL scales it on present, so per-frame fill cost does not grow
+    with the physical display. Windowed mode scales by whole multiples;
+    fullscreen stretches to fill the display.
+    """
+    size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    if args.fixed_window:
+        return pygame.display.set_mode(size)
+    flags = pygame.SCALED | (pygame.FULLSCREEN if args.fullscreen else pygame.RESIZABLE)
+    for vsync in (0,) if args.no_vsync else (1, 0):
+        try:
+            return pygame.display.set_mode(size, flags, vsync=vsync)
+        except pygame.error:
+            continue
+    # Drivers without a renderer for SCALED get the plain window.
+    return pygame.display.set_mode(size)
+
+
+def _board_size(text: str) -> tuple[int, int]:
+    try:
+        cols, rows = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected COLSxROWS, got {text!r}") from None
+    if cols < GRID_WIDTH or rows < GRID_HEIGHT:
+        raise argparse.ArgumentTypeError(f"board must be at least {GRID_WIDTH}x{GRID_HEIGHT}")
+    return cols, rows
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Snake Quest - Gates & Keys")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="time every startup step, print a sorted breakdown and exit",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=Path,
+        default=None,
+        help="also write the startup breakdown to this .json or .csv file",
+    )
+    parser.add_argument(
+        "--measure-input",
+        action="store_true",
+        help="report input-to-simulation and input-to-present latency on exit",
+    )
+    parser.add_argument(
+        "--board",
+        type=_board_size,
+        nargs="?",
+        const=BIG_BOARD_SIZE,
+        default=None,
+        metavar="COLSxROWS",
+        help=f"play on a large scrolling board (default {BIG_BOARD_SIZE[0]}x{BIG_BOARD_SIZE[1]})",
+    )
+    parser.add_argument(
+        "--endless",
+        action="store_true",
+        help="play an endless side-scroller run streamed in chunks",
+    )
+    parser.add_argument(
+        "--attract",
+        action="store_true",
+        help="run autopilot demo levels back to back (soak test) and report planning time on exit",
+    )
+    parser.add_argument(
+        "--fullscreen",
+        action="store_true",
+        help="scale the game to fill the display instead of a resizable window",
+    )
+    parser.add_argument(
+        "--no-vsync",
+        action="store_true",
+        help="present without waiting for vertical sync",
+    )
+    parser.add_argument(
+        "--fixed-window",
+        action="store_true",
+        help="unscaled window at the native game resolution",
+    )
+    parser.add_argument(
+        "--textures",
+        action="store_true",
+        help="draw through the SDL2 texture renderer (set SDL_RENDER_DRIVER=software to force the software renderer)",
+    )
+    parser.add_argument(
+        "--food",
+        type=int,
+        default=1,
+        metavar="N",
+        help="keep N food items on the board at once (bonus and timed food join at N > 1)",
+    )
+    parser.add_argument(
+        "--list-body",
+        action="store_true",
+        help="store the snake as a plain list of cells instead of straight runs (for comparison)",
+    )
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=1.0,
+        metavar="FACTOR",
+        help="run the game clock slower (<1) or faster (>1), e.g. 0.25 to inspect effects",
+    )
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="trace allocations and report surface cache memory per level on exit",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        default=None,
+        metavar="MIB",
+        help="evict rebuildable surface caches at level starts to stay under this many MiB",
+    )
+    parser.add_argument(
+        "--leaderboard-url",
+        default=None,
+        help="central leaderboard base URL (defaults to $SNAKEQUEST_LEADERBOARD_URL)",
+    )
+    return parser.parse_args(argv)
+
+
+def _finish_startup_profile(game: Game, output: Path | None):
+    with TIMELINE.section("first menu frame"):
+        game.draw()
+    TIMELINE.stop()
+    print(TIMELINE.report())
+    if output is not None:
+        TIMELINE.export(output)
+        print(f"\nWrote startup profile to {output}")
+    pygame.quit()
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    if args.memory_report:
+        tracemalloc.start()
+    if args.memory_budget is not None:
+        SURFACE_LEDGER.budget_bytes = int(args.memory_budget * 1024 * 1024)
+
+    with TIMELINE.section("pygame.init"):
+        pygame.init()
+    backend = None
+    if args.textures:
+        with TIMELINE.section("TextureBackend"):
+            backend = TextureBackend.create(
+                (SCREEN_WIDTH, SCREEN_HEIGHT),
+                "Snake Quest - Gates & Keys",
+                vsync=not args.no_vsync,
+                fullscreen=args.fullscreen,
+            )
+        if backend is None:
+            print("SDL2 texture renderer unavailable; using the Surface renderer.")
+    if backend is not None:
+        screen = backend.frame
+        present = backend.present_frame
+    else:
+        with TIMELINE.section("display.set_mode"):
+            screen = _open_window(args)
+        present = pygame.display.flip
     clock = pygame.time.Clock()
+
+    # Decode assets and build backgrounds on worker threads while the splash
+    # plays; Game() only does the main-thread conversions afterwards.
+    loader = StartupLoader()
+    loader.start()
+    loader.submit("run_history", open_run_history, RUN_HISTORY_PATH, LEADERBOARD_PATH)
+    with TIMELINE.section("mixer.init"):
+        mixer_ready = _init_splash_mixer()
+    if mixer_ready:
+        loader.submit("splash_sound", _load_splash_sound)
+
     splash_logo = _load_splash_logo()
-    splash_sound = _load_splash_sound()
-    _run_splash_screen(screen, clock, splash_logo, splash_sound)
+    if args.profile_startup:
+        # The splash is a fixed-length animation; profile what it hides.
+        loader.result("splash_sound")
+    else:
+        _run_splash_screen(screen, clock, splash_logo, loader, present)
+
+    with TIMELINE.section("Game.__init__"):
+        game = Game(
+            startup=loader,
+            leaderboard_url=args.leaderboard_url,
+            measure_input=args.measure_input,
+            board_size=args.board,
+            attract=args.attract,
+            texture_backend=backend,
+            memory_report=args.memory_report,
+            endless=args.endless,
+            food_count=args.food,
+            run_body=not args.list_body,
+        )
+    loader.shutdown()
+    game.scheduler.time_scale = max(0.0, args.time_scale)
+
+    if args.profile_startup:
+        _finish_startup_profile(game, args.profile_output)
+        return
 
-    game = Game()
+    TIMELINE.stop()
     game.run()
 
 if __name__ == "__main__":
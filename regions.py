@@ -0,0 +1,69 @@
+Cell = tuple[int, int]
+
+NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+class RegionLabels:
+    """Connected regions of a cell set, kept by union-find.
+
+    Built once per layout; ``add`` opens a cell (e.g. a shot-out wall) and
+    merges the regions it touches. Each region keeps its cells as a list so
+    callers can sample from the region a cell belongs to without a flood
+    fill.
+    """
+
+    def __init__(self, cells: set[Cell]):
+        self._parent: dict[Cell, Cell] = {}
+        self._members: dict[Cell, list[Cell]] = {}
+        for cell in cells:
+            self._parent[cell] = cell
+            self._members[cell] = [cell]
+        for x, y in cells:
+            for dx, dy in ((1, 0), (0, 1)):
+                neighbor = (x + dx, y + dy)
+                if neighbor in self._parent:
+                    self._union((x, y), neighbor)
+
+    def __contains__(self, cell: Cell) -> bool:
+        return cell in self._parent
+
+    def _find(self, cell: Cell) -> Cell:
+        parent = self._parent
+        root = cell
+        while parent[root] != root:
+            root = parent[root]
+        while parent[cell] != root:
+            parent[cell], cell = root, parent[cell]
+        return root
+
+    def _union(self, a: Cell, b: Cell):
+        root_a = self._find(a)
+        root_b = self._find(b)
+        if root_a == root_b:
+            return
+        # Union by size: the smaller member list is appended to the larger.
+        if len(self._members[root_a]) < len(self._members[root_b]):
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._members[root_a].extend(self._members.pop(root_b))
+
+    def add(self, cell: Cell):
+        """Open ``cell`` and merge it with every neighboring region."""
+        if cell in self._parent:
+            return
+        self._parent[cell] = cell
+        self._members[cell] = [cell]
+        x, y = cell
+        for dx, dy in NEIGHBORS:
+            neighbor = (x + dx, y + dy)
+            if neighbor in self._parent:
+                self._union(cell, neighbor)
+
+    def region(self, cell: Cell) -> list[Cell]:
+        """Cells connected to ``cell`` (shared list, do not modify)."""
+        if cell not in self._parent:
+            return []
+        return self._members[self._find(cell)]
+
+    def count(self) -> int:
+        return len(self._members)
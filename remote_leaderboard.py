@@ -0,0 +1,341 @@
+import hashlib
+import http.client
+import json
+import os
+import queue
+import random
+import threading
+import time
+import uuid
+from pathlib import Path
+from urllib.parse import urlsplit
+
+REMOTE_LEADERBOARD_ENV = "SNAKEQUEST_LEADERBOARD_URL"
+REMOTE_SPOOL_PATH = Path(__file__).with_name("remote_spool.json")
+REMOTE_REJECTED_PATH = Path(__file__).with_name("remote_rejected.json")
+# Statuses below 500 that may succeed later (timeout, rate limit); the rest are final.
+RETRY_STATUSES = frozenset({408, 429})
+
+_STOP = object()
+
+
+class RemoteRejected(http.client.HTTPException):
+    """The server refused a request in a way that retrying will not change."""
+
+    def __init__(self, message: str, status: int):
+        super().__init__(message)
+        self.status = status
+
+
+class _ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP connections to one host."""
+
+    def __init__(self, scheme: str, host: str, port: int | None, timeout: float, size: int = 2):
+        self._connection_class = (
+            http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._size = size
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Return a connection and whether it was reused from the pool."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return self._connection_class(self._host, self._port, timeout=self._timeout), False
+
+    def release(self, conn: http.client.HTTPConnection, reusable: bool):
+        if reusable:
+            with self._lock:
+                if len(self._idle) < self._size:
+                    self._idle.append(conn)
+                    return
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class RemoteLeaderboard:
+    """Non-blocking client for a central HTTP leaderboard.
+
+    ``submit`` only enqueues. A sender thread batches queued scores into
+    ``POST {base}/scores`` requests over pooled keep-alive connections,
+    backs off exponentially while the server is unreachable and keeps
+    unsent scores in a spool file that is flushed once a POST succeeds.
+    Only connection errors, 5xx and ``RETRY_STATUSES`` are retried; a
+    batch refused otherwise is moved to a rejected file so it cannot block
+    later scores. Every score carries a stable ``id`` and every POST an
+    ``Idempotency-Key``, so the server can drop duplicates from retries.
+    ``cached_top`` never touches the network: it returns the last list from
+    ``GET {base}/scores/top`` and starts a background refresh once the TTL
+    has expired.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        spool_path: Path = REMOTE_SPOOL_PATH,
+        *,
+        rejected_path: Path = REMOTE_REJECTED_PATH,
+        batch_size: int = 20,
+        timeout: float = 3.0,
+        top_ttl_s: float = 30.0,
+        backoff_base_s: float = 1.0,
+        backoff_max_s: float = 60.0,
+    ):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"unsupported leaderboard URL: {base_url!r}")
+        self.base_path = parts.path.rstrip("/")
+        self.spool_path = spool_path
+        self.rejected_path = rejected_path
+        self.batch_size = max(1, batch_size)
+        self.top_ttl_s = top_ttl_s
+        self.backoff_base_s = backoff_base_s
+        self.backoff_max_s = backoff_max_s
+        self.online = True
+        self._pool = _ConnectionPool(parts.scheme, parts.hostname, parts.port, timeout)
+        self._queue: queue.Queue = queue.Queue()
+        self._sent = threading.Condition()
+        # Scores not yet delivered, including those loaded from the spool.
+        self._unsent = 0
+        self._spool_loaded = False
+        self._stopped = False
+        self._top_entries: list[dict] = []
+        self._top_fetched_at: float | None = None
+        self._top_limit = 5
+        self._top_refreshing = False
+        self._top_lock = threading.Lock()
+        self._sender = threading.Thread(target=self._send_loop, name="remote-leaderboard", daemon=True)
+        self._sender.start()
+
+    @classmethod
+    def from_env(cls, base_url: str | None = None) -> "RemoteLeaderboard | None":
+        """Build a client from an explicit URL or the environment; ``None`` when unset."""
+        url = base_url or os.environ.get(REMOTE_LEADERBOARD_ENV, "")
+        if not url:
+            return None
+        try:
+            return cls(url)
+        except ValueError:
+            return None
+
+    def _request(self, method: str, path: str, payload=None, extra_headers: dict[str, str] | None = None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Accept": "application/json", "Connection": "keep-alive", **(extra_headers or {})}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        for _ in range(2):
+            conn, reused = self._pool.acquire()
+            try:
+                conn.request(method, self.base_path + path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                if reused:
+                    # The server may have dropped an idle keep-alive socket.
+                    continue
+                raise
+            self._pool.release(conn, not response.will_close)
+            if response.status >= 300:
+                message = f"{method} {path} returned {response.status}"
+                if response.status < 500 and response.status not in RETRY_STATUSES:
+                    raise RemoteRejected(message, response.status)
+                raise http.client.HTTPException(message)
+            return json.loads(data) if data else None
+        raise http.client.HTTPException(f"{method} {path} failed on a fresh connection")
+
+    def submit(self, name: str, score: int, level: int, elapsed_ms: float, cause: str):
+        entry = {
+            "id": uuid.uuid4().hex,
+            "name": name,
+            "score": int(score),
+            "level": int(level),
+            "elapsed_ms": int(elapsed_ms),
+            "cause": cause,
+            "client_time": time.time(),
+        }
+        with self._sent:
+            self._unsent += 1
+        self._queue.put(entry)
+
+    def _load_spool(self) -> list[dict]:
+        try:
+            payload = json.loads(self.spool_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+        entries = [entry for entry in payload if isinstance(entry, dict)] if isinstance(payload, list) else []
+        for entry in entries:
+            # Spools written before scores carried ids.
+            entry.setdefault("id", uuid.uuid4().hex)
+        return entries
+
+    def _write_spool(self, pending: list[dict]):
+        try:
+            if pending:
+                self.spool_path.write_text(json.dumps(pending), encoding="utf-8")
+            elif self.spool_path.exists():
+                self.spool_path.unlink()
+        except OSError:
+            return
+
+    def _quarantine(self, batch: list[dict], status: int):
+        try:
+            rejected = json.loads(self.rejected_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            rejected = []
+        if not isinstance(rejected, list):
+            rejected = []
+        rejected.extend({**entry, "rejected_status": status} for entry in batch)
+        try:
+            self.rejected_path.write_text(json.dumps(rejected), encoding="utf-8")
+        except OSError:
+            return
+
+    @staticmethod
+    def _batch_id(batch: list[dict]) -> str:
+        return hashlib.sha1("\n".join(str(entry.get("id")) for entry in batch).encode("utf-8")).hexdigest()
+
+    def _send_loop(self):
+        pending = self._load_spool()
+        spooled = bool(pending)
+        unspooled = False
+        with self._sent:
+            self._unsent += len(pending)
+            self._spool_loaded = True
+            self._sent.notify_all()
+        failures = 0
+        next_attempt = 0.0
+        stopping = False
+        while True:
+            if pending:
+                timeout = max(0.0, next_attempt - time.monotonic())
+            else:
+                timeout = None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            while item is not None:
+                if item is _STOP:
+                    stopping = True
+                else:
+                    pending.append(item)
+                    unspooled = True
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+
+            if stopping:
+                if pending or spooled:
+                    self._write_spool(pending)
+                self._pool.close()
+                with self._sent:
+                    self._stopped = True
+                    self._sent.notify_all()
+                return
+
+            if not pending or time.monotonic() < next_attempt:
+                continue
+
+            # Spool before sending: a POST still in flight when the game
+            # exits dies with this daemon thread.
+            if unspooled:
+                self._write_spool(pending)
+                spooled = True
+                unspooled = False
+
+            batch = pending[: self.batch_size]
+            batch_id = self._batch_id(batch)
+            try:
+                self._request(
+                    "POST", "/scores", {"batch_id": batch_id, "scores": batch}, {"Idempotency-Key": batch_id}
+                )
+            except RemoteRejected as error:
+                self._quarantine(batch, error.status)
+            except (OSError, http.client.HTTPException, ValueError):
+                failures += 1
+                self.online = False
+                delay = min(self.backoff_max_s, self.backoff_base_s * (2 ** (failures - 1)))
+                next_attempt = time.monotonic() + delay * random.uniform(0.8, 1.2)
+                continue
+            else:
+                with self._top_lock:
+                    self._top_fetched_at = None
+
+            del pending[: len(batch)]
+            failures = 0
+            next_attempt = 0.0
+            self.online = True
+            if spooled:
+                self._write_spool(pending)
+                spooled = bool(pending)
+            with self._sent:
+                self._unsent = max(0, self._unsent - len(batch))
+                self._sent.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every submitted and spooled score has been delivered or rejected.
+
+        Returns ``False`` on timeout or when ``close`` left scores in the spool.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._sent:
+            while not self._spool_loaded or self._unsent > 0:
+                if self._stopped:
+                    return False
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._sent.wait(remaining)
+        return True
+
+    def cached_top(self, limit: int = 5) -> list[dict]:
+        """Last fetched remote top list; refreshes in the background when stale."""
+        with self._top_lock:
+            entries = list(self._top_entries)
+            stale = (
+                self._top_fetched_at is None
+                or limit != self._top_limit
+                or time.monotonic() - self._top_fetched_at >= self.top_ttl_s
+            )
+            if stale and not self._top_refreshing:
+                self._top_refreshing = True
+                self._top_limit = limit
+                threading.Thread(
+                    target=self._refresh_top,
+                    args=(limit,),
+                    name="remote-leaderboard-top",
+                    daemon=True,
+                ).start()
+        return entries[:limit]
+
+    def _refresh_top(self, limit: int):
+        entries = None
+        try:
+            payload = self._request("GET", f"/scores/top?limit={int(limit)}")
+            if isinstance(payload, dict) and isinstance(payload.get("entries"), list):
+                entries = payload["entries"]
+        except (OSError, http.client.HTTPException, ValueError):
+            entries = None
+        with self._top_lock:
+            if entries is not None:
+                self._top_entries = entries
+            # Failed fetches also wait a full TTL before retrying.
+            self._top_fetched_at = time.monotonic()
+            self._top_refreshing = False
+
+    def close(self, timeout: float = 1.0):
+        """Stop the sender, spooling anything still unsent."""
+        self._queue.put(_STOP)
+        self._sender.join(timeout)
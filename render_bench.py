@@ -0,0 +1,230 @@
+"""Headless render throughput benchmark.
+
+Builds canned game states for each screen, then times repeated draws under
+the SDL dummy driver and measures Python-heap allocation per frame with
+``tracemalloc``. Every scene's final frame is hashed so a render
+optimization can be checked against hashes saved before it:
+
+    python render_bench.py --save hashes.json
+    python render_bench.py --check hashes.json [--scenes pause,boss]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from config import FPS
+from game import Game
+from stress import BIG_STRESS_BOARD, _playable_cells, hamiltonian_cycle
+
+SCENE_SEED = 1234
+SNAKE_LENGTH = 40
+BIG_SNAKE_LENGTH = 400
+SIM_STEP_MS = 16.0
+
+
+def _fresh_level(game: Game, level: int):
+    random.seed(SCENE_SEED)
+    game.level = level
+    game.layout_ready = False
+    game.game_started = True
+    game.game_over = False
+    game.start_level()
+
+
+def _lay_snake(game: Game, length: int):
+    """Lay the snake along a Hamiltonian cycle, one tick after a move."""
+    cycle = hamiltonian_cycle(_playable_cells(game))
+    length = max(2, min(length, len(cycle) - 2))
+    snake = game.snake
+    snake.segments = [cycle[index] for index in range(length - 1, -1, -1)]
+    snake.grow_pending = 0
+    snake.fading_segments = []
+    snake.reset_interpolation()
+    snake.move_head(cycle[length])
+    head, neck = snake.segments[0], snake.segments[1]
+    snake.direction = snake.pending_direction = (head[0] - neck[0], head[1] - neck[1])
+    random.seed(SCENE_SEED)
+    game.spawn_food()
+    # Mid-tick, so the interpolated path is drawn.
+    game.move_accumulator_ms = 0.5 * 1000 / (FPS * game.speed_multiplier)
+
+
+def _playfield(level_of: Callable[[Game], int], length: int = SNAKE_LENGTH):
+    def setup(game: Game):
+        _fresh_level(game, level_of(game))
+        _lay_snake(game, length)
+
+    return setup
+
+
+def _draw_playfield(game: Game):
+    game.draw_playfield()
+    game.present()
+
+
+def _setup_intro(game: Game):
+    random.seed(SCENE_SEED)
+    game.game_started = False
+    game.menu_page = "main"
+    game._reset_intro_sequence()
+    for _ in range(30):
+        game._advance_intro_veil()
+    game.scheduler.advance(game.intro_move_interval_ms * 0.5)
+
+
+def _setup_loading(game: Game):
+    _fresh_level(game, 2)
+    game.begin_loading()
+    game.loading_reveal_count = len(game.loading_tiles) // 2
+
+
+def _setup_boss(game: Game):
+    random.seed(SCENE_SEED)
+    game.jump_to_final_boss()
+    # Let the boss arrive and fire a few volleys.
+    for _ in range(int(4000 / SIM_STEP_MS)):
+        game.scheduler.advance(SIM_STEP_MS)
+        game._update_starfield(SIM_STEP_MS)
+        game._update_boss(SIM_STEP_MS)
+        game._update_boss_bullets(SIM_STEP_MS)
+    head_x, head_y = game.snake.head
+    for offset in (1.5, 4.0, 7.5):
+        game.player_shots.append({"x": head_x + offset, "y": head_y + 0.5, "vx": 1.0, "vy": 0.0})
+
+
+def _setup_victory(game: Game):
+    _setup_boss(game)
+    game._start_victory_sequence()
+    for _ in range(int(250 / SIM_STEP_MS)):
+        game.scheduler.advance(SIM_STEP_MS)
+        game._update_victory(SIM_STEP_MS)
+
+
+def _setup_pause(game: Game):
+    _playfield(lambda game: 2)(game)
+    game.game_paused = True
+
+
+class Scene:
+    def __init__(self, name: str, setup: Callable[[Game], None], draw: Callable[[Game], None], big: bool = False):
+        self.name = name
+        self.setup = setup
+        self.draw = draw
+        self.big = big
+
+
+SCENES = [
+    Scene("start-intro", _setup_intro, Game.draw_start_screen),
+    Scene("playfield-classic", _playfield(lambda game: 2), _draw_playfield),
+    Scene("playfield-tetris", _playfield(lambda game: game.first_tetris_level), _draw_playfield),
+    Scene("playfield-sacrifice", _playfield(lambda game: game.first_sacrifice_level), _draw_playfield),
+    Scene("playfield-escape", _playfield(lambda game: game.escape_level), _draw_playfield),
+    Scene("playfield-big", _playfield(lambda game: 1, BIG_SNAKE_LENGTH), _draw_playfield, big=True),
+    Scene("loading", _setup_loading, Game.draw_loading_screen),
+    Scene("boss", _setup_boss, Game.draw_side_scroller),
+    Scene("victory", _setup_victory, Game.draw_side_scroller),
+    Scene("pause", _setup_pause, Game.draw_pause_screen),
+]
+
+
+def frame_hash(game: Game) -> str:
+    return hashlib.md5(pygame.image.tobytes(game.screen, "RGB")).hexdigest()
+
+
+def run_scene(game: Game, scene: Scene, frames: int, alloc_frames: int) -> dict:
+    scene.setup(game)
+    # Warm caches (HUD text, chunks, rotated sprites) before timing.
+    scene.draw(game)
+    started = time.perf_counter()
+    for _ in range(frames):
+        scene.draw(game)
+        pygame.event.pump()
+    elapsed = time.perf_counter() - started
+
+    # Python-heap allocation only: SDL pixel buffers are not traced.
+    tracemalloc.start()
+    peak_total = 0
+    for _ in range(alloc_frames):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        scene.draw(game)
+        peak_total += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    return {
+        "fps": frames / elapsed if elapsed > 0 else 0.0,
+        "ms": elapsed * 1000.0 / max(1, frames),
+        "alloc_kib": peak_total / 1024.0 / max(1, alloc_frames),
+        "hash": frame_hash(game),
+    }
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    names = [scene.name for scene in SCENES]
+    parser = argparse.ArgumentParser(description="Snake Quest headless render benchmark")
+    parser.add_argument("--scenes", default=",".join(names), help=f"comma-separated subset of {', '.join(names)}")
+    parser.add_argument("--frames", type=int, default=300, help="timed frames per scene")
+    parser.add_argument("--alloc-frames", type=int, default=30, help="frames traced for allocation per scene")
+    parser.add_argument("--save", type=Path, default=None, help="write scene frame hashes to this JSON file")
+    parser.add_argument("--check", type=Path, default=None, help="compare frame hashes with this JSON file")
+    args = parser.parse_args(argv)
+    scenes = [name.strip() for name in args.scenes.split(",") if name.strip()]
+    unknown = [name for name in scenes if name not in names]
+    if unknown:
+        parser.error(f"unknown scenes: {', '.join(unknown)}")
+    args.scenes = scenes
+    return args
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    expected = json.loads(args.check.read_text(encoding="utf-8")) if args.check else {}
+
+    games: dict[bool, Game] = {}
+    hashes: dict[str, str] = {}
+    mismatches = 0
+    print(f"{'scene':<22} {'frames/s':>9} {'ms/frame':>9} {'alloc/frame':>12}  hash")
+    for scene in SCENES:
+        if scene.name not in args.scenes:
+            continue
+        game = games.get(scene.big)
+        if game is None:
+            game = games[scene.big] = Game(board_size=BIG_STRESS_BOARD if scene.big else None)
+            # Keep benchmark runs out of the real run history.
+            if game.run_history is not None:
+                game.run_history.close()
+                game.run_history = None
+        result = run_scene(game, scene, args.frames, args.alloc_frames)
+        hashes[scene.name] = result["hash"]
+        status = ""
+        if scene.name in expected:
+            status = "  ok" if expected[scene.name] == result["hash"] else "  CHANGED"
+            mismatches += expected[scene.name] != result["hash"]
+        print(
+            f"{scene.name:<22} {result['fps']:>9.0f} {result['ms']:>9.2f} "
+            f"{result['alloc_kib']:>8.1f} KiB  {result['hash'][:12]}{status}",
+            flush=True,
+        )
+
+    if args.save is not None:
+        args.save.write_text(json.dumps(hashes, indent=2) + "\n", encoding="utf-8")
+        print(f"\nWrote {len(hashes)} frame hashes to {args.save}")
+    pygame.quit()
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+import contextlib
+import json
+import queue
+import sqlite3
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+RUN_HISTORY_PATH = Path(__file__).with_name("run_history.sqlite3")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT,
+        score INTEGER NOT NULL,
+        level INTEGER,
+        elapsed_ms INTEGER,
+        cause TEXT,
+        on_leaderboard INTEGER NOT NULL DEFAULT 1,
+        day TEXT NOT NULL,
+        created_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_runs_top ON runs (on_leaderboard, score DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_runs_level ON runs (level, on_leaderboard, score DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_runs_day ON runs (day, on_leaderboard, score DESC)",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+)
+
+_STOP = object()
+
+
+def read_leaderboard_entries(path: Path) -> list:
+    """Read raw leaderboard.json entries; empty when missing or invalid."""
+    try:
+        if not path.exists():
+            return []
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return []
+
+    entries = None
+    if isinstance(payload, dict):
+        entries = payload.get("entries")
+        if entries is None:
+            entries = payload.get("scores")
+
+    if not isinstance(entries, list):
+        return []
+    return entries
+
+
+class RunHistory:
+    """Every finished run, stored in a local SQLite database (WAL mode).
+
+    Inserts go through a background writer thread so disk latency never
+    blocks a frame. Reads use a per-thread connection and are memoized
+    until the next write. The legacy ``leaderboard.json`` is imported the
+    first time the database is created.
+    """
+
+    def __init__(self, path: Path = RUN_HISTORY_PATH, legacy_leaderboard: Path | None = None):
+        self.path = path
+        self._local = threading.local()
+        self._queue: queue.Queue = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._top_cache: dict[tuple, list[dict]] = {}
+        # Bumped on every write; reads that straddle a write don't cache their rows.
+        self._cache_generation = 0
+        self._cache_lock = threading.Lock()
+
+        # Often runs on a startup worker; don't leave a connection behind on it.
+        with contextlib.closing(self._connect()) as conn:
+            with conn:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+            if legacy_leaderboard is not None:
+                self._import_legacy(conn, legacy_leaderboard)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def _import_legacy(self, conn: sqlite3.Connection, legacy_path: Path):
+        row = conn.execute("SELECT value FROM meta WHERE key = 'legacy_imported'").fetchone()
+        if row is not None:
+            return
+        rows = []
+        today = date.today().isoformat()
+        now = time.time()
+        for entry in read_leaderboard_entries(legacy_path):
+            if isinstance(entry, dict):
+                name = entry.get("name", "Anon")
+                score = entry.get("score", 0)
+            else:
+                name = "Anon"
+                score = entry
+            try:
+                score_value = int(score)
+            except (TypeError, ValueError):
+                continue
+            name_value = str(name).strip() if name else "Anon"
+            rows.append((name_value or "Anon", score_value, None, None, "imported", 1, today, now))
+        with conn:
+            conn.executemany(
+                "INSERT INTO runs (name, score, level, elapsed_ms, cause, on_leaderboard, day, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("INSERT INTO meta (key, value) VALUES ('legacy_imported', ?)", (str(legacy_path),))
+
+    def record_run(
+        self,
+        name: str | None,
+        score: int,
+        level: int,
+        elapsed_ms: float,
+        cause: str,
+        on_leaderboard: bool = True,
+    ):
+        """Queue a finished run for the background writer."""
+        row = (
+            name,
+            int(score),
+            int(level),
+            int(elapsed_ms),
+            cause,
+            1 if on_leaderboard else 0,
+            date.today().isoformat(),
+            time.time(),
+        )
+        self._invalidate_top_cache()
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._write_loop, name="run-history", daemon=True)
+            self._writer.start()
+        self._queue.put(row)
+
+    def _write_loop(self):
+        conn = self._connect()
+        try:
+            while True:
+                item = self._queue.get()
+                batch = []
+                stop = item is _STOP
+                if not stop:
+                    batch.append(item)
+                # Drain whatever else is waiting into the same transaction.
+                while not stop:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                    else:
+                        batch.append(item)
+                if batch:
+                    try:
+                        with conn:
+                            conn.executemany(
+                                "INSERT INTO runs (name, score, level, elapsed_ms, cause,"
+                                " on_leaderboard, day, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                batch,
+                            )
+                    except sqlite3.Error:
+                        pass
+                    self._invalidate_top_cache()
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self._queue.task_done()
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _invalidate_top_cache(self):
+        with self._cache_lock:
+            self._top_cache.clear()
+            self._cache_generation += 1
+
+    def flush(self):
+        """Block until every queued run has been written."""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.join()
+
+    def top_runs(self, limit: int = 5, level: int | None = None, day: str | None = None) -> list[dict]:
+        """Best leaderboard runs overall, for one level, or for one day (YYYY-MM-DD)."""
+        return self._top_runs(self._connection, limit, level, day)
+
+    def warm(self, limit: int = 5):
+        """Cache the overall top list using a connection that is closed afterwards."""
+        with contextlib.closing(self._connect()) as conn:
+            self._top_runs(lambda: conn, limit, None, None)
+
+    def _top_runs(self, connection, limit: int, level: int | None, day: str | None) -> list[dict]:
+        key = (limit, level, day)
+        with self._cache_lock:
+            cached = self._top_cache.get(key)
+            generation = self._cache_generation
+        if cached is not None:
+            return list(cached)
+
+        sql = "SELECT name, score, level, elapsed_ms, cause, day FROM runs WHERE on_leaderboard = 1"
+        params: list = []
+        if level is not None:
+            sql += " AND level = ?"
+            params.append(level)
+        if day is not None:
+            sql += " AND day = ?"
+            params.append(day)
+        sql += " ORDER BY score DESC LIMIT ?"
+        params.append(limit)
+        try:
+            rows = connection().execute(sql, params).fetchall()
+        except sqlite3.Error:
+            return []
+
+        entries = [
+            {
+                "name": name,
+                "score": score,
+                "level": run_level,
+                "elapsed_ms": elapsed_ms,
+                "cause": cause,
+                "day": run_day,
+            }
+            for name, score, run_level, elapsed_ms, cause, run_day in rows
+        ]
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._top_cache[key] = entries
+        return list(entries)
+
+    def close(self):
+        """Flush pending writes and stop the writer thread."""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        self._writer = None
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def open_run_history(
+    path: Path = RUN_HISTORY_PATH,
+    legacy_leaderboard: Path | None = None,
+    warm_limit: int = 5,
+) -> RunHistory | None:
+    """Open the run database and warm the top-list cache; ``None`` if unusable."""
+    try:
+        history = RunHistory(path, legacy_leaderboard)
+        history.warm(warm_limit)
+    except sqlite3.Error:
+        return None
+    return history
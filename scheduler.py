@@ -0,0 +1,147 @@
+import heapq
+import itertools
+from typing import Callable
+
+
+class Timer:
+    """A scheduled callback; repeating when ``interval_ms`` is set."""
+
+    __slots__ = ("due_ms", "interval_ms", "callback", "group", "skip_missed", "active")
+
+    def __init__(self, due_ms: float, interval_ms: float | None, callback: Callable, group: str | None, skip_missed: bool):
+        self.due_ms = due_ms
+        self.interval_ms = interval_ms
+        self.callback = callback
+        self.group = group
+        self.skip_missed = skip_missed
+        self.active = True
+
+    def cancel(self):
+        self.active = False
+
+
+class Tween:
+    """A linear 0..1 ramp over ``duration_ms``; ``on_update`` gets it each frame."""
+
+    __slots__ = ("start_ms", "duration_ms", "on_update", "on_done", "group", "value", "active")
+
+    def __init__(
+        self,
+        start_ms: float,
+        duration_ms: float,
+        on_update: Callable[[float], None] | None,
+        on_done: Callable[[], None] | None,
+        group: str | None,
+    ):
+        self.start_ms = start_ms
+        self.duration_ms = max(1.0, duration_ms)
+        self.on_update = on_update
+        self.on_done = on_done
+        self.group = group
+        self.value = 0.0
+        self.active = True
+
+    def cancel(self):
+        self.active = False
+
+
+class Scheduler:
+    """One clock for timed effects: timeouts, repeating timers and tweens.
+
+    Timers sit in a heap keyed by due time, so ``advance`` only touches the
+    ones that are due; cancelled timers are dropped lazily when they reach
+    the top. Tweens run every frame, but only while they last. Pausing
+    stops the clock for everything at once and ``time_scale`` stretches it.
+    """
+
+    def __init__(self):
+        self.now_ms = 0.0
+        self.time_scale = 1.0
+        self.paused = False
+        self._heap: list[tuple[float, int, Timer]] = []
+        self._tweens: list[Tween] = []
+        self._order = itertools.count()
+
+    def _push(self, timer: Timer) -> Timer:
+        heapq.heappush(self._heap, (timer.due_ms, next(self._order), timer))
+        return timer
+
+    def after(self, delay_ms: float, callback: Callable[[], None], group: str | None = None) -> Timer:
+        return self._push(Timer(self.now_ms + delay_ms, None, callback, group, False))
+
+    def every(
+        self,
+        interval_ms: float,
+        callback: Callable[[], None],
+        group: str | None = None,
+        skip_missed: bool = False,
+    ) -> Timer:
+        """Repeat ``callback``; with ``skip_missed`` a late timer fires once and re-aligns."""
+        return self._push(Timer(self.now_ms + interval_ms, interval_ms, callback, group, skip_missed))
+
+    def tween(
+        self,
+        duration_ms: float,
+        on_update: Callable[[float], None] | None = None,
+        on_done: Callable[[], None] | None = None,
+        group: str | None = None,
+    ) -> Tween:
+        tween = Tween(self.now_ms, duration_ms, on_update, on_done, group)
+        self._tweens.append(tween)
+        return tween
+
+    def cancel_group(self, group: str):
+        for _, _, timer in self._heap:
+            if timer.group == group:
+                timer.active = False
+        self._heap = [entry for entry in self._heap if entry[2].active]
+        heapq.heapify(self._heap)
+        for tween in self._tweens:
+            if tween.group == group:
+                tween.active = False
+
+    def elapsed(self, timer: Timer | None) -> float:
+        """Time since a repeating timer last fired (or was started)."""
+        if timer is None or not timer.active or not timer.interval_ms:
+            return 0.0
+        return max(0.0, timer.interval_ms - (timer.due_ms - self.now_ms))
+
+    def pending(self) -> int:
+        return sum(1 for _, _, timer in self._heap if timer.active) + sum(1 for tween in self._tweens if tween.active)
+
+    def advance(self, dt_ms: float) -> float:
+        """Move the clock by ``dt_ms`` (scaled, unless paused); returns the scaled step."""
+        if self.paused:
+            return 0.0
+        step = max(0.0, dt_ms) * self.time_scale
+        target = self.now_ms + step
+        while self._heap and self._heap[0][0] <= target:
+            due, _, timer = heapq.heappop(self._heap)
+            if not timer.active:
+                continue
+            # Callbacks see the time they were due, so chained timers do not drift.
+            self.now_ms = due
+            if timer.interval_ms:
+                timer.due_ms = due + timer.interval_ms
+                if timer.skip_missed and timer.due_ms <= target:
+                    timer.due_ms = target + timer.interval_ms - (target - due) % timer.interval_ms
+                self._push(timer)
+            else:
+                timer.active = False
+            timer.callback()
+        self.now_ms = target
+
+        if self._tweens:
+            # Tweens started by these callbacks are appended and begin next frame.
+            for tween in list(self._tweens):
+                if not tween.active:
+                    continue
+                tween.value = min(1.0, (target - tween.start_ms) / tween.duration_ms)
+                if tween.on_update is not None:
+                    tween.on_update(tween.value)
+                if tween.value >= 1.0 and tween.active:
+                    tween.active = False
+                    if tween.on_done is not None:
+                        tween.on_done()
+            self._tweens = [tween for tween in self._tweens if tween.active]
+        return step
@@ -1,12 +1,63 @@
+from collections.abc import Sequence
+
 import pygame
+from body_runs import RunBody
 from config import TILE_SIZE, COLOR_SNAKE, load_scaled_image
+from surface_ledger import SURFACE_LEDGER
+
+
+class InterpolatedBody:
+    """Segment positions ``alpha`` of the way through the last tick.
+
+    Each segment slides from the cell of the segment behind it, so the only
+    extra state a tick needs is the cell the tail left (``behind``; ``None``
+    when the snake grew and the last segment stayed put). ``resolve`` lerps
+    just the segments a frame draws.
+    """
+
+    __slots__ = ("_segments", "_behind", "_alpha")
+
+    def __init__(self, segments: list[tuple[int, int]], behind: tuple[int, int] | None, alpha: float):
+        self._segments = segments
+        self._behind = behind
+        self._alpha = alpha
+
+    def resolve(self, indices) -> list:
+        """List with positions at ascending ``indices`` and their neighbours; other entries are ``None``."""
+        segments = self._segments
+        count = len(segments)
+        spans: list[list[int]] = []
+        for index in indices:
+            low, high = max(0, index - 1), min(count, index + 2)
+            if spans and low <= spans[-1][1]:
+                spans[-1][1] = high
+            else:
+                spans.append([low, high])
+
+        alpha = self._alpha
+        behind = self._behind
+        resolved: list = [None] * count
+        for low, high in spans:
+            sources = segments[low + 1:high + 1]
+            if high == count:
+                sources.append(behind if behind is not None else segments[-1])
+            resolved[low:high] = [
+                (x1 + (x2 - x1) * alpha, y1 + (y2 - y1) * alpha)
+                for (x2, y2), (x1, y1) in zip(segments[low:high], sources)
+            ]
+            if high == count and behind is None:
+                resolved[-1] = segments[-1]
+        return resolved
 
 
 class Snake:
-    def __init__(self, grid_pos=(5, 5)):
-        # Snake is a list of (x, y) grid positions, head is index 0
+    def __init__(self, grid_pos=(5, 5), run_body: bool = True):
+        # Snake cells are (x, y) grid positions, head is index 0, kept as
+        # straight runs (RunBody); ``run_body=False`` keeps a plain list.
+        self.run_body = run_body
         self.segments = [grid_pos]
-        self.prev_segments = list(self.segments)
+        # Cell the tail moved out of on the last tick (None after growing)
+        self.behind_tail: tuple[int, int] | None = None
         self.interp_ready = False
 
         # Movement
@@ -29,12 +80,30 @@ class Snake:
         self._rotation_cache = self._build_rotation_cache()
         self.connector_thickness = max(4, int(TILE_SIZE * 0.6))
         self.connector_radius = max(2, int(self.connector_thickness * 0.5))
+        self._connector_images: dict[tuple[int, int], pygame.Surface] = {}
+        SURFACE_LEDGER.register("snake sprites", Snake._sprite_surfaces, anchor=self)
+        SURFACE_LEDGER.register(
+            "snake connectors",
+            lambda snake: snake._connector_images,
+            lambda snake: snake._connector_images.clear(),
+            anchor=self,
+        )
 
         # Fade-in animation for growing segments
         # Each entry: {"pos": (x, y), "alpha": int}
         self.fading_segments = []
         self.fade_speed = 40  # Alpha increase per update
 
+    def _sprite_surfaces(self):
+        return (
+            self.head_frames,
+            self.body_image,
+            self.throat_image,
+            self.tail_image,
+            self.corner_image,
+            self._rotation_cache,
+        )
+
     def _create_head_frames(self):
         """Create simple placeholder frames for a chew animation."""
         frames = []
@@ -115,6 +184,16 @@ class Snake:
 
         return None
 
+    @property
+    def segments(self) -> list[tuple[int, int]] | RunBody:
+        return self._segments
+
+    @segments.setter
+    def segments(self, cells):
+        if self.run_body and not isinstance(cells, RunBody):
+            cells = RunBody(cells)
+        self._segments = cells
+
     @property
     def head(self):
         return self.segments[0]
@@ -140,7 +219,6 @@ class Snake:
 
     def update(self):
         """Move the snake and update animations."""
-        self.prev_segments = list(self.segments)
         self.prev_direction = self.direction
 
         # Advance chew animation
@@ -153,13 +231,11 @@ class Snake:
         dx, dy = self.direction
         new_head = (head_x + dx, head_y + dy)
 
-        self.segments.insert(0, new_head)
-
         # Handle growth
-        if self.grow_pending > 0:
+        grow = self.grow_pending > 0
+        if grow:
             self.grow_pending -= 1
-        else:
-            self.segments.pop()
+        self.move_head(new_head, grow)
 
         # Update fade-in animations
         for seg in self.fading_segments:
@@ -170,79 +246,167 @@ class Snake:
             seg for seg in self.fading_segments
             if seg["alpha"] < 255
         ]
+
+    def move_head(self, new_head: tuple[int, int], grow: bool = False):
+        """Advance the body one cell toward ``new_head`` and record the move for interpolation."""
+        self.segments.insert(0, new_head)
+        self.behind_tail = None if grow else self.segments.pop()
         self.interp_ready = True
 
+    def occupies(self, cell: tuple[int, int], start: int = 0) -> bool:
+        """Whether a segment at index ``start`` or later is on ``cell`` (no list copy)."""
+        try:
+            self.segments.index(cell, start)
+        except ValueError:
+            return False
+        return True
+
+    def drop_tail(self):
+        """Remove the last segment; the new last one keeps sliding out of its cell."""
+        self.behind_tail = self.segments.pop()
+
     def reset_interpolation(self):
-        self.prev_segments = list(self.segments)
+        self.behind_tail = None
         self.prev_direction = self.direction
         self.interp_ready = False
 
+    @property
+    def prev_head(self) -> tuple[int, int]:
+        """Head cell before the last tick (the head itself when not interpolating)."""
+        if not self.interp_ready:
+            return self.segments[0]
+        if len(self.segments) > 1:
+            return self.segments[1]
+        return self.behind_tail or self.segments[0]
+
     def draw(
         self,
         surface: pygame.Surface,
         offset_y: int = 0,
         alpha: float = 0.0,
         offset_x_px: int = 0,
+        visible: tuple[int, int, int, int] | None = None,
+    ):
+        """Draw the snake; ``visible`` (x0, y0, x1, y1 in tiles) skips off-screen segments."""
+        positions, indices = self._draw_positions(alpha, visible)
+        if len(positions) > 1:
+            self._draw_connectors(surface, positions, indices, offset_y, offset_x_px, visible)
+        for key, angle, dest, fade_alpha in self._sprites(positions, indices, alpha, offset_y, offset_x_px, visible):
+            if key == "head":
+                oriented = self._rotated_head(angle, self._get_rotated_head_frame())
+            else:
+                oriented = self._rotated_body(key, angle)
+            self._blit_with_fade(surface, oriented, dest, fade_alpha)
+
+    def draw_textured(
+        self,
+        backend,
+        offset_y: int = 0,
+        alpha: float = 0.0,
+        offset_x_px: int = 0,
+        visible: tuple[int, int, int, int] | None = None,
     ):
+        """Draw through a ``TextureBackend``; the renderer rotates the unrotated sprites."""
+        positions, indices = self._draw_positions(alpha, visible)
+        if len(positions) > 1:
+            for rect in self._connector_rects(positions, indices, offset_y, offset_x_px, visible):
+                backend.copy(self._connector_image(rect.size), rect.topleft)
+        for key, angle, dest, fade_alpha in self._sprites(positions, indices, alpha, offset_y, offset_x_px, visible):
+            backend.copy(self._base_image(key), dest, angle=angle, alpha=fade_alpha)
+
+    def _draw_positions(self, alpha: float, visible: tuple[int, int, int, int] | None):
+        """``(positions, indices)``: positions are filled in for ``indices`` and their neighbours."""
+        indices = self._candidate_indices(visible)
         if not self.interp_ready:
-            alpha = 0.0
+            return self.segments, indices
+        body = InterpolatedBody(self.segments, self.behind_tail, max(0.0, min(1.0, alpha)))
+        return body.resolve(indices), indices
+
+    def _candidate_indices(self, visible: tuple[int, int, int, int] | None):
+        """Indices whose interpolated position can fall inside ``visible``.
+
+        A segment lies between its cell and the cell it slides from, so the
+        box around those two cells is tested without interpolating.
+        """
+        segments = self.segments
+        if visible is None:
+            return range(len(segments))
+        x0, y0, x1, y1 = visible
+        if isinstance(segments, RunBody):
+            # Sources are a neighbouring cell except across a run boundary
+            # (a wrap-around jump), so widen the box by one and keep run ends.
+            return segments.indices_within(x0 - 1, y0 - 1, x1 + 1, y1 + 1, run_ends=True)
+        if self.interp_ready:
+            sources = segments[1:]
+            sources.append(self.behind_tail or segments[-1])
         else:
-            alpha = max(0.0, min(1.0, alpha))
+            sources = segments
+        return [
+            index
+            for index, ((cx, cy), (sx, sy)) in enumerate(zip(segments, sources))
+            if (cx >= x0 or sx >= x0) and (cx < x1 or sx < x1) and (cy >= y0 or sy >= y0) and (cy < y1 or sy < y1)
+        ]
+
+    def _sprites(
+        self,
+        positions: Sequence[tuple[float, float]],
+        indices,
+        alpha: float,
+        offset_y: int,
+        offset_x_px: int,
+        visible: tuple[int, int, int, int] | None,
+    ):
+        """Yield ``(image key, angle, dest, fade alpha)`` for each visible segment."""
+        alpha = max(0.0, min(1.0, alpha)) if self.interp_ready else 0.0
         fade_lookup = {seg["pos"]: seg["alpha"] for seg in self.fading_segments}
-        positions = (
-            self._interpolated_positions(alpha)
-            if self.interp_ready
-            else list(self.segments)
-        )
-        positions = positions[: len(self.segments)]
-        if len(positions) > 1:
-            self._draw_connectors(surface, positions, offset_y, offset_x_px)
-        for index, (x, y) in enumerate(positions):
+        last = len(self.segments) - 1
+        for index in indices:
+            x, y = positions[index]
+            if visible is not None and not (visible[0] <= x < visible[2] and visible[1] <= y < visible[3]):
+                continue
             dest = (int(x * TILE_SIZE + offset_x_px), int(y * TILE_SIZE + offset_y))
-
-            # Determine fade overlay
             fade_alpha = fade_lookup.get((int(x), int(y)))
 
             if index == 0:
                 # Head with chew animation and rotation
-                frame = self._get_rotated_head_frame()
                 head_dir = self._head_direction_for_alpha(alpha)
-                angle = self._direction_to_angle(head_dir)
-                oriented = self._rotated_head(angle, frame)
-                self._blit_with_fade(surface, oriented, dest, fade_alpha)
-            elif index == len(self.segments) - 1:
+                yield "head", self._direction_to_angle(head_dir), dest, fade_alpha
+            elif index == last:
                 # Tail pointing toward previous segment
-                cur_x, cur_y = positions[index]
                 prev_x, prev_y = positions[index - 1]
-                dx, dy = cur_x - prev_x, cur_y - prev_y
-                angle = self._direction_to_angle(self._axis_direction(dx, dy))
-                oriented = self._rotated_body("tail", angle)
-                self._blit_with_fade(surface, oriented, dest, fade_alpha)
+                angle = self._direction_to_angle(self._axis_direction(x - prev_x, y - prev_y))
+                yield "tail", angle, dest, fade_alpha
             else:
                 corner_angle = self._corner_angle_from_positions(positions, index)
                 if corner_angle is not None and self.corner_image is not None:
-                    oriented = self._rotated_body("corner", corner_angle)
+                    yield "corner", corner_angle, dest, fade_alpha
                 else:
                     angle = self._body_angle_from_positions(positions, index)
-                    cache_key = "throat" if index == 1 else "body"
-                    oriented = self._rotated_body(cache_key, angle)
-                self._blit_with_fade(surface, oriented, dest, fade_alpha)
-
-    def _interpolated_positions(self, alpha: float) -> list[tuple[float, float]]:
-        current = list(self.segments)
-        previous = list(self.prev_segments) if self.prev_segments else current
-
-        if len(previous) > len(current):
-            current.extend([current[-1]] * (len(previous) - len(current)))
-        elif len(previous) < len(current):
-            previous.extend([previous[-1]] * (len(current) - len(previous)))
-
-        interpolated = []
-        for (x1, y1), (x2, y2) in zip(previous, current):
-            ix = x1 + (x2 - x1) * alpha
-            iy = y1 + (y2 - y1) * alpha
-            interpolated.append((ix, iy))
-        return interpolated
+                    yield ("throat" if index == 1 else "body"), angle, dest, fade_alpha
+
+    def base_images(self) -> list[pygame.Surface]:
+        """The unrotated sprites ``draw_textured`` copies, e.g. to upload ahead of time."""
+        return [self._base_image(key) for key in ("head", "throat", "body", "corner", "tail")]
+
+    def _base_image(self, key: str) -> pygame.Surface:
+        """Unrotated sprite for a ``_sprites`` key."""
+        if key == "head":
+            return self._get_rotated_head_frame()
+        if key == "tail":
+            return self.tail_image
+        if key == "corner" and self.corner_image is not None:
+            return self.corner_image
+        if key == "throat":
+            return self.throat_image
+        return self.body_image
+
+    def _connector_image(self, size: tuple[int, int]) -> pygame.Surface:
+        image = self._connector_images.get(size)
+        if image is None:
+            image = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(image, COLOR_SNAKE, image.get_rect(), border_radius=self.connector_radius)
+            self._connector_images[size] = image
+        return image
 
     def _blit_with_fade(self, surface: pygame.Surface, image: pygame.Surface, dest, fade_alpha: int | None):
         if fade_alpha is not None:
@@ -341,8 +505,8 @@ class Snake:
         return self.head_frames[self.anim_index % len(self.head_frames)]
 
     def _head_direction(self) -> tuple[int, int]:
-        if self.prev_segments and self.segments:
-            prev_head = self.prev_segments[0]
+        if self.segments:
+            prev_head = self.prev_head
             head = self.segments[0]
             dx = head[0] - prev_head[0]
             dy = head[1] - prev_head[1]
@@ -357,7 +521,7 @@ class Snake:
             return self.prev_direction
         return self._head_direction()
 
-    def _body_angle_from_positions(self, positions: list[tuple[float, float]], index: int) -> int:
+    def _body_angle_from_positions(self, positions: Sequence[tuple[float, float]], index: int) -> int:
         if index <= 0 or index >= len(positions) - 1:
             return self._body_angle(index)
 
@@ -378,7 +542,7 @@ class Snake:
 
         return self._direction_to_angle(dir1)
 
-    def _corner_angle_from_positions(self, positions: list[tuple[float, float]], index: int) -> int | None:
+    def _corner_angle_from_positions(self, positions: Sequence[tuple[float, float]], index: int) -> int | None:
         if index <= 0 or index >= len(positions) - 1:
             return None
 
@@ -424,18 +588,38 @@ class Snake:
     def _draw_connectors(
         self,
         surface: pygame.Surface,
-        positions: list[tuple[float, float]],
+        positions: Sequence[tuple[float, float]],
+        indices,
+        offset_y: int,
+        offset_x_px: int = 0,
+        visible: tuple[int, int, int, int] | None = None,
+    ):
+        for rect in self._connector_rects(positions, indices, offset_y, offset_x_px, visible):
+            pygame.draw.rect(surface, COLOR_SNAKE, rect, border_radius=self.connector_radius)
+
+    def _connector_rects(
+        self,
+        positions: Sequence[tuple[float, float]],
+        indices,
         offset_y: int,
         offset_x_px: int = 0,
+        visible: tuple[int, int, int, int] | None = None,
     ):
         half = TILE_SIZE / 2
         thickness = self.connector_thickness
-        radius = self.connector_radius
-        for index in range(1, len(positions)):
+        count = len(positions)
+        for start in indices:
+            index = start + 1
+            if index >= count:
+                continue
             x1, y1 = positions[index - 1]
             x2, y2 = positions[index]
             if abs(x1 - x2) > 1.5 or abs(y1 - y2) > 1.5:
                 continue
+            if visible is not None and not (
+                visible[0] <= x1 < visible[2] and visible[1] <= y1 < visible[3]
+            ):
+                continue
             cx1 = x1 * TILE_SIZE + half + offset_x_px
             cy1 = y1 * TILE_SIZE + offset_y + half
             cx2 = x2 * TILE_SIZE + half + offset_x_px
@@ -454,4 +638,4 @@ class Snake:
 
             rect = pygame.Rect(0, 0, int(round(width)), int(round(height)))
             rect.center = (int(round((cx1 + cx2) / 2)), int(round((cy1 + cy2) / 2)))
-            pygame.draw.rect(surface, COLOR_SNAKE, rect, border_radius=radius)
+            yield rect
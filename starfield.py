@@ -0,0 +1,142 @@
+import random
+
+import pygame
+from surface_ledger import SURFACE_LEDGER, surface_bytes
+
+# (share of the speed range, star radius, glow range, tile width) from far
+# to near. Tiles repeat across the view; unequal widths keep the repeats of
+# different layers from lining up.
+STAR_LAYERS = (
+    (0.0, 1, (150, 200), 240),
+    (0.5, 2, (170, 230), 200),
+    (1.0, 3, (200, 255), 180),
+)
+TWINKLE_COUNT = 12
+# The dense boss field is split into this many sets revealed one by one.
+DENSE_STEPS = 3
+
+
+def _star_color(glow: int) -> tuple[int, int, int]:
+    return glow, glow, min(255, glow + 40)
+
+
+class ParallaxStarfield:
+    """Star layers pre-rendered once and scrolled at per-layer speeds.
+
+    Each layer is a narrow, horizontally tileable, RLE colorkeyed tile
+    repeated across the view, so a frame is a handful of blits per layer
+    however many stars it holds, and the layers hold a fraction of a
+    full-screen surface each. The extra
+    stars of the dense field are pre-rendered into ``DENSE_STEPS`` more sets
+    of layers that share the base offsets and are revealed as ``boost``
+    rises (surface alpha would drop the RLE blit). A handful of loose stars
+    twinkle on top.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        count: int,
+        speed_range: tuple[float, float],
+        dense_factor: int = 10,
+    ):
+        self.width = width
+        self.height = height
+        self.count = count
+        self.dense_factor = dense_factor
+        low, high = speed_range
+        self.speeds = [low + (high - low) * share for share, _, _, _ in STAR_LAYERS]
+        self.offsets = [0.0] * len(STAR_LAYERS)
+        # Layers are rebuilt from this seed after an eviction.
+        self.seed = random.randrange(1 << 30)
+        self.boost = 0.0
+        # Base set first, then the dense sets; each built on first use.
+        self._sets: list[list[pygame.Surface] | None] = [None] * (1 + DENSE_STEPS)
+        self.twinkles = [self._twinkle(random.uniform(0, width)) for _ in range(TWINKLE_COUNT)]
+        SURFACE_LEDGER.register(
+            "starfield",
+            lambda field: field._sets,
+            ParallaxStarfield.drop_layers,
+            anchor=self,
+        )
+
+    def _twinkle(self, x: float) -> dict:
+        layer = random.randrange(len(STAR_LAYERS))
+        return {
+            "x": x,
+            "y": random.uniform(0, self.height),
+            "layer": layer,
+            "size": STAR_LAYERS[layer][1],
+            "glow": random.randint(160, 255),
+        }
+
+    def _build_layer(
+        self, seed: int, count: int, size: int, glow_range: tuple[int, int], tile_width: int
+    ) -> pygame.Surface:
+        rng = random.Random(seed)
+        layer = pygame.Surface((tile_width, self.height))
+        for _ in range(count):
+            x = rng.uniform(0, tile_width)
+            y = rng.uniform(0, self.height)
+            color = _star_color(rng.randint(*glow_range))
+            # Repeat stars that cross an edge so the tile repeats seamlessly.
+            for wrap_x in (x - tile_width, x, x + tile_width):
+                if -size <= wrap_x < tile_width + size:
+                    pygame.draw.circle(layer, color, (int(wrap_x), int(y)), size)
+        layer.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return layer
+
+    def _layer_set(self, index: int) -> list[pygame.Surface]:
+        layers = self._sets[index]
+        if layers is None:
+            per_layer = self.count // len(STAR_LAYERS)
+            if index:
+                per_layer = per_layer * (self.dense_factor - 1) // DENSE_STEPS
+            layers = self._sets[index] = [
+                self._build_layer(
+                    self.seed + 1009 * index + layer,
+                    # Same density as a full-width layer.
+                    max(1, per_layer * tile_width // self.width),
+                    size,
+                    glow_range,
+                    tile_width,
+                )
+                for layer, (_, size, glow_range, tile_width) in enumerate(STAR_LAYERS)
+            ]
+            SURFACE_LEDGER.grew(sum(surface_bytes(layer) for layer in layers))
+        return layers
+
+    def drop_layers(self):
+        self._sets = [None] * len(self._sets)
+
+    def update(self, dt_ms: float):
+        dt_sec = max(0.0, dt_ms / 1000.0)
+        width = self.width
+        for index, speed in enumerate(self.speeds):
+            self.offsets[index] = (self.offsets[index] + speed * dt_sec) % STAR_LAYERS[index][3]
+        for index, star in enumerate(self.twinkles):
+            star["x"] -= self.speeds[star["layer"]] * dt_sec
+            if star["x"] < -4:
+                self.twinkles[index] = self._twinkle(width + random.uniform(0, width * 0.2))
+            elif random.random() < 0.1:
+                star["glow"] = random.randint(160, 255)
+
+    def draw(self, surface: pygame.Surface, top: int):
+        shown = 1 + int(DENSE_STEPS * max(0.0, min(1.0, self.boost)) + 1e-6)
+        width = self.width
+        blits = []
+        for index in range(shown):
+            for layer, offset in zip(self._layer_set(index), self.offsets):
+                tile_width = layer.get_width()
+                for x in range(-int(offset), width, tile_width):
+                    blits.append((layer, (x, top)))
+        surface.blits(blits, doreturn=False)
+
+        for star in self.twinkles:
+            pygame.draw.circle(
+                surface,
+                _star_color(star["glow"]),
+                (int(star["x"]), int(star["y"]) + top),
+                star["size"],
+            )
@@ -0,0 +1,93 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE,
+    HUD_HEIGHT, PLAYFIELD_HEIGHT,
+    MENU_FONT_FILE, UI_FONT_FILE,
+    decode_scaled_image, resolve_font_path,
+)
+from grid import build_background
+from startup_timeline import TIMELINE
+
+# (filename, size, smooth) for every image the menu and first level use.
+# Keep in sync with the load_scaled_image calls in game.py, snake.py and food.py.
+STARTUP_IMAGES = (
+    ("menubg.png", (SCREEN_WIDTH, SCREEN_HEIGHT), True),
+    ("menubg2.png", (SCREEN_WIDTH, SCREEN_HEIGHT), True),
+    ("banner.png", (SCREEN_WIDTH, HUD_HEIGHT), True),
+    ("key.png", (TILE_SIZE, TILE_SIZE), True),
+    ("food.png", (TILE_SIZE, TILE_SIZE), True),
+    ("snake_head_0.png", (TILE_SIZE, TILE_SIZE), True),
+    ("head.png", (TILE_SIZE, TILE_SIZE), True),
+    ("segment.png", (TILE_SIZE, TILE_SIZE), False),
+    ("snake_body.png", (TILE_SIZE, TILE_SIZE), False),
+    ("throat.png", (TILE_SIZE, TILE_SIZE), True),
+    ("tail.png", (TILE_SIZE, TILE_SIZE), True),
+    ("corner.png", (TILE_SIZE, TILE_SIZE), False),
+)
+
+
+def _decode_startup_image(filename: str, size: tuple[int, int], smooth: bool):
+    return decode_scaled_image(filename, size, smooth=smooth)
+
+
+def _resolve_fonts() -> dict[str, str | None]:
+    # A cold font cache enumerates every installed system font; do it here
+    # so Game() only opens already-resolved files.
+    return {family: resolve_font_path(family) for family in (MENU_FONT_FILE, UI_FONT_FILE)}
+
+
+class StartupLoader:
+    """Run file reads, decodes and CPU-side precomputation on worker threads.
+
+    Tasks are submitted by name while the splash screen is running. Anything
+    that must happen on the main thread (display conversion, font objects,
+    mixer music) is left to the caller, which picks up results by name.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="startup",
+        )
+        self._futures: dict[str, Future] = {}
+
+    def submit(self, name: str, fn, *args, **kwargs) -> Future:
+        future = self._executor.submit(self._run_timed, name, fn, *args, **kwargs)
+        self._futures[name] = future
+        return future
+
+    @staticmethod
+    def _run_timed(name: str, fn, *args, **kwargs):
+        with TIMELINE.section(f"worker {name}"):
+            return fn(*args, **kwargs)
+
+    def start(self):
+        """Queue the standard game asset work."""
+        self.submit("fonts", _resolve_fonts)
+        for filename, size, smooth in STARTUP_IMAGES:
+            self.submit(f"image:{filename}:{size}", _decode_startup_image, filename, size, smooth)
+        self.submit("background", build_background, PLAYFIELD_HEIGHT)
+        self.submit("menu_background", build_background, SCREEN_HEIGHT)
+
+    def ready(self, name: str) -> bool:
+        future = self._futures.get(name)
+        return future is None or future.done()
+
+    def result(self, name: str, default=None):
+        """Wait for a named task; return ``default`` if missing or failed."""
+        future = self._futures.get(name)
+        if future is None:
+            return default
+        try:
+            return future.result()
+        except Exception:
+            return default
+
+    def wait_all(self):
+        with TIMELINE.section("wait for startup workers"):
+            for name in list(self._futures):
+                self.result(name)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+        self._futures.clear()
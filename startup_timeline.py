@@ -0,0 +1,88 @@
+import csv
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class StartupTimeline:
+    """Record wall time for named startup steps.
+
+    Sections are cheap (two ``perf_counter`` calls and an append), so they
+    are always recorded until ``stop`` is called once the menu is up;
+    ``main.py --profile-startup`` prints or exports them. Sections may nest
+    and may run on startup worker threads.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.active = True
+        self.entries: list[dict] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def section(self, name: str):
+        if not self.active:
+            yield
+            return
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._local.depth = depth
+            entry = {
+                "name": name,
+                "start_ms": (start - self.origin) * 1000.0,
+                "duration_ms": (end - start) * 1000.0,
+                "depth": depth,
+                "thread": threading.current_thread().name,
+            }
+            with self._lock:
+                self.entries.append(entry)
+
+    def stop(self):
+        """Stop recording; later sections become no-ops."""
+        self.active = False
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.origin) * 1000.0
+
+    def sorted_entries(self) -> list[dict]:
+        with self._lock:
+            entries = list(self.entries)
+        entries.sort(key=lambda entry: entry["duration_ms"], reverse=True)
+        return entries
+
+    def report(self) -> str:
+        lines = [f"Startup wall time: {self.elapsed_ms():.1f} ms", ""]
+        lines.append(f"{'duration':>10}  {'start':>9}  {'thread':<12}  step")
+        for entry in self.sorted_entries():
+            indent = "  " * entry["depth"]
+            lines.append(
+                f"{entry['duration_ms']:>8.1f}ms  {entry['start_ms']:>7.1f}ms  "
+                f"{entry['thread'][:12]:<12}  {indent}{entry['name']}"
+            )
+        return "\n".join(lines)
+
+    def export(self, path: Path):
+        """Write the sorted breakdown as JSON, or CSV for a ``.csv`` path."""
+        entries = self.sorted_entries()
+        if path.suffix.lower() == ".csv":
+            with path.open("w", newline="", encoding="utf-8") as handle:
+                writer = csv.DictWriter(
+                    handle,
+                    fieldnames=["name", "start_ms", "duration_ms", "depth", "thread"],
+                )
+                writer.writeheader()
+                writer.writerows(entries)
+            return
+        payload = {"total_ms": self.elapsed_ms(), "entries": entries}
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+TIMELINE = StartupTimeline()
@@ -0,0 +1,353 @@
+"""Full-board endurance stress run.
+
+Drives the snake along a Hamiltonian cycle of each level family's playable
+cells until it fills the board, timing simulation ticks and frames as the
+body grows and guarding ``spawn_food`` with a watchdog.
+
+    python stress.py [--families classic,tetris,...] [--max-length N] [--list-body]
+"""
+
+import argparse
+import os
+import signal
+import sys
+import time
+from collections import deque
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from game import Game
+
+FAMILIES = ("classic", "tetris", "sacrifice", "escape", "big")
+BIG_STRESS_BOARD = (48, 32)
+BUCKET_SEGMENTS = 100
+
+Cell = tuple[int, int]
+
+
+class SpawnTimeout(Exception):
+    pass
+
+
+def hamiltonian_cycle(cells: set[Cell]) -> list[Cell]:
+    """Cycle through the cells covered by a spanning tree of 2x2 blocks.
+
+    The cells are tiled with 2x2 blocks (using whichever grid parity covers
+    the most of them); walking around a spanning tree of the largest
+    connected group of blocks visits each of their cells exactly once.
+    Cells that no block covers are left out.
+    """
+    best: tuple[int, int, set[Cell]] | None = None
+    for ox in (0, 1):
+        for oy in (0, 1):
+            blocks = set()
+            for x, y in cells:
+                if (x - ox) % 2 or (y - oy) % 2:
+                    continue
+                if {(x + 1, y), (x, y + 1), (x + 1, y + 1)} <= cells:
+                    blocks.add(((x - ox) // 2, (y - oy) // 2))
+            if best is None or len(blocks) > len(best[2]):
+                best = (ox, oy, blocks)
+    if best is None or not best[2]:
+        return []
+    ox, oy, blocks = best
+
+    # Spanning tree (BFS) of the largest connected group of blocks.
+    edges: set[tuple[tuple[int, int], tuple[int, int]]] = set()
+    largest: set[tuple[int, int]] = set()
+    unvisited = set(blocks)
+    while unvisited:
+        root = min(unvisited)
+        unvisited.discard(root)
+        group = {root}
+        group_edges = set()
+        queue = deque([root])
+        while queue:
+            bx, by = queue.popleft()
+            for neighbor in ((bx + 1, by), (bx - 1, by), (bx, by + 1), (bx, by - 1)):
+                if neighbor in unvisited:
+                    unvisited.discard(neighbor)
+                    group.add(neighbor)
+                    group_edges.add(((bx, by), neighbor))
+                    group_edges.add((neighbor, (bx, by)))
+                    queue.append(neighbor)
+        if len(group) > len(largest):
+            largest, edges = group, group_edges
+
+    def step(cell: Cell) -> Cell:
+        x, y = cell
+        block = ((x - ox) // 2, (y - oy) // 2)
+        local = ((x - ox) % 2, (y - oy) % 2)
+        bx, by = block
+        if local == (0, 0):
+            return (x, y - 1) if (block, (bx, by - 1)) in edges else (x + 1, y)
+        if local == (1, 0):
+            return (x + 1, y) if (block, (bx + 1, by)) in edges else (x, y + 1)
+        if local == (1, 1):
+            return (x, y + 1) if (block, (bx, by + 1)) in edges else (x - 1, y)
+        return (x - 1, y) if (block, (bx - 1, by)) in edges else (x, y - 1)
+
+    root = min(largest)
+    start = (root[0] * 2 + ox, root[1] * 2 + oy)
+    cycle = [start]
+    cell = step(start)
+    while cell != start:
+        cycle.append(cell)
+        cell = step(cell)
+    assert len(cycle) == len(largest) * 4, "cycle does not cover its blocks"
+    return cycle
+
+
+def _playable_cells(game: Game) -> set[Cell]:
+    """Cells a head can enter without ending the run in the current level."""
+    if game._in_sacrifice_levels():
+        return set(game.sacrifice_left_cells or game.sacrifice_playable_cells or ())
+    return {
+        (x, y)
+        for x in range(game.board_cols)
+        for y in range(game.board_rows)
+        if (x, y) not in game.wall_positions
+        and (game.playable_cells is None or (x, y) in game.playable_cells)
+    }
+
+
+def _family_levels(game: Game, family: str) -> list[tuple[str, int]]:
+    if family == "tetris":
+        return [
+            (f"tetris-{level - game.first_tetris_level + 1}", level)
+            for level in range(game.first_tetris_level, game.last_tetris_level + 1)
+        ]
+    if family == "sacrifice":
+        return [("sacrifice", game.first_sacrifice_level)]
+    if family == "escape":
+        return [("escape", game.escape_level)]
+    return [(family, 1)]
+
+
+class Bucket:
+    def __init__(self):
+        self.ticks = 0
+        self.tick_s = 0.0
+        self.frames = 0
+        self.frame_s = 0.0
+
+    def rate(self, count: int, seconds: float) -> str:
+        return f"{count / seconds:9.0f}" if seconds > 0 else "        -"
+
+
+class StressRun:
+    def __init__(self, game: Game, name: str, args: argparse.Namespace):
+        self.game = game
+        self.name = name
+        self.args = args
+        self.buckets: dict[int, Bucket] = {}
+        self.spawn_calls = 0
+        self.spawn_max_ms = 0.0
+        self.spawn_timeouts = 0
+        self.off_cycle_spawns = 0
+        self.failure = ""
+
+    def _spawn_food(self) -> Cell | None:
+        """Call ``Game.spawn_food`` under a watchdog and time it."""
+        game = self.game
+        use_alarm = hasattr(signal, "setitimer")
+        started = time.perf_counter()
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, self.args.timeout)
+        try:
+            game.spawn_food()
+        except SpawnTimeout:
+            self.spawn_timeouts += 1
+            game.food.position = None
+        finally:
+            if use_alarm:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        self.spawn_calls += 1
+        self.spawn_max_ms = max(self.spawn_max_ms, elapsed_ms)
+        return game.food.position
+
+    def _place_food(self, on_cycle: set[Cell]):
+        """Spawn food, re-rolling a few times if it lands off the cycle."""
+        for _ in range(8):
+            position = self._spawn_food()
+            if position is None or position in on_cycle:
+                return
+        # The cycle skips cells no 2x2 block covers; park the food on the
+        # cycle so the run keeps growing.
+        self.off_cycle_spawns += 1
+        snake_cells = set(self.game.snake.segments)
+        blocked = {self.game.button_pos, self.game.key_pos}
+        free = [cell for cell in on_cycle if cell not in snake_cells and cell not in blocked]
+        self.game.food.position = free[0] if free else None
+
+    def _bucket(self, length: int) -> Bucket:
+        key = length // BUCKET_SEGMENTS
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = Bucket()
+        return bucket
+
+    def run(self) -> bool:
+        game = self.game
+        cycle = hamiltonian_cycle(_playable_cells(game))
+        if len(cycle) < 4:
+            self.failure = "no cycle"
+            return False
+        on_cycle = set(cycle)
+        next_cell = {cell: cycle[(i + 1) % len(cycle)] for i, cell in enumerate(cycle)}
+        target = min(self.args.max_length, len(cycle))
+        self.cycle_length = len(cycle)
+
+        snake = game.snake
+        snake.segments = [cycle[0], cycle[-1]]
+        snake.grow_pending = 0
+        snake.fading_segments = []
+        first_move = (cycle[1][0] - cycle[0][0], cycle[1][1] - cycle[0][1])
+        snake.direction = snake.pending_direction = first_move
+        snake.reset_interpolation()
+        self._place_food(on_cycle)
+
+        stalled = 0
+        draw_every = max(1, self.args.draw_every)
+        tick_index = 0
+        while len(snake.segments) < target:
+            if game.game_over:
+                self.failure = f"game over ({game.death_cause}) at length {len(snake.segments)}"
+                return False
+            if game.food.position is None:
+                self.failure = f"no free cell at length {len(snake.segments)}"
+                return False
+            if stalled > len(cycle) * 2:
+                self.failure = f"food unreachable at length {len(snake.segments)}"
+                return False
+
+            head = snake.head
+            nxt = next_cell[head]
+            bucket = self._bucket(len(snake.segments))
+            started = time.perf_counter()
+            snake.set_direction((nxt[0] - head[0], nxt[1] - head[1]))
+            snake.update()
+            game.check_collisions()
+            eaten = game.food.position
+            if snake.head == eaten:
+                # Mirrors check_food_eaten, but with extra growth and with
+                # spawn_food run under the watchdog.
+                room = target - len(snake.segments) - snake.grow_pending
+                snake.grow(max(0, min(1 + self.args.growth, room)))
+                game.points += 1
+                game.level_food_eaten += 1
+                self._place_food(on_cycle)
+                stalled = 0
+            else:
+                stalled += 1
+            bucket.ticks += 1
+            bucket.tick_s += time.perf_counter() - started
+
+            tick_index += 1
+            if tick_index % draw_every == 0:
+                started = time.perf_counter()
+                game.draw_playfield()
+                pygame.display.flip()
+                bucket.frames += 1
+                bucket.frame_s += time.perf_counter() - started
+                pygame.event.pump()
+
+        if game.game_over:
+            self.failure = f"game over ({game.death_cause}) at length {len(snake.segments)}"
+            return False
+        # A full board must leave the food unplaced rather than spin forever.
+        if len(snake.segments) >= len(cycle):
+            position = self._spawn_food()
+            if position is not None and position in snake.segments:
+                self.failure = "food spawned inside the snake on a full board"
+                return False
+        if self.spawn_timeouts:
+            self.failure = f"spawn_food hung {self.spawn_timeouts} time(s)"
+            return False
+        return True
+
+    def report(self) -> str:
+        lines = [f"{self.name}: cycle={getattr(self, 'cycle_length', 0)} cells"]
+        lines.append("  length     ticks/s  frames/s")
+        for key in sorted(self.buckets):
+            bucket = self.buckets[key]
+            low = key * BUCKET_SEGMENTS
+            label = f"{low:>4}-{low + BUCKET_SEGMENTS - 1:<4}"
+            lines.append(
+                f"  {label} {bucket.rate(bucket.ticks, bucket.tick_s)} "
+                f"{bucket.rate(bucket.frames, bucket.frame_s)}"
+            )
+        lines.append(
+            f"  spawn_food: calls={self.spawn_calls} max={self.spawn_max_ms:.2f}ms "
+            f"timeouts={self.spawn_timeouts} off-cycle={self.off_cycle_spawns}"
+        )
+        lines.append(f"  result: {'FAIL ' + self.failure if self.failure else 'ok'}")
+        return "\n".join(lines)
+
+
+def _on_alarm(signum, frame):
+    raise SpawnTimeout()
+
+
+def _setup(game: Game, level: int):
+    game.level = level
+    game.layout_ready = False
+    game.game_started = True
+    game.game_over = False
+    game.start_level()
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Snake Quest full-board stress run")
+    parser.add_argument(
+        "--families",
+        default=",".join(FAMILIES),
+        help=f"comma-separated subset of {', '.join(FAMILIES)}",
+    )
+    parser.add_argument("--max-length", type=int, default=10_000, help="stop growing at this length")
+    parser.add_argument("--growth", type=int, default=16, help="extra segments gained per food")
+    parser.add_argument("--draw-every", type=int, default=10, help="draw one frame every N ticks")
+    parser.add_argument("--timeout", type=float, default=1.0, help="spawn_food watchdog in seconds")
+    parser.add_argument("--list-body", action="store_true", help="store the snake as a plain list of cells")
+    args = parser.parse_args(argv)
+    families = [name.strip() for name in args.families.split(",") if name.strip()]
+    unknown = [name for name in families if name not in FAMILIES]
+    if unknown:
+        parser.error(f"unknown families: {', '.join(unknown)}")
+    args.families = families
+    return args
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    if hasattr(signal, "SIGALRM"):
+        signal.signal(signal.SIGALRM, _on_alarm)
+
+    failed = 0
+    games: dict[bool, Game] = {}
+    for family in args.families:
+        big = family == "big"
+        game = games.get(big)
+        if game is None:
+            game = games[big] = Game(board_size=BIG_STRESS_BOARD if big else None, run_body=not args.list_body)
+            # Keep stress runs out of the real run history.
+            if game.run_history is not None:
+                game.run_history.close()
+                game.run_history = None
+        for name, level in _family_levels(game, family):
+            _setup(game, level)
+            stress = StressRun(game, name, args)
+            if not stress.run():
+                failed += 1
+            print(stress.report(), flush=True)
+
+    pygame.quit()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+import tracemalloc
+import weakref
+from collections import deque
+from typing import Callable
+
+import pygame
+
+CHECKPOINT_HISTORY = 64
+TOP_GROWTH_LINES = 8
+# Growth reported through ``grew`` that triggers a budget check mid-level.
+GROWTH_CHECK_BYTES = 1024 * 1024
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Pixel memory of ``surface``; subsurfaces share their parent's pixels."""
+    if surface.get_parent() is not None:
+        return 0
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+def _surfaces(value):
+    """Yield every Surface in a cache value (nested dicts, lists and tuples)."""
+    if isinstance(value, pygame.Surface):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _surfaces(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _surfaces(item)
+
+
+class _Entry:
+    __slots__ = ("owner", "source", "evict", "anchor", "shared")
+
+    def __init__(self, owner, source, evict, anchor, shared):
+        self.owner = owner
+        self.source = source
+        self.evict = evict
+        self.anchor = anchor
+        self.shared = shared
+
+    def target(self):
+        """``(alive, args)`` for calling ``source``/``evict``."""
+        if self.anchor is None:
+            return True, ()
+        obj = self.anchor()
+        return obj is not None, (obj,)
+
+
+class SurfaceLedger:
+    """Bytes held by long-lived Surface caches, grouped by owner tag.
+
+    Caches register a ``source`` returning their current contents (any mix
+    of Surfaces, dicts, lists and tuples) and optionally an ``evict`` that
+    drops whatever can be rebuilt on demand. Per-instance caches pass an
+    ``anchor`` object, held weakly; ``source`` and ``evict`` then receive it
+    and the entry disappears with it. A surface held by several caches is
+    counted once, for the first non-``shared`` owner that holds it.
+
+    ``checkpoint`` is called at level boundaries: it records usage, evicts
+    the largest evictable caches while over ``budget_bytes`` and, when
+    ``tracemalloc`` is tracing, diffs a snapshot against the first
+    checkpoint so Python-side growth across levels shows up as well.
+    Caches that build surfaces during play report them through ``grew``,
+    which applies the budget again once ``GROWTH_CHECK_BYTES`` have piled
+    up since the last check.
+
+    The budget is soft: only evictable, unpinned caches are dropped, so
+    usage can stay above it (e.g. when a pinned layer alone is larger), and
+    growth below ``GROWTH_CHECK_BYTES`` waits for the next check. Pinning
+    (``pin``) keeps a cache that is in active use, such as the current
+    level's wall chunks, from being evicted and rebuilt on the next frame.
+    """
+
+    def __init__(self):
+        self.budget_bytes: int | None = None
+        self.evictions = 0
+        self.checkpoints: deque[dict] = deque(maxlen=CHECKPOINT_HISTORY)
+        self._entries: list[_Entry] = []
+        self._baseline: tracemalloc.Snapshot | None = None
+        self._growth: list[tracemalloc.StatisticDiff] = []
+        self._pinned: weakref.WeakSet = weakref.WeakSet()
+        self._grown_bytes = 0
+
+    def register(
+        self,
+        owner: str,
+        source: Callable,
+        evict: Callable | None = None,
+        *,
+        anchor: object | None = None,
+        shared: bool = False,
+    ):
+        entry = _Entry(owner, source, evict, None, shared)
+        if anchor is not None:
+            entry.anchor = weakref.ref(anchor, lambda _ref: self._drop(entry))
+        self._entries.append(entry)
+
+    def pin(self, anchor: object):
+        """Never evict the caches anchored to ``anchor`` until ``unpin``."""
+        self._pinned.add(anchor)
+
+    def unpin(self, anchor: object):
+        self._pinned.discard(anchor)
+
+    def _is_pinned(self, entry: _Entry) -> bool:
+        return entry.anchor is not None and entry.anchor() in self._pinned
+
+    def grew(self, nbytes: int):
+        """Note ``nbytes`` of new cache surfaces; applies the budget every ``GROWTH_CHECK_BYTES``."""
+        if self.budget_bytes is None:
+            return
+        self._grown_bytes += nbytes
+        if self._grown_bytes >= GROWTH_CHECK_BYTES:
+            self.enforce()
+
+    def _drop(self, entry: _Entry):
+        try:
+            self._entries.remove(entry)
+        except ValueError:
+            pass
+
+    def _live_entries(self) -> list[tuple[_Entry, tuple]]:
+        live = []
+        for entry in list(self._entries):
+            alive, args = entry.target()
+            if alive:
+                live.append((entry, args))
+        return live
+
+    def _measure(self) -> list[tuple[_Entry, tuple, int]]:
+        """Bytes attributed to each live entry, deduplicated by surface."""
+        live = self._live_entries()
+        seen: set[int] = set()
+        sizes = {}
+        # Specific owners claim shared surfaces before the generic caches do.
+        for shared_pass in (False, True):
+            for entry, args in live:
+                if entry.shared != shared_pass:
+                    continue
+                total = 0
+                for surface in _surfaces(entry.source(*args)):
+                    if id(surface) not in seen:
+                        seen.add(id(surface))
+                        total += surface_bytes(surface)
+                sizes[id(entry)] = total
+        return [(entry, args, sizes[id(entry)]) for entry, args in live]
+
+    def usage(self) -> dict[str, int]:
+        """Bytes per owner tag."""
+        totals: dict[str, int] = {}
+        for entry, _, size in self._measure():
+            totals[entry.owner] = totals.get(entry.owner, 0) + size
+        return totals
+
+    def total(self) -> int:
+        return sum(size for _, _, size in self._measure())
+
+    def enforce(self) -> int:
+        """Evict the largest evictable caches until under budget; returns bytes freed."""
+        if self.budget_bytes is None:
+            return 0
+        self._grown_bytes = 0
+        measured = self._measure()
+        start_total = total = sum(size for _, _, size in measured)
+        evicted: set[int] = set()
+        while total > self.budget_bytes:
+            candidates = [
+                (size, entry, args)
+                for entry, args, size in measured
+                if entry.evict is not None and size and id(entry) not in evicted and not self._is_pinned(entry)
+            ]
+            if not candidates:
+                break
+            _, entry, args = max(candidates, key=lambda item: item[0])
+            entry.evict(*args)
+            evicted.add(id(entry))
+            self.evictions += 1
+            # Re-measure: an evicted surface may still be held by another owner.
+            measured = self._measure()
+            total = sum(size for _, _, size in measured)
+        return max(0, start_total - total)
+
+    def checkpoint(self, label: str):
+        """Record usage at a level boundary and apply the budget."""
+        freed = self.enforce()
+        record = {"label": label, "usage": self.usage(), "freed": freed, "traced": None}
+        if tracemalloc.is_tracing():
+            # Leave out tracemalloc itself and the ledger's own history.
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+            )
+            record["traced"] = tracemalloc.get_traced_memory()[0]
+            if self._baseline is None:
+                self._baseline = snapshot
+            else:
+                growth = snapshot.compare_to(self._baseline, "lineno")
+                self._growth = [stat for stat in growth if stat.size_diff > 0][:TOP_GROWTH_LINES]
+        self.checkpoints.append(record)
+
+    def report(self) -> str:
+        usage = self.usage()
+        lines = [f"Surface caches: {sum(usage.values()) / 1024:.0f} KiB"]
+        if self.budget_bytes is not None:
+            lines[0] += f" (budget {self.budget_bytes / 1024:.0f} KiB, {self.evictions} evictions)"
+        for owner, size in sorted(usage.items(), key=lambda item: item[1], reverse=True):
+            lines.append(f"  {size / 1024:>9.0f} KiB  {owner}")
+        if self.checkpoints:
+            lines.append("")
+            lines.append(f"{'surfaces':>12}  {'python':>10}  checkpoint")
+            for record in self.checkpoints:
+                traced = record["traced"]
+                traced_text = f"{traced / 1024:>6.0f} KiB" if traced is not None else f"{'-':>10}"
+                lines.append(
+                    f"{sum(record['usage'].values()) / 1024:>8.0f} KiB  {traced_text}  {record['label']}"
+                )
+        if self._growth:
+            lines.append("")
+            lines.append("Python allocations grown since the first checkpoint:")
+            for stat in self._growth:
+                frame = stat.traceback[0]
+                lines.append(
+                    f"  {stat.size_diff / 1024:>+9.1f} KiB  {stat.count_diff:>+6}  {frame.filename}:{frame.lineno}"
+                )
+        return "\n".join(lines)
+
+
+SURFACE_LEDGER = SurfaceLedger()
@@ -0,0 +1,18 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+
+import game
+
+
+@pytest.fixture(scope="module")
+def game_files(tmp_path_factory):
+    """Point a module's games at a scratch run history and legacy leaderboard."""
+    directory = tmp_path_factory.mktemp("game_files")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(game, "RUN_HISTORY_PATH", directory / "run_history.sqlite3")
+        patch.setattr(game, "LEADERBOARD_PATH", directory / "leaderboard.json")
+        yield directory
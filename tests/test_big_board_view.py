@@ -0,0 +1,49 @@
+import pygame
+import pytest
+
+from camera import Camera
+from config import HUD_HEIGHT, TILE_SIZE
+from game import Game
+
+
+@pytest.fixture(scope="module")
+def game(game_files):
+    game = Game(board_size=(512, 512))
+    game.game_started = True
+    game.start_level()
+    yield game
+    if game.run_history is not None:
+        game.run_history.close()
+    pygame.quit()
+
+
+def _tile_pixels(game: Game, cell: tuple[int, int]) -> bytes:
+    scroll_x, scroll_y = game.camera.offset_px()
+    rect = pygame.Rect(cell[0] * TILE_SIZE + scroll_x, cell[1] * TILE_SIZE + scroll_y + HUD_HEIGHT, TILE_SIZE, TILE_SIZE)
+    return pygame.image.tobytes(game.screen.subsurface(rect), "RGB")
+
+
+def test_game_over_frame_follows_snake_on_big_board(game):
+    head = (500, 480)
+    game.snake.segments = [head, (head[0] - 1, head[1])]
+    game.snake.reset_interpolation()
+    game.game_over = True
+    game.draw_game_over()
+    assert Camera.contains(game.camera.visible_tiles(margin=0), head)
+    with_snake = _tile_pixels(game, head)
+
+    snake, game.snake = game.snake, None
+    try:
+        game.draw_game_over()
+        without_snake = _tile_pixels(game, head)
+    finally:
+        game.snake = snake
+        game.game_over = False
+    assert with_snake != without_snake
+
+
+def test_board_view_background_has_no_baked_grid(game):
+    # The scrolled grid overlay is the only grid in the camera view.
+    background = game.board_background
+    row = pygame.image.tobytes(background.subsurface((0, TILE_SIZE, background.get_width(), 1)), "RGB")
+    assert len({row[i:i + 3] for i in range(0, len(row), 3)}) == 1
@@ -0,0 +1,29 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+import config
+
+
+@pytest.fixture
+def asset_dir(tmp_path, monkeypatch):
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    monkeypatch.setattr(config, "ASSET_DIR", tmp_path)
+    monkeypatch.setattr(config, "_SCALED_IMAGE_CACHE", {})
+    yield tmp_path
+    pygame.display.quit()
+
+
+def test_paletted_png_is_smoothly_scaled(asset_dir):
+    paletted = pygame.Surface((4, 4), depth=8)
+    paletted.fill((200, 40, 90))
+    pygame.image.save(paletted, asset_dir / "paletted.png")
+
+    image = config.load_scaled_image("paletted.png", (8, 8))
+    assert image is not None
+    assert image.get_size() == (8, 8)
+    assert image.get_at((4, 4))[:3] == paletted.get_at((0, 0))[:3]
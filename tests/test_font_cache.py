@@ -0,0 +1,34 @@
+import os
+
+import config
+
+
+def test_cached_font_miss_expires_when_font_dirs_change(tmp_path, monkeypatch):
+    font_dir = tmp_path / "fonts"
+    font_dir.mkdir()
+    monkeypatch.setattr(config, "SYSTEM_FONT_DIRS", (font_dir,))
+    monkeypatch.setattr(config, "FONT_CACHE_FILE", tmp_path / ".font_cache.json")
+
+    config._write_font_path_cache({config.PIXEL_FONT_FAMILY: None})
+    assert config._read_font_path_cache() == {config.PIXEL_FONT_FAMILY: None}
+
+    # Installing a font touches its directory.
+    mtime = font_dir.stat().st_mtime + 10
+    os.utime(font_dir, (mtime, mtime))
+    assert config._read_font_path_cache() == {}
+
+
+def test_cached_font_miss_expires_when_a_nested_font_dir_changes(tmp_path, monkeypatch):
+    font_dir = tmp_path / "fonts"
+    package_dir = font_dir / "truetype" / "pixel-fonts"
+    package_dir.mkdir(parents=True)
+    monkeypatch.setattr(config, "SYSTEM_FONT_DIRS", (font_dir,))
+    monkeypatch.setattr(config, "FONT_CACHE_FILE", tmp_path / ".font_cache.json")
+
+    config._write_font_path_cache({config.PIXEL_FONT_FAMILY: None})
+    assert config._read_font_path_cache() == {config.PIXEL_FONT_FAMILY: None}
+
+    # A font added to an existing package directory only touches that directory.
+    mtime = package_dir.stat().st_mtime + 10
+    os.utime(package_dir, (mtime, mtime))
+    assert config._read_font_path_cache() == {}
@@ -0,0 +1,51 @@
+import pygame
+import pytest
+
+from config import GRID_HEIGHT
+from game import Game
+from input_pipeline import DirectionBuffer
+
+RIGHT, UP, LEFT = (1, 0), (0, -1), (-1, 0)
+
+
+def test_direction_buffer_keeps_second_turn_of_a_corner():
+    buffer = DirectionBuffer()
+    # "Up" was applied straight away; "left" waits behind it.
+    assert buffer.push(LEFT, 0.0, after=UP)
+    assert not buffer.push(RIGHT, 0.0, after=UP)
+    assert buffer.pop_valid(UP) == (LEFT, 0.0)
+    assert buffer.pop_valid(LEFT) is None
+
+
+@pytest.fixture(scope="module")
+def game(game_files):
+    game = Game()
+    game.game_started = True
+    game.start_level()
+    yield game
+    if game.run_history is not None:
+        game.run_history.close()
+    pygame.quit()
+
+
+def _two_turns_in_one_tick(game: Game) -> list[tuple[int, int]]:
+    game.queue_direction(UP)
+    game.queue_direction(LEFT)
+    heads = [game.snake.head]
+    for _ in range(2):
+        game.update_side_scroller(game.move_interval_ms)
+        heads.append(game.snake.head)
+    return heads
+
+
+@pytest.mark.parametrize("endless", [False, True], ids=["boss", "endless"])
+def test_side_scroller_takes_both_turns_of_a_corner(game, endless):
+    if endless:
+        game.start_endless()
+    else:
+        game.enter_side_scroller(GRID_HEIGHT // 2)
+    (x, y), up, left = _two_turns_in_one_tick(game)
+    assert not game.game_over
+    assert up == (x, y - 1)
+    assert left == (x - 1, y - 1)
+
@@ -0,0 +1,118 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from remote_leaderboard import RemoteLeaderboard
+
+
+class _ScoreHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        server.on_post()
+        status = server.statuses.pop(0) if server.statuses else 204
+        server.posts.append((status, self.headers["Idempotency-Key"], body))
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ScoreHandler)
+    server.posts = []
+    server.statuses = []
+    server.on_post = lambda: None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server, tmp_path, **kwargs) -> RemoteLeaderboard:
+    return RemoteLeaderboard(
+        f"http://127.0.0.1:{server.server_port}",
+        tmp_path / "spool.json",
+        rejected_path=tmp_path / "rejected.json",
+        **kwargs,
+    )
+
+
+def _delivered(server) -> list[str]:
+    return [entry["name"] for status, _, body in server.posts if status < 300 for entry in body["scores"]]
+
+
+def test_flush_waits_for_spooled_scores(server, tmp_path):
+    spool = tmp_path / "spool.json"
+    spool.write_text(json.dumps([{"name": "a", "score": 1}, {"name": "b", "score": 2}]), encoding="utf-8")
+
+    board = _client(server, tmp_path)
+    try:
+        assert board.flush(timeout=5.0)
+        assert _delivered(server) == ["a", "b"]
+        assert not spool.exists()
+    finally:
+        board.close()
+
+
+def test_flush_reports_scores_left_in_spool(tmp_path):
+    spool = tmp_path / "spool.json"
+    spool.write_text(json.dumps([{"name": "a", "score": 1}]), encoding="utf-8")
+
+    # Nothing listens on port 9; the spooled score stays unsent.
+    board = RemoteLeaderboard("http://127.0.0.1:9", spool, rejected_path=tmp_path / "rejected.json", timeout=0.2)
+    assert not board.flush(timeout=0.3)
+    board.close()
+    assert not board.flush(timeout=1.0)
+    assert json.loads(spool.read_text(encoding="utf-8"))[0]["name"] == "a"
+
+
+def test_rejected_batch_is_quarantined_and_later_scores_still_send(server, tmp_path):
+    server.statuses = [422]
+    board = _client(server, tmp_path)
+    try:
+        board.submit("bad", 1, 1, 0, "wall")
+        assert board.flush(timeout=5.0)
+        board.submit("good", 2, 1, 0, "wall")
+        assert board.flush(timeout=5.0)
+    finally:
+        board.close()
+    assert _delivered(server) == ["good"]
+    rejected = json.loads((tmp_path / "rejected.json").read_text(encoding="utf-8"))
+    assert [(entry["name"], entry["rejected_status"]) for entry in rejected] == [("bad", 422)]
+
+
+def test_server_errors_are_retried_with_the_same_ids(server, tmp_path):
+    server.statuses = [503, 429]
+    board = _client(server, tmp_path, backoff_base_s=0.01, backoff_max_s=0.02)
+    try:
+        board.submit("a", 1, 1, 0, "wall")
+        assert board.flush(timeout=5.0)
+    finally:
+        board.close()
+    assert [status for status, _, _ in server.posts] == [503, 429, 204]
+    keys = {key for _, key, _ in server.posts}
+    assert len(keys) == 1
+    assert {body["batch_id"] for _, _, body in server.posts} == keys
+    assert len({body["scores"][0]["id"] for _, _, body in server.posts}) == 1
+
+
+def test_scores_are_spooled_before_the_post(server, tmp_path):
+    spooled_during_post = []
+    server.on_post = lambda: spooled_during_post.append(json.loads((tmp_path / "spool.json").read_text()))
+    board = _client(server, tmp_path)
+    try:
+        board.submit("a", 1, 1, 0, "wall")
+        assert board.flush(timeout=5.0)
+    finally:
+        board.close()
+    assert [[entry["name"] for entry in spool] for spool in spooled_during_post] == [["a"]]
+    assert not (tmp_path / "spool.json").exists()
@@ -0,0 +1,122 @@
+import gc
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+import run_history
+from run_history import RunHistory, open_run_history
+
+
+def _open_connections() -> list[sqlite3.Connection]:
+    gc.collect()
+    connections = []
+    for obj in gc.get_objects():
+        if isinstance(obj, sqlite3.Connection):
+            try:
+                obj.total_changes
+            except sqlite3.ProgrammingError:
+                continue
+            connections.append(obj)
+    return connections
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = RunHistory(tmp_path / "runs.sqlite3")
+    yield history
+    history.close()
+
+
+class _Day:
+    """Stands in for ``datetime.date`` so runs can be recorded on chosen days."""
+
+    current = date(2026, 1, 1)
+
+    @classmethod
+    def today(cls) -> date:
+        return cls.current
+
+
+def _names(entries: list[dict]) -> list[str]:
+    return [entry["name"] for entry in entries]
+
+
+def test_open_on_worker_thread_leaves_no_connection(tmp_path):
+    before = len(_open_connections())
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        history = pool.submit(open_run_history, tmp_path / "runs.sqlite3").result()
+        # The worker is still alive, so a thread-local connection would show here.
+        assert len(_open_connections()) == before
+    assert history.top_runs() == []
+    history.close()
+
+
+def test_top_runs_overall_per_level_and_per_day(history, monkeypatch):
+    monkeypatch.setattr(run_history, "date", _Day)
+    _Day.current = date(2026, 1, 1)
+    history.record_run("ann", 30, 1, 1000, "wall")
+    history.record_run("bob", 50, 2, 2000, "self")
+    history.record_run("off", 90, 2, 2000, "self", on_leaderboard=False)
+    _Day.current = date(2026, 1, 2)
+    history.record_run("cat", 40, 1, 1500, "wall")
+    history.record_run("dan", 10, 2, 500, "boss")
+    history.flush()
+
+    assert _names(history.top_runs()) == ["bob", "cat", "ann", "dan"]
+    assert _names(history.top_runs(limit=2)) == ["bob", "cat"]
+    assert _names(history.top_runs(level=1)) == ["cat", "ann"]
+    assert _names(history.top_runs(day="2026-01-02")) == ["cat", "dan"]
+    assert _names(history.top_runs(level=2, day="2026-01-01")) == ["bob"]
+    top = history.top_runs(limit=1)[0]
+    assert top == {"name": "bob", "score": 50, "level": 2, "elapsed_ms": 2000, "cause": "self", "day": "2026-01-01"}
+
+
+def test_background_writer_records_runs_and_refreshes_the_cache(history):
+    assert history.top_runs() == []
+    for score in range(20):
+        history.record_run(f"p{score}", score, 1, 0, "wall")
+    assert history._writer is not None and history._writer.name == "run-history"
+    history.flush()
+    assert [entry["score"] for entry in history.top_runs(limit=3)] == [19, 18, 17]
+
+    history.close()
+    assert history._writer is None
+    # A closed history restarts its writer on the next run.
+    history.record_run("late", 99, 1, 0, "wall")
+    history.flush()
+    assert _names(history.top_runs(limit=1)) == ["late"]
+
+
+def test_legacy_leaderboard_is_imported_once(tmp_path):
+    legacy = tmp_path / "leaderboard.json"
+    legacy.write_text(json.dumps({"entries": [{"name": "old", "score": 70}, 20, {"name": "bad", "score": "x"}]}))
+    path = tmp_path / "runs.sqlite3"
+
+    for _ in range(2):
+        history = RunHistory(path, legacy)
+        entries = history.top_runs()
+        history.close()
+        assert [(entry["name"], entry["score"], entry["cause"]) for entry in entries] == [
+            ("old", 70, "imported"),
+            ("Anon", 20, "imported"),
+        ]
+
+
+def test_read_overlapping_a_write_is_not_cached(history, monkeypatch):
+    connection = history._connection()
+
+    def execute_then_write(sql, params):
+        rows = connection.execute(sql, params).fetchall()
+        # The writer commits after this read fetched its rows.
+        history.record_run("late", 99, 1, 0, "wall")
+        history.flush()
+        return SimpleNamespace(fetchall=lambda: rows)
+
+    monkeypatch.setattr(history, "_connection", lambda: SimpleNamespace(execute=execute_then_write))
+    assert history.top_runs() == []
+    monkeypatch.undo()
+    assert _names(history.top_runs()) == ["late"]
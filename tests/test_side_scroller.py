@@ -0,0 +1,26 @@
+import pygame
+import pytest
+
+from config import GRID_HEIGHT
+from game import Game
+
+
+@pytest.fixture
+def game(game_files):
+    game = Game()
+    game.game_started = True
+    game.start_level()
+    game.enter_side_scroller(GRID_HEIGHT // 2)
+    yield game
+    if game.run_history is not None:
+        game.run_history.close()
+    pygame.quit()
+
+
+def test_burst_of_ticks_cannot_pass_through_a_bullet(game):
+    head_x, head_y = game.snake.head
+    # A still bullet two cells ahead; eight moves in one frame leave it behind the tail.
+    game.boss_bullets = [{"x": head_x + 2.5, "y": head_y + 0.5, "vx": 0.0, "vy": 0.0}]
+    game.update_side_scroller(game.move_interval_ms * 8)
+    assert game.game_over
+    assert game.death_cause == "bullet"
@@ -0,0 +1,45 @@
+import pygame
+import pytest
+
+from body_runs import RunBody
+from snake import Snake
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.display.quit()
+
+
+def _zigzag(columns: int, height: int) -> list[tuple[int, int]]:
+    cells = []
+    for x in range(columns):
+        rows = range(height) if x % 2 == 0 else range(height - 1, -1, -1)
+        cells.extend((x, y) for y in rows)
+    cells.reverse()
+    return cells
+
+
+def test_snake_body_is_run_length_by_default():
+    assert isinstance(Snake().segments, RunBody)
+    assert isinstance(Snake(run_body=False).segments, list)
+
+
+def test_culling_a_long_snake_only_returns_cells_near_the_view():
+    cells = _zigzag(50, 200)
+    visible = (10, 20, 14, 30)
+    snakes = []
+    for run_body in (True, False):
+        snake = Snake(run_body=run_body)
+        snake.segments = cells
+        snake.move_head((cells[0][0], cells[0][1] + 1))
+        snakes.append(snake)
+    run_indices = snakes[0]._candidate_indices(visible)
+    list_indices = snakes[1]._candidate_indices(visible)
+
+    assert set(list_indices) <= set(run_indices)
+    # Each run crossing the view adds at most its tail-most cell.
+    assert len(run_indices) <= len(list_indices) + 2 * 50
+    assert len(run_indices) < len(cells) // 50
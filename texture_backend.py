@@ -0,0 +1,118 @@
+import weakref
+
+import pygame
+
+try:
+    from pygame._sdl2 import video
+except ImportError:
+    video = None
+
+
+class TextureBackend:
+    """Present frames through an SDL2 ``Renderer`` instead of the display surface.
+
+    ``frame`` is an offscreen Surface at the logical resolution; screens that
+    still draw with Surface calls are uploaded through one streaming texture.
+    Static surfaces (background, grid, wall chunks, sprites) passed to
+    ``copy`` are uploaded once and cached for as long as the surface lives, so
+    the textured playfield only issues renderer copies. Rotation and alpha are
+    applied by the renderer.
+    """
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        title: str = "",
+        *,
+        software: bool = False,
+        vsync: bool = False,
+        fullscreen: bool = False,
+    ):
+        if video is None:
+            raise RuntimeError("pygame._sdl2.video is not available")
+        self.size = size
+        self.window = video.Window(title, size=size, resizable=not fullscreen, fullscreen_desktop=fullscreen)
+        self.renderer = video.Renderer(self.window, accelerated=0 if software else -1, vsync=vsync)
+        # Scale the logical resolution to the window, like pygame.SCALED.
+        self.renderer.logical_size = size
+        # Surface.convert() needs a display format and the render window may
+        # not have a window surface, so a hidden 1x1 window provides it.
+        self._format_window = pygame.Window("", size=(1, 1), hidden=True)
+        self._format_window.get_surface()
+        self.frame = pygame.Surface(size)
+        self._frame_texture = video.Texture(self.renderer, size, streaming=True)
+        self._textures: weakref.WeakKeyDictionary[pygame.Surface, "video.Texture"] = weakref.WeakKeyDictionary()
+        self.uploads = 0
+
+    @classmethod
+    def create(cls, size: tuple[int, int], title: str = "", **kwargs) -> "TextureBackend | None":
+        """Build the backend, or ``None`` when SDL2 rendering is unavailable."""
+        try:
+            return cls(size, title, **kwargs)
+        except (RuntimeError, pygame.error):
+            return None
+
+    def texture(self, surface: pygame.Surface) -> "video.Texture":
+        """Texture for a static surface, uploaded on first use."""
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = video.Texture.from_surface(self.renderer, surface)
+            self._textures[surface] = texture
+            self.uploads += 1
+        return texture
+
+    def clear(self, color=(0, 0, 0)):
+        self.renderer.draw_color = color
+        self.renderer.clear()
+
+    def copy(
+        self,
+        surface: pygame.Surface,
+        dest: tuple[int, int],
+        area: pygame.Rect | None = None,
+        angle: float = 0.0,
+        alpha: int | None = None,
+    ):
+        """Draw ``surface`` like ``Surface.blit``; ``angle`` is counterclockwise degrees."""
+        texture = self.texture(surface)
+        width, height = area.size if area is not None else surface.get_size()
+        if alpha is not None:
+            texture.alpha = alpha
+        # pygame.transform.rotate turns counterclockwise, the renderer clockwise.
+        texture.draw(srcrect=area, dstrect=(dest[0], dest[1], width, height), angle=-angle)
+        if alpha is not None:
+            texture.alpha = 255
+
+    def copy_many(self, blits):
+        for surface, dest in blits:
+            self.copy(surface, dest)
+
+    def fill_rect(self, color, rect):
+        """Fill ``rect``; a 4-tuple color is alpha-blended."""
+        renderer = self.renderer
+        renderer.draw_blend_mode = 1 if len(color) == 4 else 0
+        renderer.draw_color = color
+        renderer.fill_rect(rect)
+        renderer.draw_blend_mode = 0
+
+    def copy_frame(self, rect: pygame.Rect | None = None):
+        """Upload ``frame`` (or just ``rect`` of it) and draw it at the same place."""
+        if rect is None:
+            self._frame_texture.update(self.frame)
+            self._frame_texture.draw()
+            return
+        self._frame_texture.update(self.frame.subsurface(rect), rect)
+        self._frame_texture.draw(srcrect=rect, dstrect=rect)
+
+    def present(self):
+        self.renderer.present()
+
+    def present_frame(self):
+        """Show a frame drawn entirely with Surface calls."""
+        self.clear()
+        self.copy_frame()
+        self.present()
+
+    def read_pixels(self) -> pygame.Surface:
+        """Current render target as a Surface (for tests and benchmarks)."""
+        return self.renderer.to_surface()
@@ -0,0 +1,161 @@
+import pygame
+from config import TILE_SIZE, COLOR_WALL
+from surface_ledger import SURFACE_LEDGER, surface_bytes
+
+WALL_CHUNK_TILES = 8
+
+_STAMP_CACHE: dict[int, tuple[pygame.Surface, pygame.Surface]] = {}
+SURFACE_LEDGER.register("wall stamps", lambda: _STAMP_CACHE, _STAMP_CACHE.clear)
+
+
+def wall_stamps(tile_size: int = TILE_SIZE) -> tuple[pygame.Surface, pygame.Surface]:
+    """Pre-rasterized ``(outline, solid)`` wall tiles for ``tile_size``."""
+    cached = _STAMP_CACHE.get(tile_size)
+    if cached is not None:
+        return cached
+    rect = pygame.Rect(0, 0, tile_size, tile_size)
+    outline = pygame.Surface(rect.size, pygame.SRCALPHA)
+    pygame.draw.rect(outline, COLOR_WALL, rect, width=2, border_radius=4)
+    solid = pygame.Surface(rect.size, pygame.SRCALPHA)
+    pygame.draw.rect(solid, COLOR_WALL, rect)
+    _STAMP_CACHE[tile_size] = (outline, solid)
+    return outline, solid
+
+
+def stamp_tiles(
+    surface: pygame.Surface,
+    tiles,
+    offset: tuple[int, int] = (0, 0),
+    breakable: set[tuple[int, int]] | None = None,
+):
+    """Blit a wall stamp for every ``(x, y)`` tile in one ``Surface.blits`` call."""
+    outline, solid = wall_stamps()
+    offset_x, offset_y = offset
+    blits = [
+        (
+            solid if breakable and tile in breakable else outline,
+            (tile[0] * TILE_SIZE + offset_x, tile[1] * TILE_SIZE + offset_y),
+        )
+        for tile in tiles
+    ]
+    if blits:
+        surface.blits(blits, doreturn=False)
+
+
+class WallChunkLayer:
+    """Wall tiles rendered into fixed-size chunk surfaces.
+
+    Each chunk covers ``chunk_tiles`` x ``chunk_tiles`` grid cells and is
+    rasterized once; ``invalidate`` re-renders only the chunk holding a
+    changed cell (e.g. a shot breakable wall). Chunks without walls have no
+    surface, and with ``bounds`` only chunks in view are drawn or rebuilt.
+    """
+
+    def __init__(self, chunk_tiles: int = WALL_CHUNK_TILES):
+        self.chunk_tiles = chunk_tiles
+        self.chunk_px = chunk_tiles * TILE_SIZE
+        self._surfaces: dict[tuple[int, int], pygame.Surface | None] = {}
+        self._occupied: set[tuple[int, int]] | None = None
+        self._dirty: set[tuple[int, int]] = set()
+        SURFACE_LEDGER.register("wall chunks", lambda layer: layer._surfaces, WallChunkLayer.reset, anchor=self)
+
+    def reset(self):
+        """Forget every chunk; call after the wall set is rebuilt or cleared."""
+        self._surfaces.clear()
+        self._occupied = None
+        self._dirty.clear()
+
+    def invalidate(self, pos: tuple[int, int]):
+        """Mark the chunk containing ``pos`` for re-rendering."""
+        chunk = (pos[0] // self.chunk_tiles, pos[1] // self.chunk_tiles)
+        self._dirty.add(chunk)
+
+    def _index(self, walls: set[tuple[int, int]]) -> set[tuple[int, int]]:
+        if self._occupied is None:
+            size = self.chunk_tiles
+            self._occupied = {(x // size, y // size) for x, y in walls}
+        return self._occupied
+
+    def _render_chunk(
+        self,
+        chunk: tuple[int, int],
+        walls: set[tuple[int, int]],
+        breakable: set[tuple[int, int]],
+    ) -> pygame.Surface | None:
+        size = self.chunk_tiles
+        base_x = chunk[0] * size
+        base_y = chunk[1] * size
+        tiles = [
+            (x, y)
+            for y in range(base_y, base_y + size)
+            for x in range(base_x, base_x + size)
+            if (x, y) in walls
+        ]
+        if not tiles:
+            return None
+        surface = pygame.Surface((self.chunk_px, self.chunk_px), pygame.SRCALPHA)
+        stamp_tiles(surface, tiles, (-base_x * TILE_SIZE, -base_y * TILE_SIZE), breakable)
+        SURFACE_LEDGER.grew(surface_bytes(surface))
+        return surface
+
+    def _chunks(self, walls: set[tuple[int, int]], bounds: tuple[int, int, int, int] | None):
+        occupied = self._index(walls)
+        if bounds is None:
+            return occupied
+        size = self.chunk_tiles
+        x0, y0, x1, y1 = bounds
+        return [
+            (cx, cy)
+            for cy in range(y0 // size, (y1 - 1) // size + 1)
+            for cx in range(x0 // size, (x1 - 1) // size + 1)
+            if (cx, cy) in occupied
+        ]
+
+    def prerender(
+        self,
+        walls: set[tuple[int, int]],
+        breakable: set[tuple[int, int]],
+        bounds: tuple[int, int, int, int] | None = None,
+    ):
+        """Render stale chunks ahead of the first draw, yielding each new surface."""
+        if not walls:
+            return
+        for chunk in self._chunks(walls, bounds):
+            if chunk in self._dirty or chunk not in self._surfaces:
+                self._surfaces[chunk] = self._render_chunk(chunk, walls, breakable)
+                self._dirty.discard(chunk)
+                yield self._surfaces[chunk]
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        walls: set[tuple[int, int]],
+        breakable: set[tuple[int, int]],
+        offset: tuple[int, int],
+        bounds: tuple[int, int, int, int] | None = None,
+    ):
+        """Blit wall chunks at ``offset``; ``bounds`` limits work to visible tiles."""
+        blits = self.visible_blits(walls, breakable, offset, bounds)
+        if blits:
+            surface.blits(blits, doreturn=False)
+
+    def visible_blits(
+        self,
+        walls: set[tuple[int, int]],
+        breakable: set[tuple[int, int]],
+        offset: tuple[int, int],
+        bounds: tuple[int, int, int, int] | None = None,
+    ) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """``(chunk surface, dest)`` pairs to draw, rendering stale chunks first."""
+        if not walls:
+            return []
+        offset_x, offset_y = offset
+        blits = []
+        for chunk in self._chunks(walls, bounds):
+            if chunk in self._dirty or chunk not in self._surfaces:
+                self._surfaces[chunk] = self._render_chunk(chunk, walls, breakable)
+                self._dirty.discard(chunk)
+            image = self._surfaces[chunk]
+            if image is not None:
+                blits.append((image, (chunk[0] * self.chunk_px + offset_x, chunk[1] * self.chunk_px + offset_y)))
+        return blits